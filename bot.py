@@ -17,7 +17,7 @@ import os
 import json
 import uuid
 import random
-from datetime import datetime, timezone
+import signal
 import asyncio
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -32,6 +32,12 @@ from dateutil import parser
 # 📦 Modules internes
 # ────────────────────────────────────────────────────────────────────────────────
 from utils.supabase_client import supabase
+from utils.instance_lease import InstanceLease
+from utils.http_session import close_session
+from utils.word_pool import word_pool
+from utils.jardin_store import garden_store
+from utils.persistent_views import setup_persistent_views
+from utils.message_router import message_router
 from utils.discord_utils import safe_send  # ✅ Utilitaires anti-429
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -64,6 +70,14 @@ bot = commands.Bot(command_prefix=get_prefix, intents=intents, help_command=None
 bot.is_main_instance = False
 bot.INSTANCE_ID = INSTANCE_ID
 bot.supabase = supabase
+bot.lease = InstanceLease(INSTANCE_ID)
+setup_persistent_views(bot)  # Boutons à état dans le custom_id (aucune View gardée en mémoire)
+
+# L’instance en attente reste connectée à Discord : seule l’instance maître répond aux commandes slash
+async def leader_only(interaction: discord.Interaction) -> bool:
+    return bot.lease.is_leader()
+
+bot.tree.interaction_check = leader_only
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔌 Chargement dynamique des commandes depuis /commands/*
@@ -95,19 +109,27 @@ async def load_tasks():
                 print(f"❌ Failed to load task {path}: {e}")
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 🔁 Tâche de vérification continue du verrou
+# 🔁 Perte du verrou : une autre instance a pris le relais
 # ────────────────────────────────────────────────────────────────────────────────
-async def verify_lock_loop():
-    while True:
-        await asyncio.sleep(10)
-        try:
-            lock = supabase.table("bot_lock").select("instance_id").eq("id", "bot_lock").execute()
-            if lock.data and lock.data[0]["instance_id"] != INSTANCE_ID:
-                print("🔴 Cette instance n'est plus maître. Déconnexion...")
-                await bot.close()
-                os._exit(0)
-        except Exception as e:
-            print(f"⚠️ Erreur dans la vérification du verrou (ignorée) : {e}")
+async def on_lease_lost():
+    print("🔴 Cette instance n'est plus maître. Déconnexion...")
+    bot.is_main_instance = False
+    await bot.close()
+    os._exit(0)
+
+def become_main_instance():
+    """Passe en instance maître et prévient les cogs (événement on_lease_acquired)."""
+    if bot.is_main_instance:
+        return
+    bot.is_main_instance = True
+    bot.dispatch("lease_acquired")
+
+async def take_over_when_free():
+    """Instance en attente : prend le verrou dès qu’il est libéré ou expiré."""
+    token = await bot.lease.wait_acquire()
+    print(f"🔐 Verrou repris par cette instance : {INSTANCE_ID} (jeton {token})")
+    become_main_instance()
+    await bot.lease.keep_alive(on_lease_lost)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔔 On Ready : présence + verrouillage + surveillance
@@ -118,36 +140,38 @@ async def on_ready():
     await bot.change_presence(activity=discord.Activity(type=discord.ActivityType.watching, name="Bleach"))
 
     try:
-        now = datetime.now(timezone.utc).isoformat()
-        supabase.table("bot_lock").upsert({
-            "id": "bot_lock",
-            "instance_id": INSTANCE_ID,
-            "updated_at": now
-        }).execute()
-
-        print(f"🔐 Verrou mis à jour pour cette instance : {INSTANCE_ID}")
-        bot.is_main_instance = True
-        bot.loop.create_task(verify_lock_loop())
+        if not bot.lease.enabled:
+            raise RuntimeError("client Supabase indisponible")
+        # on_ready peut être rappelé après une reconnexion : on ne reprend pas le verrou
+        if bot.lease.waiting:
+            return
+        if bot.lease.token is None:
+            token = await bot.lease.acquire()
+            if token is None:
+                print("⏳ Une autre instance détient le verrou : attente de sa libération...")
+                bot.is_main_instance = False
+                bot.loop.create_task(take_over_when_free())
+                return
+            print(f"🔐 Verrou mis à jour pour cette instance : {INSTANCE_ID} (jeton {token})")
+            bot.loop.create_task(bot.lease.keep_alive(on_lease_lost))
+        become_main_instance()
     except Exception as e:
         print(f"⚠️ Impossible de se connecter à Supabase : {e}")
         print("🔓 Aucune gestion de verrou — le bot démarre quand même.")
-        bot.is_main_instance = True
+        bot.lease.enabled = False
+        become_main_instance()
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 📩 Message reçu : réagir aux mots-clés et lancer les commandes
+# 📩 Message reçu : mention, jeux du salon (routeur), puis commandes
 # ────────────────────────────────────────────────────────────────────────────────
 @bot.event
 async def on_message(message):
     if message.author.bot:
         return
 
-    try:
-        lock = supabase.table("bot_lock").select("instance_id").eq("id", "bot_lock").execute()
-        if lock.data and isinstance(lock.data, list):
-            if lock.data and lock.data[0].get("instance_id") != INSTANCE_ID:
-                return
-    except Exception as e:
-        print(f"⚠️ Erreur lors de la vérification du lock (ignorée) : {e}")
+    # Vérification du bail en mémoire : aucune requête Supabase par message
+    if not bot.lease.is_leader():
+        return
 
     if message.content.strip() in [f"<@!{bot.user.id}>", f"<@{bot.user.id}>"]:
         prefix = get_prefix(bot, message)
@@ -170,7 +194,11 @@ async def on_message(message):
         await safe_send(message.channel, embed=embed)
         return
 
-    await bot.process_commands(message)
+    # Jeux en cours dans ce salon (propositions, réponses attendues)
+    await message_router.dispatch(message)
+
+    if message.content.startswith(COMMAND_PREFIX):
+        await bot.process_commands(message)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # ❗ Gestion des erreurs de commandes
@@ -198,7 +226,17 @@ if __name__ == "__main__":
     async def start():
         await load_commands()
         await load_tasks()
-        await bot.start(TOKEN)
+        word_pool.warmup()  # Réserve de mots des jeux préchargée en tâche de fond
+        # Render arrête le process avec SIGTERM : on ferme proprement pour passer par le finally
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, lambda: asyncio.create_task(bot.close())
+        )
+        try:
+            await bot.start(TOKEN)
+        finally:
+            await garden_store.flush_all()  # Jardins modifiés pas encore sauvegardés
+            await bot.lease.release()       # La relève n’attend pas l’expiration du bail
+            await close_session()
 
     asyncio.run(start())
 
@@ -12,6 +12,7 @@
 import discord
 from discord.ext import commands
 from utils.discord_utils import safe_send  # Fonctions safe pour envoyer messages sans risquer erreurs Discord
+from utils.supabase_repo import get_setting, set_setting  # Accès non bloquant à bot_settings
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -20,10 +21,9 @@ class HeartbeatAdmin(commands.Cog):
     """
     Commande !heartbeat — Gère le heartbeat automatique (pause, relance, statut, salon)
     """
-    # Initialisation du cog avec accès au bot et à Supabase
+    # Initialisation du cog avec accès au bot
     def __init__(self, bot: commands.Bot):
         self.bot = bot  # Stocke la référence du bot
-        self.supabase = bot.supabase  # Accès à Supabase pour stocker et lire les settings
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande PREFIX
@@ -51,21 +51,21 @@ class HeartbeatAdmin(commands.Cog):
         # Pause le heartbeat
         if action in ["pause", "p"]:
             # Met à jour Supabase pour indiquer que le heartbeat est en pause
-            self.supabase.table("bot_settings").upsert({"key": "heartbeat_paused", "value": "true"}).execute()
+            await set_setting("heartbeat_paused", "true")
             await safe_send(ctx, "⏸️ Heartbeat mis en pause.")
 
         # Relance le heartbeat
         elif action in ["resume", "r"]:
             # Met à jour Supabase pour indiquer que le heartbeat est actif
-            self.supabase.table("bot_settings").upsert({"key": "heartbeat_paused", "value": "false"}).execute()
+            await set_setting("heartbeat_paused", "false")
             await safe_send(ctx, "▶️ Heartbeat relancé.")
 
         # ───────────── Status ─────────────
         elif action in ["status", "stat", "s"]:
             # Récupère le statut actuel du heartbeat depuis Supabase
-            res = self.supabase.table("bot_settings").select("value").eq("key", "heartbeat_paused").execute()
+            value = await get_setting("heartbeat_paused")
             # Vérifie si le heartbeat est en pause
-            paused = res.data and res.data[0]["value"].lower() == "true"
+            paused = value is not None and value.lower() == "true"
             # Prépare le message en fonction du statut
             status_msg = "🔴 Le heartbeat est **en pause**." if paused else "🟢 Le heartbeat est **actif**."
             await safe_send(ctx, status_msg)
@@ -77,7 +77,7 @@ class HeartbeatAdmin(commands.Cog):
                 await safe_send(ctx, "❌ Tu dois mentionner un salon. Exemple : `!heartbeat set #général`")
                 return
             # Met à jour Supabase avec l'ID du salon
-            self.supabase.table("bot_settings").upsert({"key": "heartbeat_channel_id", "value": str(channel.id)}).execute()
+            await set_setting("heartbeat_channel_id", str(channel.id))
             # Si le cog HeartbeatTask est chargé, met à jour son salon directement
             heartbeat_cog = self.bot.get_cog("HeartbeatTask")
             if heartbeat_cog:
@@ -86,7 +86,7 @@ class HeartbeatAdmin(commands.Cog):
 
         elif action == "unset":
             # Supprime l'ID du salon dans Supabase
-            self.supabase.table("bot_settings").upsert({"key": "heartbeat_channel_id", "value": ""}).execute()
+            await set_setting("heartbeat_channel_id", "")
             # Si le cog HeartbeatTask est chargé, supprime la référence du salon
             heartbeat_cog = self.bot.get_cog("HeartbeatTask")
             if heartbeat_cog:
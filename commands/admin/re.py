@@ -13,7 +13,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from utils.discord_utils import safe_send, safe_respond
-import aiohttp
+from utils.http_session import get_session
 import os
 import asyncio
 
@@ -78,13 +78,12 @@ class RedemarrageCommand(commands.Cog):
                 await safe_send(channel, "⚠️ Webhook Render non configuré.")
                 return
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.render_webhook) as resp:
-                    if resp.status in (200, 201):
-                        await safe_send(channel, "✅ Redeploy demandé avec succès sur Render !")
-                    else:
-                        await safe_send(channel, f"❌ Échec du redeploy. Code HTTP : {resp.status}")
-                        return
+            async with get_session().post(self.render_webhook) as resp:
+                if resp.status in (200, 201):
+                    await safe_send(channel, "✅ Redeploy demandé avec succès sur Render !")
+                else:
+                    await safe_send(channel, f"❌ Échec du redeploy. Code HTTP : {resp.status}")
+                    return
 
             # ⚠️ Impossible de vérifier la fin du redeploy depuis le bot lui-même
             await safe_send(channel, "🔔 Le bot va redémarrer et sera bientôt de retour !")
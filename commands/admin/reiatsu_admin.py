@@ -17,7 +17,12 @@ from discord.ext import commands
 from discord import ui
 import json
 import os
-from utils.supabase_client import supabase
+from utils.supabase_repo import (
+    insert_reiatsu,
+    get_reiatsu_config, insert_reiatsu_config, update_reiatsu_config, delete_reiatsu_config
+)
+from utils.reiatsu_utils import get_profile, update_profile
+from utils.leaderboard import reiatsu_leaderboard
 from utils.discord_utils import safe_send, safe_reply, safe_edit, safe_delete, safe_interact
 
 # ──────────────────────────────────────────────────────────────
@@ -79,26 +84,24 @@ class ReiatsuAdmin(commands.Cog):
             now_iso = datetime.utcnow().isoformat()
             delay = random.randint(*SPAWN_SPEED_RANGES[DEFAULT_SPAWN_SPEED])
             default_speed = DEFAULT_SPAWN_SPEED
-            data = supabase.table("reiatsu_config").select("*").eq("guild_id", guild_id).execute()
-            if data.data:
-                supabase.table("reiatsu_config").update({
-                    "channel_id": channel_id,
-                    "last_spawn_at": now_iso,
-                    "spawn_delay": delay,
-                    "spawn_speed": default_speed,
-                    "is_spawn": False,
-                    "message_id": None
-                }).eq("guild_id", guild_id).execute()
+            new_conf = {
+                "guild_id": guild_id,
+                "channel_id": channel_id,
+                "last_spawn_at": now_iso,
+                "spawn_delay": delay,
+                "spawn_speed": default_speed,
+                "is_spawn": False,
+                "message_id": None
+            }
+            data = await get_reiatsu_config(guild_id)
+            if data:
+                await update_reiatsu_config(guild_id, {k: v for k, v in new_conf.items() if k != "guild_id"})
             else:
-                supabase.table("reiatsu_config").insert({
-                    "guild_id": guild_id,
-                    "channel_id": channel_id,
-                    "last_spawn_at": now_iso,
-                    "spawn_delay": delay,
-                    "spawn_speed": default_speed,
-                    "is_spawn": False,
-                    "message_id": None
-                }).execute()
+                await insert_reiatsu_config(new_conf)
+
+            spawner = self.bot.get_cog("ReiatsuSpawner")
+            if spawner:
+                spawner.schedule_guild(new_conf)
             await safe_send(ctx, f"✅ Le salon {ctx.channel.mention} est désormais configuré pour le spawn de Reiatsu avec vitesse par défaut **{default_speed}**.")
         except Exception as e:
             await safe_send(ctx, f"❌ Une erreur est survenue lors de la configuration : `{e}`")
@@ -111,9 +114,12 @@ class ReiatsuAdmin(commands.Cog):
     async def unset_reiatsu(self, ctx: commands.Context):
         try:
             guild_id = str(ctx.guild.id)
-            res = supabase.table("reiatsu_config").select("*").eq("guild_id", guild_id).execute()
-            if res.data:
-                supabase.table("reiatsu_config").delete().eq("guild_id", guild_id).execute()
+            res = await get_reiatsu_config(guild_id)
+            if res:
+                await delete_reiatsu_config(guild_id)
+                spawner = self.bot.get_cog("ReiatsuSpawner")
+                if spawner:
+                    spawner.forget_guild(int(guild_id))
                 await safe_send(ctx, "🗑️ Le salon Reiatsu a été **supprimé** de la configuration.")
             else:
                 await safe_send(ctx, "❌ Aucun salon Reiatsu n’était configuré sur ce serveur.")
@@ -132,16 +138,17 @@ class ReiatsuAdmin(commands.Cog):
         user_id = str(member.id)
         username = member.display_name
         try:
-            data = supabase.table("reiatsu").select("user_id").eq("user_id", user_id).execute()
-            if data.data:
-                supabase.table("reiatsu").update({"points": points}).eq("user_id", user_id).execute()
+            data = await get_profile(user_id)
+            if data:
+                await update_profile(user_id, {"points": points})
                 status = "🔄 Score mis à jour"
             else:
-                supabase.table("reiatsu").insert({
+                await insert_reiatsu({
                     "user_id": user_id,
                     "username": username,
                     "points": points
-                }).execute()
+                })
+                reiatsu_leaderboard.set(member.id, points, username)
                 status = "🆕 Nouveau score enregistré"
             embed = discord.Embed(
                 title="🌟 Mise à jour du Reiatsu",
@@ -200,12 +207,11 @@ class ReiatsuAdmin(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def speed_reiatsu(self, ctx: commands.Context):
         guild_id = str(ctx.guild.id)
-        res = supabase.table("reiatsu_config").select("*").eq("guild_id", guild_id).execute()
-        if not res.data:
+        config = await get_reiatsu_config(guild_id)
+        if not config:
             await safe_send(ctx, "❌ Aucun salon Reiatsu configuré pour ce serveur.")
             return
 
-        config = res.data[0]
         current_delay = config.get("spawn_delay", SPAWN_SPEED_RANGES[DEFAULT_SPAWN_SPEED][1])
         current_speed_name = DEFAULT_SPAWN_SPEED
         for name, (min_delay, max_delay) in SPAWN_SPEED_RANGES.items():
@@ -236,10 +242,14 @@ class ReiatsuAdmin(commands.Cog):
                     new_speed_name = self.custom_id.split("_", 1)[1]
                     min_delay, max_delay = SPAWN_SPEED_RANGES[new_speed_name]
                     new_delay = random.randint(min_delay, max_delay)
-                    supabase.table("reiatsu_config").update({
+                    await update_reiatsu_config(guild_id, {
                         "spawn_delay": new_delay,
                         "spawn_speed": new_speed_name
-                    }).eq("guild_id", guild_id).execute()
+                    })
+                    spawner = interaction.client.get_cog("ReiatsuSpawner")
+                    fresh_conf = await get_reiatsu_config(guild_id) if spawner else None
+                    if fresh_conf:
+                        spawner.schedule_guild(fresh_conf)
 
                     await safe_interact(
                         interaction,
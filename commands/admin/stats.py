@@ -15,7 +15,8 @@ from discord.ext import commands
 import psutil
 import platform
 import datetime
-from utils.discord_utils import safe_send, safe_respond  # ✅ Sécurisé
+from utils.discord_utils import safe_send, safe_respond, rate_limiter  # ✅ Sécurisé
+from utils.session_manager import session_manager
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -69,6 +70,25 @@ class Stats(commands.Cog):
             inline=False
         )
 
+        rl = rate_limiter.stats()
+        embed.add_field(
+            name="🚦 API Discord",
+            value=f"Appels: `{rl['calls']}`\n"
+                  f"Mis en file: `{rl['queued']}` ({rl['wait_total']}s d’attente)\n"
+                  f"429 reçus: `{rl['throttled']}`\n"
+                  f"Buckets bloqués: `{rl['blocked_buckets']}`",
+            inline=False
+        )
+
+        sessions = session_manager.stats()
+        by_kind = ", ".join(f"{k} {n}" for k, n in sorted(sessions["by_kind"].items())) or "—"
+        embed.add_field(
+            name="🎮 Parties",
+            value=f"En cours: `{sessions['live']}` ({by_kind})\n"
+                  f"Lancées: `{sessions['opened']}` | Expirées: `{sessions['expired']}` | Refusées: `{sessions['refused']}`",
+            inline=False
+        )
+
         embed.set_footer(text="Kisuke Urahara — Admin Only")
         return embed
 
@@ -135,7 +135,7 @@ class TestKawashima(commands.Cog):
         game_msg = await send(embed=embed)
 
         try:
-            success = await game_func(game_msg, embed, lambda: user.id, self.bot)
+            success = await game_func(game_msg, embed, lambda: user.id)
             result_text = "✅ Bien joué !" if success else "❌ Raté !"
             color = discord.Color.green() if success else discord.Color.red()
         except Exception as e:
@@ -12,21 +12,15 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json, random, os
+import random
 from utils.discord_utils import safe_send, safe_respond
+from utils.game_data import game_data
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement des données JSON
 # ────────────────────────────────────────────────────────────────────────────────
-DATA_JSON_PATH = os.path.join("data", "bleach_emojis.json")
-
 def load_characters():
-    try:
-        with open(DATA_JSON_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[ERREUR JSON bmoji] {e}")
-        return []
+    return game_data.get("bleach_emojis", ())
 
 # ────────────────────────────────────────────────────────────────────────────────
 # ⚔️ Fonction commune
@@ -12,12 +12,13 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
 import os
 import asyncio
 import random
 from collections import Counter
 from utils.discord_utils import safe_send, safe_edit, safe_respond
+from utils.game_data import game_data
+from utils.asset_store import asset_store
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement des données JSON
@@ -25,12 +26,7 @@ from utils.discord_utils import safe_send, safe_edit, safe_respond
 DATA_JSON_PATH = os.path.join("data", "divisions_quiz.json")
 
 def load_division_data():
-    try:
-        with open(DATA_JSON_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[ERREUR JSON] Impossible de charger {DATA_JSON_PATH} : {e}")
-        return {}
+    return game_data.get("divisions_quiz", {})
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Vue interactive pour les questions (A/B/C/D)
@@ -132,9 +128,11 @@ class Division(commands.Cog):
             description=f"Tu serais dans la **{best_division}** !\n\n{div_info['description']}",
             color=discord.Color.green()
         )
-        embed_result.set_image(url=f"attachment://{os.path.basename(div_info['image'])}")
+        file = None
+        if os.path.exists(div_info["image"]):
+            file = asset_store.set_image(embed_result, div_info["image"])
 
-        await safe_edit(message, embed=embed_result, view=None)
+        await safe_edit(message, embed=embed_result, view=None, attachments=[file] if file else [])
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande SLASH
@@ -13,23 +13,16 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
-import json
-import os
 import random
 from utils.discord_utils import safe_send, safe_edit
+from utils.game_data import game_data
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement des données JSON
 # ────────────────────────────────────────────────────────────────────────────────
-DATA_JSON_PATH = os.path.join("data", "kido.json")
 def load_data():
-    """Charge le fichier JSON contenant les Kido."""
-    try:
-        with open(DATA_JSON_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[ERREUR JSON] Impossible de charger {DATA_JSON_PATH} : {e}")
-        return {}
+    """Kido depuis le registre des données de jeu (lecture seule)."""
+    return game_data.get("kido", {})
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ Pagination
@@ -73,7 +66,6 @@ class Kido(commands.Cog):
     """
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.data = load_data()
         # Abréviations
         self.alias = {
             "h": "hado",
@@ -89,6 +81,11 @@ class Kido(commands.Cog):
             "other": discord.Color.purple()
         }
 
+    @property
+    def data(self):
+        # Lu à chaque accès dans le registre (suit le rechargement à chaud)
+        return load_data()
+
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Fonction interne pour afficher un Kido
     # ────────────────────────────────────────────────────────────────────────────
@@ -173,7 +170,7 @@ class Kido(commands.Cog):
             color=self.colors.get(kido_type, discord.Color.teal())
         )
         for field_name, field_value in infos.items():
-            value = "\n".join(f"• {item}" for item in field_value) if isinstance(field_value, list) else str(field_value)
+            value = "\n".join(f"• {item}" for item in field_value) if isinstance(field_value, (list, tuple)) else str(field_value)
             embed.add_field(name=field_name.capitalize(), value=value, inline=False)
         await safe_send(channel, embed=embed)
 
@@ -13,26 +13,39 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View
-import json
 import os
 import random
 
 from utils.discord_utils import safe_send, safe_edit, safe_respond
+from utils.game_data import game_data
+from utils.asset_store import asset_store
 
 # ────────────────────────────────────────────────────────────────
 # 📂 Chargement des données JSON
 # ────────────────────────────────────────────────────────────────
-KO_DATA_PATH = os.path.join("data", "ko.json")
 KO_IMAGE_DIR = os.path.join("data", "images", "kluboutside")
+KO_IMAGE_EXTENSIONS = ("png", "jpg", "jpeg", "webp")
+_ko_images = None   # {numéro: chemin}, lu une seule fois
 
 def load_data():
-    """Charge le fichier JSON contenant les questions Klub Outside."""
-    try:
-        with open(KO_DATA_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[ERREUR JSON] Impossible de charger {KO_DATA_PATH} : {e}")
-        return {}
+    """Questions Klub Outside depuis le registre des données de jeu (lecture seule)."""
+    return game_data.get("ko", {})
+
+def find_image_file(key):
+    """Image de la question `key` (koN.png/jpg/...), ou None."""
+    global _ko_images
+    if _ko_images is None:
+        _ko_images = {}
+        try:
+            names = sorted(os.listdir(KO_IMAGE_DIR))
+        except OSError:
+            names = []
+        for ext in reversed(KO_IMAGE_EXTENSIONS):   # png prioritaire si plusieurs
+            for name in names:
+                stem, _, suffix = name.rpartition(".")
+                if suffix.lower() == ext and stem.startswith("ko"):
+                    _ko_images[stem[2:]] = os.path.join(KO_IMAGE_DIR, name)
+    return _ko_images.get(str(key))
 
 # ────────────────────────────────────────────────────────────────
 # 🎛️ UI — Pagination interactive
@@ -58,20 +71,10 @@ class KlubPaginator(View):
         embed.add_field(name="💬 Réponse", value=question.get("réponse", "?"), inline=False)
         embed.set_footer(text=f"{self.index+1} / {len(self.keys)}")
 
-        image_path = self._find_image_file(key)
-        if image_path:
-            file = discord.File(image_path, filename=os.path.basename(image_path))
-            embed.set_image(url=f"attachment://{os.path.basename(image_path)}")
-            await interaction.response.edit_message(embed=embed, view=self, attachments=[file])
-        else:
-            await interaction.response.edit_message(embed=embed, view=self, attachments=[])
-
-    def _find_image_file(self, key):
-        for ext in ["png", "jpg", "jpeg", "webp"]:
-            path = os.path.join(KO_IMAGE_DIR, f"ko{key}.{ext}")
-            if os.path.exists(path):
-                return path
-        return None
+        # URL du salon d’assets si possible : aucun fichier renvoyé au changement de page
+        image_path = find_image_file(key)
+        file = asset_store.set_image(embed, image_path) if image_path else None
+        await interaction.response.edit_message(embed=embed, view=self, attachments=[file] if file else [])
 
     @discord.ui.button(label="◀️", style=discord.ButtonStyle.secondary)
     async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -149,10 +152,9 @@ class KlubOutside(commands.Cog):
         embed.add_field(name="💬 Réponse", value=question.get("réponse", "?"), inline=False)
         embed.set_footer(text=f"{start_index+1} / {len(view.keys)}")
 
-        image_path = view._find_image_file(key)
-        if image_path:
-            embed.set_image(url=f"attachment://{os.path.basename(image_path)}")
-            file = discord.File(image_path, filename=os.path.basename(image_path))
+        image_path = find_image_file(key)
+        file = asset_store.set_image(embed, image_path) if image_path else None
+        if file:
             await safe_send(channel, embed=embed, view=view, file=file)
         else:
             await safe_send(channel, embed=embed, view=view)
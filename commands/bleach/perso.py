@@ -13,29 +13,23 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Select
-import json
 import os
 import random
 
 from utils.discord_utils import safe_send, safe_edit, safe_respond, safe_delete  
+from utils.game_data import game_data
+from utils.asset_store import asset_store
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 📂 Dossier contenant les JSON des personnages
+# 📂 Personnages (registre des données de jeu)
 # ────────────────────────────────────────────────────────────────────────────────
-CHAR_DIR = os.path.join("data", "personnages")
-
 def load_character(name: str):
-    """Charge la fiche JSON d'un personnage par nom."""
-    path = os.path.join(CHAR_DIR, f"{name.lower()}.json")
-    if not os.path.isfile(path):
-        return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Fiche d'un personnage par nom (registre en mémoire, lecture seule)."""
+    return game_data.character(name)
 
 def list_characters():
     """Liste tous les personnages disponibles."""
-    files = os.listdir(CHAR_DIR)
-    return [f.replace(".json", "") for f in files if f.endswith(".json")]
+    return game_data.character_names()
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -95,9 +89,10 @@ class Perso(commands.Cog):
         else:
             image_path = "data/images/image_par_defaut.jpg"
 
+        file = None
         if os.path.exists(image_path):
-            file = discord.File(image_path, filename=os.path.basename(image_path))
-            embed.set_image(url=f"attachment://{os.path.basename(image_path)}")
+            file = asset_store.set_image(embed, image_path)
+        if file:
             await safe_send(channel, embed=embed, file=file)
         else:
             await safe_send(channel, embed=embed)
@@ -16,6 +16,7 @@ from discord.ui import View, Button
 import os
 
 from utils.discord_utils import safe_send, safe_edit, safe_respond, safe_delete  
+from utils.asset_store import asset_store
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Gestion des pages du pilote
@@ -45,16 +46,15 @@ class PiloteView(View):
     async def update_page(self):
         """Met à jour l’embed avec la page actuelle."""
         file_path = os.path.join(PILOTE_FOLDER, self.pages[self.current_page - 1])
-        file = discord.File(file_path, filename=self.pages[self.current_page - 1])
 
         embed = discord.Embed(
             title=f"Bleach - Pilote (Page {self.current_page}/{len(self.pages)})",
             description="⬅️ Précédent | ➡️ Suivant | ❌ Fermer",
             color=discord.Color.orange()
         )
-        embed.set_image(url=f"attachment://{self.pages[self.current_page - 1]}")
+        file = asset_store.set_image(embed, file_path)  # None → URL du salon d’assets
 
-        await safe_edit(self.message, embed=embed, attachments=[file], view=self)
+        await safe_edit(self.message, embed=embed, attachments=[file] if file else [], view=self)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Seul l’auteur de la commande peut utiliser les boutons."""
@@ -111,15 +111,17 @@ class PiloteBleach(commands.Cog):
         view = PiloteView(self.bot, pages, start_page=start_page, user=user)
 
         file_path = os.path.join(PILOTE_FOLDER, pages[start_page - 1])
-        file = discord.File(file_path, filename=pages[start_page - 1])
         embed = discord.Embed(
             title=f"Bleach - Pilote (Page {start_page}/{len(pages)})",
             description="⬅️ Précédent | ➡️ Suivant | ❌ Fermer",
             color=discord.Color.orange()
         )
-        embed.set_image(url=f"attachment://{pages[start_page - 1]}")
+        file = asset_store.set_image(embed, file_path)
 
-        view.message = await safe_send(channel, embed=embed, file=file, view=view)
+        if file:
+            view.message = await safe_send(channel, embed=embed, file=file, view=view)
+        else:
+            view.message = await safe_send(channel, embed=embed, view=view)
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande SLASH
@@ -13,24 +13,16 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, button
-import json
-import os
 import random
 from utils.discord_utils import safe_send, safe_edit, safe_respond
+from utils.game_data import game_data
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement des données JSON
 # ────────────────────────────────────────────────────────────────────────────────
-DATA_JSON_PATH = os.path.join("data", "pizza_options.json")
-
 def load_data():
-    """Charge les options de pizza depuis le fichier JSON."""
-    try:
-        with open(DATA_JSON_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[ERREUR JSON] Impossible de charger {DATA_JSON_PATH} : {e}")
-        return {}
+    """Options de pizza depuis le registre des données de jeu (lecture seule)."""
+    return game_data.get("pizza_options", {})
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧩 Fonction commune pour générer l'embed pizza
@@ -1,6 +1,6 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # sorting.py — Visualisation d'algorithmes de tri /sorting et !sorting
-# Objectif : Visualiser différents algorithmes de tri en temps réel dans Discord
+# Objectif : Visualiser différents algorithmes de tri dans Discord (GIF animé en un message, ou animation en direct)
 # Catégorie : Fun
 # Accès : Tous
 # Cooldown : 1 utilisation / 10 secondes / utilisateur
@@ -10,242 +10,19 @@
 # Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
 import discord
+import io
 import random
 import asyncio
 from discord import app_commands
 from discord.ext import commands
 from utils.discord_utils import safe_send, safe_respond
-
-# ────────────────────────────────────────────────────────────────────────────────
-# Fonctions de tri (avec yield pour animation)
-# ────────────────────────────────────────────────────────────────────────────────
-async def bubble_sort(data):
-    n = len(data)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            if data[j] > data[j + 1]:
-                data[j], data[j + 1] = data[j + 1], data[j]
-            yield data, list(range(n - i, n))
-
-async def insertion_sort(data):
-    for i in range(1, len(data)):
-        key = data[i]
-        j = i - 1
-        while j >= 0 and data[j] > key:
-            data[j + 1] = data[j]
-            j -= 1
-            yield data, list(range(i + 1))
-        data[j + 1] = key
-        yield data, list(range(i + 1))
-
-async def selection_sort(data):
-    n = len(data)
-    for i in range(n):
-        min_idx = i
-        for j in range(i + 1, n):
-            if data[j] < data[min_idx]:
-                min_idx = j
-        data[i], data[min_idx] = data[min_idx], data[i]
-        yield data, list(range(i + 1))
-
-async def quick_sort(data, low=0, high=None):
-    if high is None:
-        high = len(data) - 1
-    if low < high:
-        pivot, left, right = data[high], low, high - 1
-        while left <= right:
-            while left <= right and data[left] < pivot:
-                left += 1
-            while left <= right and data[right] >= pivot:
-                right -= 1
-            if left < right:
-                data[left], data[right] = data[right], data[left]
-            yield data, list(range(low))
-        data[left], data[high] = data[high], data[left]
-        yield data, list(range(low, left + 1))
-        async for step, sorted_idx in quick_sort(data, low, left - 1):
-            yield step, sorted_idx
-        async for step, sorted_idx in quick_sort(data, left + 1, high):
-            yield step, sorted_idx
-
-async def merge_sort(data, start=0, end=None):
-    if end is None:
-        end = len(data)
-    if end - start > 1:
-        mid = (start + end) // 2
-        async for step, sorted_idx in merge_sort(data, start, mid):
-            yield step, sorted_idx
-        async for step, sorted_idx in merge_sort(data, mid, end):
-            yield step, sorted_idx
-        left, right = data[start:mid], data[mid:end]
-        i = j = 0
-        for k in range(start, end):
-            if j >= len(right) or (i < len(left) and left[i] < right[j]):
-                data[k] = left[i]
-                i += 1
-            else:
-                data[k] = right[j]
-                j += 1
-            yield data, list(range(start, k + 1))
-
-async def heap_sort(data):
-    n = len(data)
-    def heapify(n, i):
-        largest = i
-        l, r = 2*i + 1, 2*i + 2
-        if l < n and data[l] > data[largest]:
-            largest = l
-        if r < n and data[r] > data[largest]:
-            largest = r
-        if largest != i:
-            data[i], data[largest] = data[largest], data[i]
-            heapify(n, largest)
-    for i in range(n//2 - 1, -1, -1):
-        heapify(n, i)
-        yield data, []
-    for i in range(n - 1, 0, -1):
-        data[i], data[0] = data[0], data[i]
-        heapify(i, 0)
-        yield data, list(range(i, n))
-
-async def shell_sort(data):
-    n = len(data)
-    gap = n // 2
-    while gap > 0:
-        for i in range(gap, n):
-            temp = data[i]
-            j = i
-            while j >= gap and data[j - gap] > temp:
-                data[j] = data[j - gap]
-                j -= gap
-                yield data, list(range(i + 1))
-            data[j] = temp
-            yield data, list(range(i + 1))
-        gap //= 2
-
-async def cocktail_sort(data):
-    n = len(data)
-    swapped = True
-    start = 0
-    end = n - 1
-    while swapped:
-        swapped = False
-        for i in range(start, end):
-            if data[i] > data[i + 1]:
-                data[i], data[i + 1] = data[i + 1], data[i]
-                swapped = True
-            yield data, list(range(i + 1))
-        if not swapped:
-            break
-        swapped = False
-        end -= 1
-        for i in range(end - 1, start - 1, -1):
-            if data[i] > data[i + 1]:
-                data[i], data[i + 1] = data[i + 1], data[i]
-                swapped = True
-            yield data, list(range(i + 1))
-        start += 1
-
-async def comb_sort(data):
-    n = len(data)
-    gap = n
-    shrink = 1.3
-    sorted_ = False
-    while not sorted_:
-        gap = int(gap / shrink)
-        if gap <= 1:
-            gap = 1
-            sorted_ = True
-        i = 0
-        while i + gap < n:
-            if data[i] > data[i + gap]:
-                data[i], data[i + gap] = data[i + gap], data[i]
-                sorted_ = False
-            yield data, list(range(i + 1))
-            i += 1
-
-# ────────────────────────────────────────────────────────────────────────────────
-# Nouveau tri : Pair Sum Sort
-# ────────────────────────────────────────────────────────────────────────────────
-async def pair_sum_sort(data):
-    """Tri par paires basé sur la somme et décalage."""
-    n = len(data)
-    swapped = True
-    while swapped:
-        swapped = False
-        # Paires consécutives (0,1), (2,3), ...
-        pairs = [(i, i+1) for i in range(0, n-1, 2)]
-        sums = [data[i]+data[j] for i,j in pairs]
-        sorted_pairs = [pairs[i] for i in sorted(range(len(pairs)), key=lambda x: sums[x])]
-        new_data = []
-        for i,j in sorted_pairs:
-            new_data.extend([data[i], data[j]])
-        for k in range(len(new_data)):
-            if data[k] != new_data[k]:
-                data[k] = new_data[k]
-                swapped = True
-            yield data, list(range(len(data)))
-        # Paires décalées (1,2), (3,4), ...
-        pairs = [(i, i+1) for i in range(1, n-1, 2)]
-        sums = [data[i]+data[j] for i,j in pairs]
-        sorted_pairs = [pairs[i] for i in sorted(range(len(pairs)), key=lambda x: sums[x])]
-        new_data = data[:1]  # premier élément si impair
-        for i,j in sorted_pairs:
-            new_data.extend([data[i], data[j]])
-        if len(new_data) < n:
-            new_data.append(data[-1])
-        for k in range(len(new_data)):
-            if data[k] != new_data[k]:
-                data[k] = new_data[k]
-                swapped = True
-            yield data, list(range(len(data)))
-
-# ────────────────────────────────────────────────────────────────────────────────
-# Algos expérimentaux
-# ────────────────────────────────────────────────────────────────────────────────
-async def pair_shift_sort(data):
-    """Tri expérimental basé sur le déplacement du plus grand élément d'une paire vers la droite."""
-    n = len(data)
-    while True:
-        changed = False
-        i = 0
-        while i < n - 1:
-            a, b = data[i], data[i + 1]
-            if a != b:
-                gap = abs(a - b)
-                if a > b:
-                    new_pos = min(i + gap, n - 1)
-                    data.insert(new_pos, data.pop(i))
-                    changed = True
-            i += 1
-            yield data, [i]
-        if not changed:
-            break
-
-async def centrifugal_sort(data):
-    """Tri par triplets consécutifs : le nombre du milieu est replacé entre les deux autres."""
-    n = len(data)
-    changed = True
-    while changed:
-        changed = False
-        # Triplets consécutifs (0,1,2), (3,4,5), ...
-        for i in range(0, n - 2, 3):
-            triplet = data[i:i + 3]
-            sorted_triplet = sorted(triplet)
-            if triplet != sorted_triplet:
-                data[i:i + 3] = sorted_triplet
-                changed = True
-            yield data, list(range(i, i + 3))
-        # Décalage d’un pour triplets (1,2,3), (4,5,6), ...
-        for i in range(1, n - 2, 3):
-            triplet = data[i:i + 3]
-            sorted_triplet = sorted(triplet)
-            if triplet != sorted_triplet:
-                data[i:i + 3] = sorted_triplet
-                changed = True
-            yield data, list(range(i, i + 3))
-
-
+from utils.render_scheduler import queue_edit, safe_render
+from utils.sorting_utils import (
+    bubble_sort, insertion_sort, selection_sort, quick_sort, merge_sort, heap_sort,
+    shell_sort, cocktail_sort, comb_sort, pair_sum_sort, pair_shift_sort, centrifugal_sort,
+    record_sort, render_gif,
+)
+from utils.sorting_benchmark import load_stats
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Visualisation des barres
@@ -284,38 +61,96 @@ class Sorting(commands.Cog):
             "Pair Shift Sort": {"func": pair_shift_sort, "desc": "Déplace le plus grand élément d'une paire vers la droite.", "max_iter": 30, "avg_iter": 15},
             "Centrifugal Sort": {"func": centrifugal_sort, "desc": "Tri par triplets, le nombre du milieu est replacé entre les deux autres.", "max_iter": 30, "avg_iter": 15},
         }
-
-    async def visualize_sorting(self, channel_or_interaction, algorithm_name: str):
+        # Stats mesurées par utils/sorting_benchmark (--write) ; sinon les estimations ci-dessus
+        for name, stats in load_stats().items():
+            if name in self.algorithms:
+                self.algorithms[name].update(stats)
+
+    async def visualize_sorting(self, channel_or_interaction, algorithm_name: str, live: bool = False):
+        """
+        Le tri est exécuté hors ligne (trace compacte) puis envoyé en un seul
+        message avec un GIF animé. `live` rejoue la trace en éditant l’embed.
+        """
         algo_info = self.algorithms[algorithm_name]
         data = list(range(1, 13))
         random.shuffle(data)
-        algo = algo_info["func"]
+        # Tri et encodage dans un thread : un algorithme bloqué s’arrête au plafond d’étapes
+        trace = await asyncio.to_thread(record_sort, algo_info["func"], data, algorithm_name)
+
+        if live:
+            return await self._replay_live(channel_or_interaction, algorithm_name, trace)
+
+        embed = self._final_embed(algorithm_name, trace)
+        try:
+            gif = await asyncio.to_thread(render_gif, trace)
+        except Exception as e:
+            print(f"[Sorting] Rendu GIF impossible → {e}")
+            gif = None
+
+        if gif:
+            embed.set_image(url="attachment://sorting.gif")
+            kwargs = {"embed": embed, "file": discord.File(io.BytesIO(gif), filename="sorting.gif")}
+        else:
+            # Repli : quelques étapes clés en texte
+            for number, step, sorted_idx in trace.keyframes(3):
+                embed.add_field(name=f"Étape {number}", value=f"```\n{render_bars(step, sorted_idx)}\n```", inline=True)
+            kwargs = {"embed": embed}
+
+        if isinstance(channel_or_interaction, discord.Interaction):
+            await safe_respond(channel_or_interaction, **kwargs)
+        else:
+            await safe_send(channel_or_interaction, **kwargs)
+
+    def _final_embed(self, algorithm_name: str, trace) -> discord.Embed:
+        algo_info = self.algorithms[algorithm_name]
+        final = trace.final()
+        if final == sorted(final):
+            embed = discord.Embed(
+                title=f"✅ {algorithm_name} terminé !",
+                description=f"{algo_info['desc']}\n```\n{render_bars(final, list(range(len(final))))}\n```",
+                color=discord.Color.green()
+            )
+        else:
+            embed = discord.Embed(
+                title=f"⚠️ {algorithm_name} s'est arrêté sans finir le tri",
+                description=f"{algo_info['desc']}\n```\n{render_bars(final)}\n```",
+                color=discord.Color.orange()
+            )
+        iterations = f"{len(trace)}+ (plafond atteint)" if trace.truncated else f"{len(trace)}"
+        embed.add_field(name="🧮 Itérations totales", value=iterations, inline=False)
+        embed.add_field(name="📊 Stats (max/moyen)", value=f"{algo_info['max_iter']} / {algo_info['avg_iter']}", inline=False)
+        if algo_info.get("success_rate", 1) < 1:
+            embed.add_field(name="🧪 Fiabilité", value=f"Trie {algo_info['success_rate']:.0%} des listes mélangées", inline=False)
+        return embed
+
+    async def _replay_live(self, channel_or_interaction, algorithm_name: str, trace):
+        """Ancienne animation : une édition de l’embed par étape."""
+        algo_info = self.algorithms[algorithm_name]
         delay = 0.25
         msg = None
-        iteration = 0
 
-        async def send(embed):
+        async def send(embed, wait=False):
+            """Premier envoi direct, puis éditions regroupées (images intermédiaires abandonnées si besoin)."""
             nonlocal msg
-            if isinstance(channel_or_interaction, discord.Interaction):
-                if msg:
-                    await msg.edit(embed=embed)
-                else:
-                    msg = await safe_respond(channel_or_interaction, embed=embed)
-            else:
-                if msg:
-                    await msg.edit(embed=embed)
+            if msg is None:
+                if isinstance(channel_or_interaction, discord.Interaction):
+                    await safe_respond(channel_or_interaction, embed=embed)
+                    msg = await channel_or_interaction.original_response()
                 else:
                     msg = await safe_send(channel_or_interaction, embed=embed)
+            elif wait:
+                await safe_render(msg, embed=embed)
+            else:
+                queue_edit(msg, embed=embed)
 
         embed = discord.Embed(
             title=f"🔄 {algorithm_name} — En cours...",
-            description=f"{algo_info['desc']}\n```\n{render_bars(data)}\n```",
+            description=f"{algo_info['desc']}\n```\n{render_bars(trace.initial)}\n```",
             color=discord.Color.blurple()
         )
         await send(embed)
 
-        async for step, sorted_idx in algo(data.copy()):
-            iteration += 1
+        for iteration, (step, sorted_idx) in enumerate(trace.replay(), start=1):
             await asyncio.sleep(delay)
             embed = discord.Embed(
                 title=f"🔄 {algorithm_name} — Étape {iteration}",
@@ -324,15 +159,7 @@ class Sorting(commands.Cog):
             )
             await send(embed)
 
-        sorted_data = sorted(data)
-        embed = discord.Embed(
-            title=f"✅ {algorithm_name} terminé !",
-            description=f"{algo_info['desc']}\n```\n{render_bars(sorted_data, list(range(len(sorted_data))))}\n```",
-            color=discord.Color.green()
-        )
-        embed.add_field(name="🧮 Itérations totales", value=f"{iteration}", inline=False)
-        embed.add_field(name="📊 Stats (max/moyen)", value=f"{algo_info['max_iter']} / {algo_info['avg_iter']}", inline=False)
-        await send(embed)
+        await send(self._final_embed(algorithm_name, trace), wait=True)
 
     # ────────────────────────────────────────────────────────────────────────────
     # Commande SLASH
@@ -341,7 +168,7 @@ class Sorting(commands.Cog):
         name="sorting",
         description="Visualise un algorithme de tri en temps réel."
     )
-    @app_commands.describe(algorithme="Nom, numéro ou 'random' pour un tri aléatoire")
+    @app_commands.describe(algorithme="Nom, numéro ou 'random' (ajoute 'live' pour l'animation étape par étape)")
     @app_commands.checks.cooldown(1, 10.0, key=lambda i: i.user.id)
     async def slash_sorting(self, interaction: discord.Interaction, algorithme: str = None):
         await self.handle_sorting(interaction, algorithme)
@@ -372,7 +199,7 @@ class Sorting(commands.Cog):
                 value="\n".join([f"**{i+1}.** {name}" for i, name in enumerate(algos_list)]),
                 inline=False
             )
-            embed.set_footer(text="Exemples : /sorting 3 | /sorting Bubble Sort | /sorting random")
+            embed.set_footer(text="Exemples : /sorting 3 | /sorting Bubble Sort | /sorting random | /sorting 3 live")
             if isinstance(channel_or_interaction, discord.Interaction):
                 await safe_respond(channel_or_interaction, embed=embed)
             else:
@@ -380,6 +207,9 @@ class Sorting(commands.Cog):
             return
 
         algorithme = algorithme.strip().lower()
+        live = algorithme.endswith(" live") or algorithme == "live"
+        if live:
+            algorithme = algorithme[:-len("live")].strip() or "random"
         if algorithme == "random":
             algo_name = random.choice(algos_list)
         elif algorithme.isdigit() and algorithme in algo_dict:
@@ -400,7 +230,7 @@ class Sorting(commands.Cog):
                 return
             algo_name = matched
 
-        await self.visualize_sorting(channel_or_interaction, algo_name)
+        await self.visualize_sorting(channel_or_interaction, algo_name, live=live)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Setup du Cog
@@ -15,69 +15,70 @@ from discord.ui import View, Select, Button
 from bot import get_prefix
 import math
 from utils.discord_utils import safe_send, safe_edit, safe_respond
+from utils.persistent_views import SEP, persistent_component, make_custom_id, detached
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📂 Catégories (recalculées à la demande : aucune copie gardée par message)
+# ────────────────────────────────────────────────────────────────────────────────
+PER_PAGE = 10
+
+def get_categories(bot) -> dict:
+    categories = {}
+    for cmd in bot.commands:
+        if cmd.hidden:
+            continue
+        cat = getattr(cmd, "category", "Autres")
+        categories.setdefault(cat, []).append(cmd)
+    return categories
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ UI — Sélecteur de catégorie
 # ────────────────────────────────────────────────────────────────────────────────
 class HelpCategoryView(View):
     """View qui permet à l'utilisateur de choisir une catégorie de commandes."""
-    def __init__(self, bot, categories: dict, prefix: str):
+    def __init__(self, categories: dict):
         super().__init__(timeout=None)
-        self.bot = bot
-        self.categories = categories
-        self.prefix = prefix
-        self.add_item(HelpCategorySelect(self))  # Ajoute le menu déroulant
+        self.add_item(HelpCategorySelect(categories))  # Ajoute le menu déroulant
 
 class HelpCategorySelect(Select):
-    """Menu déroulant listant les catégories de commandes."""
-    def __init__(self, parent_view: HelpCategoryView):
-        self.parent_view = parent_view
+    """Menu déroulant listant les catégories de commandes (traité par on_help_component)."""
+    def __init__(self, categories: dict):
         options = [
             discord.SelectOption(label=cat, description=f"{len(cmds)} commande(s)")
-            for cat, cmds in sorted(self.parent_view.categories.items())
+            for cat, cmds in sorted(categories.items())
         ]
-        super().__init__(placeholder="Sélectionne une catégorie", options=options)
-
-    async def callback(self, interaction: discord.Interaction):
-        """Lorsque l'utilisateur sélectionne une catégorie, affiche les commandes paginées."""
-        await interaction.response.defer()
-        selected_cat = self.values[0]
-        commands_in_cat = sorted(self.parent_view.categories[selected_cat], key=lambda c: c.name)
-        paginator = HelpPaginatorView(
-            self.parent_view.bot,
-            selected_cat,
-            commands_in_cat,
-            self.parent_view.prefix,
-            self.parent_view
-        )
-        await safe_edit(
-            interaction.message,
-            content=f"📂 Catégorie sélectionnée : **{selected_cat}**",
-            embed=paginator.create_embed(),
-            view=paginator
-        )
+        super().__init__(placeholder="Sélectionne une catégorie", options=options, custom_id=make_custom_id("help", "cat"))
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ UI — Pagination des commandes
 # ────────────────────────────────────────────────────────────────────────────────
 class HelpPaginatorView(View):
-    """Permet de naviguer entre les pages d'une catégorie de commandes."""
-    def __init__(self, bot, category: str, commands_list: list, prefix: str, parent_view: HelpCategoryView):
+    """
+    Page d'une catégorie de commandes. Catégorie et page sont dans les custom_id
+    des boutons : la vue est détachée à l'envoi et recréée à chaque clic.
+    """
+    def __init__(self, categories: dict, category: str, prefix: str, page: int = 0):
         super().__init__(timeout=None)
-        self.bot = bot
         self.category = category
-        self.commands = commands_list
+        self.commands = sorted(categories.get(category, []), key=lambda c: c.name)
         self.prefix = prefix
-        self.parent_view = parent_view
-        self.page = 0
-        self.per_page = 10
+        self.per_page = PER_PAGE
         self.total_pages = max(1, math.ceil(len(self.commands) / self.per_page))
+        self.page = min(max(page, 0), self.total_pages - 1)
 
         # Ajout des boutons de navigation si plusieurs pages
         if self.total_pages > 1:
-            self.add_item(PrevButton(self))
-            self.add_item(NextButton(self))
-        self.add_item(HelpCategorySelect(self.parent_view))  # Permet de changer de catégorie
+            self.add_item(Button(
+                label="◀️", style=discord.ButtonStyle.primary,
+                custom_id=make_custom_id("help", "page", self.page - 1, category),
+                disabled=self.page == 0
+            ))
+            self.add_item(Button(
+                label="▶️", style=discord.ButtonStyle.primary,
+                custom_id=make_custom_id("help", "page", self.page + 1, category),
+                disabled=self.page >= self.total_pages - 1
+            ))
+        self.add_item(HelpCategorySelect(categories))  # Permet de changer de catégorie
 
     def create_embed(self) -> discord.Embed:
         """Crée un embed pour la page courante."""
@@ -91,29 +92,26 @@ class HelpPaginatorView(View):
         embed.set_footer(text=f"Utilise {self.prefix}help <commande> pour plus de détails.")
         return embed
 
-class PrevButton(Button):
-    """Bouton pour aller à la page précédente d'une catégorie."""
-    def __init__(self, paginator: HelpPaginatorView):
-        super().__init__(label="◀️", style=discord.ButtonStyle.primary)
-        self.paginator = paginator
-
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        if self.paginator.page > 0:
-            self.paginator.page -= 1
-            await safe_edit(interaction.message, embed=self.paginator.create_embed(), view=self.paginator)
-
-class NextButton(Button):
-    """Bouton pour aller à la page suivante d'une catégorie."""
-    def __init__(self, paginator: HelpPaginatorView):
-        super().__init__(label="▶️", style=discord.ButtonStyle.primary)
-        self.paginator = paginator
-
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        if self.paginator.page < self.paginator.total_pages - 1:
-            self.paginator.page += 1
-            await safe_edit(interaction.message, embed=self.paginator.create_embed(), view=self.paginator)
+@persistent_component("help")
+async def on_help_component(interaction: discord.Interaction, args: list[str]):
+    """Choix d'une catégorie ("help:cat") ou changement de page ("help:page:<n>:<catégorie>")."""
+    bot = interaction.client
+    if args[0] == "cat":
+        category, page = interaction.data["values"][0], 0
+    else:
+        page, category = int(args[1]), SEP.join(args[2:])
+
+    await interaction.response.defer()
+    categories = get_categories(bot)
+    if category not in categories:
+        return
+    paginator = HelpPaginatorView(categories, category, get_prefix(bot, interaction.message), page)
+    await safe_edit(
+        interaction.message,
+        content=f"📂 Catégorie sélectionnée : **{category}**",
+        embed=paginator.create_embed(),
+        view=detached(paginator)
+    )
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal avec gestion centralisée des erreurs et cooldown
@@ -150,15 +148,10 @@ class HelpCommand(commands.Cog):
             return await safe_send(ctx.channel, embed=embed)
 
         # 📜 Liste des commandes par catégorie
-        categories = {}
-        for cmd in self.bot.commands:
-            if cmd.hidden:
-                continue
-            cat = getattr(cmd, "category", "Autres")
-            categories.setdefault(cat, []).append(cmd)
-
-        # Affiche le menu interactif
-        view = HelpCategoryView(self.bot, categories, prefix)
+        categories = get_categories(self.bot)
+
+        # Affiche le menu interactif (détaché : les clics passent par on_help_component)
+        view = detached(HelpCategoryView(categories))
         await safe_send(ctx.channel, "📌 Sélectionne une catégorie pour voir ses commandes :", view=view)
 
     def cog_load(self):
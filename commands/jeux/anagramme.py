@@ -12,38 +12,20 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import random, aiohttp, unicodedata
-from spellchecker import SpellChecker
+import random, unicodedata
 from utils.discord_utils import safe_send, safe_edit, safe_respond
+from utils.word_pool import word_pool
+from utils.french_dictionary import french_dict
+from utils.session_manager import session_manager, SessionRefused
 
-# ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Initialisation du spellchecker français
-# ────────────────────────────────────────────────────────────────────────────────
-spell = SpellChecker(language='fr')
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Fonction pour récupérer un mot français aléatoire
-# ────────────────────────────────────────────────────────────────────────────────
-async def get_random_french_word(length: int | None = None) -> str:
-    url = "https://trouve-mot.fr/api/random"
-    if length:
-        url += f"?size={length}"
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if isinstance(data, list) and len(data) > 0:
-                        return data[0]["name"].upper()
-    except Exception as e:
-        print(f"[ERREUR API Anagramme] {e}")
-    return "PYTHON"
+DUREE_PARTIE = 180  # Secondes avant la fin automatique d’une partie
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Vérification d’un mot via SpellChecker
+# 🌐 Vérification d’un mot (dictionnaire partagé, accents ignorés)
 # ────────────────────────────────────────────────────────────────────────────────
-def is_valid_word(word: str) -> bool:
-    return word.lower() in spell.word_frequency
+async def is_valid_word(word: str) -> bool:
+    await french_dict.load()  # Chargé dans un thread : la boucle n’est jamais bloquée
+    return french_dict.contains(word)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎮 Vue principale du jeu
@@ -99,7 +81,7 @@ class AnagrammeView:
                 embed.color = discord.Color.red()
                 embed.set_footer(text=f"💀 Partie terminée. Le mot était {self.target_word}.")
         else:
-            embed.set_footer(text=f"⏳ Temps restant : 180 secondes")
+            embed.set_footer(text=f"⏳ Temps restant : {DUREE_PARTIE} secondes")
         return embed
 
     async def process_guess(self, channel: discord.abc.Messageable, guess: str):
@@ -108,7 +90,7 @@ class AnagrammeView:
         filtered_guess = guess.strip(".* ").upper()
         if len(filtered_guess) != self.display_length:
             return await safe_send(channel, f"⚠️ Le mot doit faire {self.display_length} lettres.")
-        if not is_valid_word(filtered_guess):
+        if not await is_valid_word(filtered_guess):
             return await safe_send(channel, f"❌ `{filtered_guess}` n’est pas reconnu comme un mot valide.")
         self.attempts.append({'word': filtered_guess})
         if self.remove_accents(filtered_guess) == self.remove_accents(self.target_word) or len(self.attempts) >= self.max_attempts:
@@ -116,33 +98,49 @@ class AnagrammeView:
         if self.message:
             await safe_edit(self.message, embed=self.build_embed())
 
+    async def on_timeout(self):
+        """Fin automatique (appelée par le gestionnaire de sessions)."""
+        if self.finished or not self.message:
+            return
+        self.finished = True
+        embed = self.build_embed()
+        embed.color = discord.Color.red()
+        embed.set_footer(text=f"⏳ Temps écoulé ! Le mot était {self.target_word}.")
+        await safe_edit(self.message, embed=embed)
+
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
 # ────────────────────────────────────────────────────────────────────────────────
 class Anagramme(commands.Cog):
     def __init__(self, bot: commands.Bot):
-        self.bot = bot
-        self.active_games: dict[int, AnagrammeView] = {}  # channel_id -> view
+        self.bot = bot  # Parties : session_manager, jeu "anagramme", clé = salon
 
     async def _start_game(self, channel: discord.abc.Messageable, author_id: int, mode: str = "solo"):
         length = random.choice(range(5, 9))
-        target_word = await get_random_french_word(length=length)
+        target_word = word_pool.get_word(length).upper()
+        french_dict.warmup()
         author_filter = None if mode.lower() in ("multi", "m") else author_id
         view = AnagrammeView(target_word, author_id=author_filter)
-        embed = view.build_embed()
-        view.message = await safe_send(channel, embed=embed)
-        self.active_games[channel.id] = view
-
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.author.bot:
-            return
-        if message.channel.id not in self.active_games:
+        try:
+            session_manager.open(
+                "anagramme", channel.id, view,
+                owner_id=author_filter, ttl=DUREE_PARTIE, on_expire=AnagrammeView.on_timeout,
+                channel_id=channel.id, on_message=self.on_proposition, prefixes=(".", "*")
+            )
+        except SessionRefused as e:
+            return await safe_send(channel, str(e))
+        view.message = await safe_send(channel, embed=view.build_embed())
+        if view.message is None:
+            session_manager.close("anagramme", channel.id)
+
+    async def on_proposition(self, message: discord.Message):
+        """Propositions ".mot" / "*mot" du salon (via le routeur de messages)."""
+        view = session_manager.get("anagramme", message.channel.id)
+        if view is None:
             return
-        content = message.content.strip()
-        if content.startswith((".", "*")):
-            view = self.active_games[message.channel.id]
-            await view.process_guess(message.channel, content)
+        await view.process_guess(message.channel, message.content.strip())
+        if view.finished:
+            session_manager.close("anagramme", message.channel.id)
 
     @app_commands.command(name="anagramme", description="Lance une partie d'Anagramme (multi = tout le monde peut jouer)")
     @app_commands.describe(mode="Mode de jeu : solo ou multi")
@@ -13,8 +13,10 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from utils.discord_utils import safe_send, safe_respond
-from utils.jardin_utils import get_or_create_garden, build_garden_embed
+from utils.jardin_utils import build_garden_embed
+from utils.jardin_store import garden_store
 from utils.jardin_ui_utils import JardinView
+from utils.alchimie_utils import alchemy_table
 
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -26,10 +28,14 @@ class Jardin(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+    async def cog_load(self):
+        # Table des recettes calculée dans un thread, pas au premier clic d’un joueur
+        await alchemy_table.build()
+
     async def _send_garden(self, target_user, viewer_id, respond_func):
         """Affiche le jardin d’un utilisateur donné."""
         try:
-            garden = await get_or_create_garden(target_user.id, target_user.name)
+            garden = await garden_store.get(target_user.id, target_user.name)
             embed = build_garden_embed(garden, viewer_id)
             view = None
 
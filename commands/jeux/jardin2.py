@@ -12,60 +12,10 @@
 import discord
 from discord.ext import commands
 import datetime
-import random
-import json
 
-from utils.supabase_client import supabase
 from utils.discord_utils import safe_send
-
-# ────────────────────────────────────────────────────────────────────────────────
-# ⚙️ Config & Données
-# ────────────────────────────────────────────────────────────────────────────────
-with open("data/jardin_config.json", "r", encoding="utf-8") as f:
-    CONFIG = json.load(f)
-
-DEFAULT_GRID = CONFIG["DEFAULT_GRID"]
-FLEUR_EMOJIS = CONFIG["FLEUR_EMOJIS"]
-FERTILIZE_PROBABILITY = CONFIG["FERTILIZE_PROBABILITY"]
-FERTILIZE_COOLDOWN = datetime.timedelta(minutes=CONFIG["FERTILIZE_COOLDOWN_MINUTES"])
-TABLE_NAME = "gardens"
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 🛠️ Fonctions utilitaires
-# ────────────────────────────────────────────────────────────────────────────────
-async def get_or_create_garden(user_id: int, username: str):
-    """Récupère ou crée un jardin pour l’utilisateur"""
-    res = supabase.table(TABLE_NAME).select("*").eq("user_id", user_id).execute()
-    if res.data:
-        return res.data[0]
-
-    new_garden = {
-        "user_id": user_id,
-        "username": username,
-        "garden_grid": DEFAULT_GRID.copy(),
-        "inventory": {f: 0 for f in FLEUR_EMOJIS},
-        "argent": 0,
-        "armee": "",
-        "last_fertilize": None
-    }
-    supabase.table(TABLE_NAME).insert(new_garden).execute()
-    return new_garden
-
-
-def pousser_fleurs(grid: list[str]) -> list[str]:
-    """Fait pousser aléatoirement des fleurs sur la grille"""
-    new_grid = []
-    for line in grid:
-        new_line = ""
-        for c in line:
-            if c == "🌱" and random.random() < FERTILIZE_PROBABILITY:
-                _, emoji = random.choice(list(FLEUR_EMOJIS.items()))
-                new_line += emoji
-            else:
-                new_line += c
-        new_grid.append(new_line)
-    return new_grid
-
+from utils.jardin_utils import FERTILIZE_COOLDOWN, FLEUR_EMOJIS
+from utils.jardin_store import garden_store
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ UI — Vue Jardin2
@@ -77,9 +27,10 @@ class Jardin2View(discord.ui.View):
         self.user_id = user_id
 
         # 🔹 Boutons de la grille
-        for row_idx, row in enumerate(self.garden["garden_grid"]):
-            cells = [row[i:i+2] for i in range(0, len(row), 2)]
-            for col_idx, cell in enumerate(cells):
+        grid = self.garden["garden_grid"]
+        for row_idx in range(grid.rows):
+            for col_idx, start in enumerate(range(0, grid.width, 2)):
+                cell = "".join(grid.emoji(row_idx, c) for c in range(start, min(start + 2, grid.width)))
                 self.add_item(FlowerButton(row_idx, col_idx, cell, self))
 
         # 🔹 Ligne des commandes globales
@@ -99,11 +50,7 @@ class Jardin2View(discord.ui.View):
         )
 
     def format_garden(self) -> str:
-        """Affiche le jardin au format ASCII"""
-        grid_display = "\n".join(
-            "[" + "][".join([row[i:i+2] for i in range(0, len(row), 2)]) + "]"
-            for row in self.garden["garden_grid"]
-        )
+        """Texte d’en-tête du jardin (la grille est affichée par les boutons)"""
         return (
             f"**🏡 Jardin de {self.garden['username']}**\n"
             "💩:engrais, ✂️:couper, 🛍️:inventaire, ⚗️:alchimie, 💵:magasin"
@@ -124,21 +71,15 @@ class FlowerButton(discord.ui.Button):
         if interaction.user.id != self.parent_view.user_id:
             return await interaction.response.send_message("❌ Ce jardin n'est pas à toi !", ephemeral=True)
 
-        current = self.parent_view.garden["garden_grid"][self.row]
-        char = current[self.col]
+        garden = self.parent_view.garden
 
         # Couper une fleur (si ≠ 🌱)
-        if char != "🌱":
-            inv = self.parent_view.garden["inventory"]
+        flower = garden["garden_grid"].pick(self.row, self.col)
+        if flower:
+            char = FLEUR_EMOJIS[flower]
+            inv = garden["inventory"]
             inv[char] = inv.get(char, 0) + 1
-            row_list = list(current)
-            row_list[self.col] = "🌱"
-            self.parent_view.garden["garden_grid"][self.row] = "".join(row_list)
-
-            supabase.table(TABLE_NAME).update({
-                "garden_grid": self.parent_view.garden["garden_grid"],
-                "inventory": self.parent_view.garden["inventory"]
-            }).eq("user_id", self.parent_view.user_id).execute()
+            garden_store.mark_dirty(self.parent_view.user_id, "garden_grid", "inventory")
 
         await self.parent_view.refresh(interaction)
 
@@ -156,15 +97,16 @@ class GlobalButton(discord.ui.Button):
         if self.action == "engrais":
             now = datetime.datetime.now(datetime.timezone.utc)
             last = self.parent_view.garden.get("last_fertilize")
-            if last and now < datetime.datetime.fromisoformat(last) + FERTILIZE_COOLDOWN:
+            try:
+                on_cooldown = bool(last) and now < datetime.datetime.fromisoformat(last) + FERTILIZE_COOLDOWN
+            except Exception:
+                on_cooldown = False  # Date illisible : on ne bloque pas l’engrais
+            if on_cooldown:
                 return await interaction.response.send_message("⏳ Engrais en cooldown !", ephemeral=True)
 
-            self.parent_view.garden["garden_grid"] = pousser_fleurs(self.parent_view.garden["garden_grid"])
+            self.parent_view.garden["garden_grid"].grow()
             self.parent_view.garden["last_fertilize"] = now.isoformat()
-            supabase.table(TABLE_NAME).update({
-                "garden_grid": self.parent_view.garden["garden_grid"],
-                "last_fertilize": self.parent_view.garden["last_fertilize"]
-            }).eq("user_id", self.parent_view.user_id).execute()
+            garden_store.mark_dirty(self.parent_view.user_id, "garden_grid", "last_fertilize")
 
         # TODO : inventaire, alchimie, magasin
 
@@ -180,7 +122,7 @@ class Jardin2Cog(commands.Cog):
 
     @commands.command(name="jardin2")
     async def prefix_jardin2(self, ctx: commands.Context):
-        garden = await get_or_create_garden(ctx.author.id, ctx.author.name)
+        garden = await garden_store.get(ctx.author.id, ctx.author.name)
         view = Jardin2View(garden, ctx.author.id)
         await safe_send(ctx.channel, content=view.format_garden(), view=view)
 
@@ -17,7 +17,11 @@ import time
 import inspect
 import asyncio
 from utils import kawashima_games
-from utils.supabase_client import supabase
+from utils.supabase_client import supabase, run_db
+from utils.session_manager import session_manager, SessionRefused
+from utils.round_renderer import round_renderer
+from utils.leaderboard import kawashima_leaderboard
+from utils.kawashima_puzzles import puzzle_factory
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Table
@@ -34,7 +38,6 @@ class EntrainementCerebral(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.minijeux = []
-        self.active_sessions = set()
 
         for name, func in inspect.getmembers(kawashima_games, inspect.iscoroutinefunction):
             if not name.startswith("_"):
@@ -42,6 +45,10 @@ class EntrainementCerebral(commands.Cog):
                 titre = getattr(func, "title", func.__name__.replace("_", " ").title())
                 self.minijeux.append((f"{emoji} {titre}", func))
 
+    async def cog_load(self):
+        # Réserves d’énigmes remplies en arrière-plan (threads) dès le chargement
+        self._prefill = asyncio.create_task(puzzle_factory.fill_all())
+
     # ─────────── Commande texte ───────────
     @commands.command(
         name="entrainementcerebral",
@@ -75,15 +82,18 @@ class EntrainementCerebral(commands.Cog):
         guild = getattr(ctx_or_interaction, "guild", None)
         guild_id = guild.id if guild else None
 
-        if guild_id and guild_id in self.active_sessions:
-            return await (
-                ctx_or_interaction.send
-                if not isinstance(ctx_or_interaction, discord.Interaction)
-                else ctx_or_interaction.followup.send
-            )("⚠️ Un entraînement cérébral est déjà en cours sur ce serveur.", ephemeral=True)
-
+        # Une partie par serveur ; terminée par le finally ci-dessous (pas d’expiration)
         if guild_id:
-            self.active_sessions.add(guild_id)
+            try:
+                session_manager.open("kawashima", guild_id, ctx_or_interaction)
+            except SessionRefused as e:
+                message = "⚠️ Un entraînement cérébral est déjà en cours sur ce serveur." \
+                    if session_manager.get("kawashima", guild_id) else str(e)
+                return await (
+                    ctx_or_interaction.send
+                    if not isinstance(ctx_or_interaction, discord.Interaction)
+                    else ctx_or_interaction.followup.send
+                )(message, ephemeral=True)
 
         try:
             # ─────────── Contexte (texte ou slash) ───────────
@@ -206,26 +216,19 @@ class EntrainementCerebral(commands.Cog):
                 )
                 msg_game = await send(embed=game_embed)
 
+                # Le temps compte de l’affichage de la question à la réponse (round_renderer),
+                # pas des animations ni des éditions en file avant la question
                 start = time.time()
 
                 if multiplayer:
-                    # Tous les joueurs répondent librement
-                    def check(m):
-                        return m.author in active_players and m.channel == msg_game.channel
-
-                    winner = None
+                    # Une seule manche affichée ; le premier participant qui répond juste la remporte
+                    round_renderer.open(msg_game, players=[p.id for p in active_players])
                     try:
-                        while True:
-                            msg = await self.bot.wait_for("message", check=check, timeout=25)
-                            # Vérifie la réponse via le jeu
-                            success = await game(msg_game, game_embed, lambda: msg.author.id, self.bot, msg_override=msg)
-                            if success:
-                                winner = msg.author
-                                break
-                    except asyncio.TimeoutError:
-                        winner = None
-
-                    elapsed = round(time.time() - start, 2)
+                        success = await game(msg_game, game_embed, lambda: None)
+                        elapsed = round(round_renderer.elapsed(msg_game, start), 2)
+                    finally:
+                        timeline = round_renderer.pop(msg_game)
+                    winner = next((p for p in active_players if p.id == timeline.answered_by), None) if success else None
 
                     if winner:
                         score = 1000 + max(0, 500 - int(elapsed * 25))
@@ -248,8 +251,12 @@ class EntrainementCerebral(commands.Cog):
                 else:
                     # Mode solo classique
                     get_user_id = lambda: users[0].id
-                    success = await game(msg_game, game_embed, get_user_id, self.bot)
-                    elapsed = round(time.time() - start, 2)
+                    round_renderer.open(msg_game)
+                    try:
+                        success = await game(msg_game, game_embed, get_user_id)
+                        elapsed = round(round_renderer.elapsed(msg_game, start), 2)
+                    finally:
+                        round_renderer.pop(msg_game)
                     score = (1000 + max(0, 500 - int(elapsed * 25))) if success else 0
                     total_score[users[0].id] = total_score.get(users[0].id, 0) + score
                     results.setdefault(users[0].id, []).append((index, name, success, elapsed, score))
@@ -298,19 +305,21 @@ class EntrainementCerebral(commands.Cog):
 
                 # Sauvegarde score solo
                 if not multiplayer:
+                    timestamp = int(time.time())
                     try:
-                        supabase.table(TABLE_NAME).insert({
+                        await run_db(supabase.table(TABLE_NAME).insert({
                             "user_id": str(player.id),
                             "username": player.name,
                             "score": total,
-                            "timestamp": int(time.time())
-                        }).execute()
+                            "timestamp": timestamp
+                        }))
+                        kawashima_leaderboard.set((timestamp, player.id), total, player.name)
                     except Exception as e:
                         await send(f"⚠️ Impossible d'enregistrer le score : {e}")
 
         finally:
             if guild_id:
-                self.active_sessions.discard(guild_id)
+                session_manager.close("kawashima", guild_id)
 
     # ─────────── Classement global ───────────
     async def show_leaderboard(self, ctx_or_interaction):
@@ -319,21 +328,13 @@ class EntrainementCerebral(commands.Cog):
             description="Voici le classement global des meilleurs scores !",
             color=discord.Color.gold()
         )
-        try:
-            leaderboard = (
-                supabase.table(TABLE_NAME)
-                .select("username, score")
-                .order("score", desc=True)
-                .limit(10)
-                .execute()
-            )
-            entries = leaderboard.data if leaderboard and leaderboard.data else []
+        if await kawashima_leaderboard.ensure_loaded():
             top_text = "\n".join(
-                f"**{i+1}.** {entry['username']} — `{entry['score']:,}` pts"
-                for i, entry in enumerate(entries)
+                f"**{rank}.** {name} — `{score:,}` pts"
+                for rank, _, score, name in kawashima_leaderboard.top(10)
             ) or "*Aucun score enregistré pour le moment*"
-        except Exception as e:
-            top_text = f"⚠️ Erreur récupération classement : {e}"
+        else:
+            top_text = "⚠️ Erreur récupération classement."
 
         embed.add_field(name="Top 10", value=top_text, inline=False)
         if isinstance(ctx_or_interaction, discord.Interaction):
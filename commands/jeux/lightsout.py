@@ -9,10 +9,12 @@
 # 📦 Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
 import discord
-from discord.ext import commands, tasks
-import asyncio
+from discord.ext import commands
 import random
+import asyncio
 from utils.discord_utils import safe_send, safe_edit
+from utils.persistent_views import persistent_component, make_custom_id, detached
+from utils.session_manager import session_manager, SessionRefused
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Paramètres
@@ -44,6 +46,19 @@ class LightsOutGame:
         if self.check_win():
             self.terminee = True
 
+    def to_bits(self) -> int:
+        """Grille encodée sur un entier (bit y*size+x = lumière allumée)."""
+        return sum(1 << (y * self.size + x) for y in range(self.size) for x in range(self.size) if self.grid[y][x])
+
+    @classmethod
+    def from_bits(cls, bits: int, mode: str = "solo", size: int = TAILLE_GRILLE) -> "LightsOutGame":
+        game = cls.__new__(cls)
+        game.size = size
+        game.mode = mode
+        game.grid = [[bool(bits >> (y * size + x) & 1) for x in range(size)] for y in range(size)]
+        game.terminee = game.check_win()
+        return game
+
     def check_win(self) -> bool:
         """Retourne True si toutes les lumières sont éteintes."""
         return all(not cell for row in self.grid for cell in row)
@@ -63,65 +78,84 @@ class LightsOutGame:
 # 🎮 Classe LightsOutView (interface de jeu)
 # ────────────────────────────────────────────────────────────────────────────────
 class LightsOutView(discord.ui.View):
-    def __init__(self, game: LightsOutGame, parent_cog, channel_id: int, player_id: int | None = None):
+    """
+    Grille de boutons dont chaque custom_id porte tout l’état de la partie
+    ("lo:x:y:grille:mode:joueur") : la vue est détachée à l’envoi, chaque clic
+    est traité par on_light_click() sur la partie en cours, ou sur la partie
+    reconstruite depuis le bouton après un redémarrage.
+    """
+    def __init__(self, game: LightsOutGame, player_id: int | None = None):
         super().__init__(timeout=None)
         self.game = game
-        self.parent_cog = parent_cog
-        self.channel_id = channel_id
         self.player_id = player_id
         self.update_buttons()
 
     def update_buttons(self):
         """Met à jour les boutons selon l’état de la grille."""
         self.clear_items()
+        bits = self.game.to_bits()
         for y in range(self.game.size):
-            row = []
             for x in range(self.game.size):
                 style = (
                     discord.ButtonStyle.success if self.game.grid[y][x]
                     else discord.ButtonStyle.secondary
                 )
                 emoji = "🔆" if self.game.grid[y][x] else "⬛"
-                button = discord.ui.Button(
+                self.add_item(discord.ui.Button(
                     label=" ",
                     emoji=emoji,
                     style=style,
-                    custom_id=f"light_{x}_{y}",
-                )
-                button.callback = self.make_callback(x, y)
-                row.append(button)
-            for b in row:
-                self.add_item(b)
-
-    def make_callback(self, x: int, y: int):
-        async def callback(interaction: discord.Interaction):
-            session = self.parent_cog.sessions.get(self.channel_id)
-            if not session:
-                await interaction.response.send_message(
-                    "❌ Cette partie n'existe plus.", ephemeral=True
-                )
-                return
+                    custom_id=make_custom_id("lo", x, y, f"{bits:x}", self.game.mode, self.player_id or 0),
+                    disabled=self.game.terminee,
+                ))
 
-            # Mode solo : uniquement le joueur d'origine peut cliquer
-            if self.game.mode == "solo" and interaction.user.id != self.player_id:
-                await interaction.response.send_message(
-                    "❌ Seul le joueur ayant lancé la partie peut jouer en mode solo.",
-                    ephemeral=True
-                )
-                return
 
-            session.last_activity = asyncio.get_event_loop().time()
-            self.game.toggle(x, y)
-            self.update_buttons()
+_click_locks = {}  # channel_id -> asyncio.Lock (un clic à la fois par partie)
 
-            embed = self.game.get_embed()
-            await interaction.response.edit_message(embed=embed, view=self)
+@persistent_component("lo")
+async def on_light_click(interaction: discord.Interaction, args: list[str]):
+    x, y, bits, mode, player_id = int(args[0]), int(args[1]), int(args[2], 16), args[3], int(args[4])
+    channel_id = interaction.channel_id
 
-            if self.game.terminee:
-                await safe_send(interaction.channel, f"🎉 Bravo {interaction.user.mention} ! Toutes les lumières sont éteintes !")
-                self.parent_cog.sessions.pop(self.channel_id, None)
+    # Mode solo : uniquement le joueur d'origine peut cliquer
+    if mode == "solo" and interaction.user.id != player_id:
+        return await interaction.response.send_message(
+            "❌ Seul le joueur ayant lancé la partie peut jouer en mode solo.",
+            ephemeral=True
+        )
 
-        return callback
+    lock = _click_locks.setdefault(channel_id, asyncio.Lock())
+    async with lock:
+        # Partie remplacée ou expirée dans ce salon ; après un redémarrage, la partie reprend
+        session = session_manager.get("lightsout", channel_id)
+        if session and session.message is None:
+            return await interaction.response.send_message("⏳ La partie démarre, réessaie.", ephemeral=True)
+        if session and session.message.id != interaction.message.id:
+            return await interaction.response.send_message("❌ Cette partie n'existe plus.", ephemeral=True)
+
+        if session is not None:
+            # Partie vivante : deux clics rapprochés s’appliquent l’un après l’autre
+            game = session.game
+        else:
+            # Redémarrage : la grille est reprise depuis le bouton cliqué
+            game = LightsOutGame.from_bits(bits, mode=mode)
+            if not game.terminee:
+                try:
+                    open_session(LightsOutSession(game, interaction.message, mode=mode, author_id=player_id or None), channel_id)
+                except SessionRefused as e:
+                    return await interaction.response.send_message(str(e), ephemeral=True)
+        if game.terminee:
+            return await interaction.response.send_message("✅ Cette partie est déjà gagnée.", ephemeral=True)
+        session_manager.touch("lightsout", channel_id)
+
+        game.toggle(x, y)
+        view = LightsOutView(game, player_id=player_id or None)
+        await interaction.response.edit_message(embed=game.get_embed(), view=detached(view))
+
+        if game.terminee:
+            session_manager.close("lightsout", channel_id)
+    if game.terminee:
+        await safe_send(interaction.channel, f"🎉 Bravo {interaction.user.mention} ! Toutes les lumières sont éteintes !")
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧩 Classe LightsOutSession
@@ -131,9 +165,21 @@ class LightsOutSession:
         self.game = game
         self.message = message
         self.mode = mode
-        self.last_activity = asyncio.get_event_loop().time()
         self.author_id = author_id
 
+def open_session(session: LightsOutSession, channel_id: int):
+    return session_manager.open(
+        "lightsout", channel_id, session,
+        owner_id=session.author_id if session.mode == "solo" else None,
+        idle=INACTIVITE_MAX, on_expire=on_inactivite
+    )
+
+async def on_inactivite(session: LightsOutSession):
+    """Fin pour inactivité (appelée par le gestionnaire de sessions)."""
+    # Les boutons portent l’état : on les retire pour clore la partie
+    await safe_edit(session.message, view=None)
+    await safe_send(session.message.channel, "⏰ Partie terminée pour inactivité (3 minutes sans action).")
+
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
 # ────────────────────────────────────────────────────────────────────────────────
@@ -141,12 +187,7 @@ class LightsOut(commands.Cog):
     """Commande !lightsout — Jeu Lights Out interactif."""
 
     def __init__(self, bot: commands.Bot):
-        self.bot = bot
-        self.sessions = {}  # dict channel_id -> LightsOutSession
-        self.verif_inactivite.start()
-
-    def cog_unload(self):
-        self.verif_inactivite.cancel()
+        self.bot = bot  # Parties : session_manager, jeu "lightsout", clé = salon
 
     # ───────────────────────────────────────────────────────────────────────
     # 🎮 Commande principale
@@ -162,31 +203,22 @@ class LightsOut(commands.Cog):
             mode = "solo"
 
         channel_id = ctx.channel.id
-        if channel_id in self.sessions:
+        if session_manager.get("lightsout", channel_id):
             await safe_send(ctx.channel, "❌ Une partie est déjà en cours dans ce salon.")
             return
 
         game = LightsOutGame(mode=mode)
-        embed = game.get_embed()
-        view = LightsOutView(game, self, channel_id, player_id=ctx.author.id if mode == "solo" else None)
-        message = await safe_send(ctx.channel, embed=embed, view=view)
-        session = LightsOutSession(game, message, mode=mode, author_id=ctx.author.id)
-        self.sessions[channel_id] = session
+        session = LightsOutSession(game, None, mode=mode, author_id=ctx.author.id)
+        try:
+            open_session(session, channel_id)
+        except SessionRefused as e:
+            await safe_send(ctx.channel, str(e))
+            return
 
-    # ───────────────────────────────────────────────────────────────────────
-    # ⏰ Vérification d’inactivité
-    # ───────────────────────────────────────────────────────────────────────
-    @tasks.loop(seconds=30)
-    async def verif_inactivite(self):
-        now = asyncio.get_event_loop().time()
-        a_supprimer = []
-        for cid, session in list(self.sessions.items()):
-            if now - session.last_activity > INACTIVITE_MAX:
-                a_supprimer.append(cid)
-        for cid in a_supprimer:
-            session = self.sessions.pop(cid, None)
-            if session:
-                await safe_send(session.message.channel, "⏰ Partie terminée pour inactivité (3 minutes sans action).")
+        view = LightsOutView(game, player_id=ctx.author.id if mode == "solo" else None)
+        session.message = await safe_send(ctx.channel, embed=game.get_embed(), view=detached(view))
+        if session.message is None:
+            session_manager.close("lightsout", channel_id)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔌 Setup du Cog
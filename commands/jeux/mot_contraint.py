@@ -13,13 +13,8 @@ import discord, random
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Modal, TextInput, Button
-from spellchecker import SpellChecker
 from utils.discord_utils import safe_send, safe_respond, safe_edit
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Initialisation du SpellChecker français
-# ────────────────────────────────────────────────────────────────────────────────
-spell = SpellChecker(language='fr')
+from utils.french_dictionary import french_dict
 
 # ────────────────────────────────────────────────────────────────────────────────
 # ⚙️ Pondération des lettres (moins de chances pour les rares)
@@ -35,9 +30,10 @@ def weighted_random_letter() -> str:
     weights = list(FRENCH_LETTER_WEIGHTS.values())
     return random.choices(letters, weights=weights, k=1)[0]
 
-def is_valid_word(word: str) -> bool:
-    """Vérifie si le mot existe en français"""
-    return word.lower() in spell.word_frequency
+async def is_valid_word(word: str) -> bool:
+    """Vérifie si le mot existe en français (dictionnaire partagé, accents ignorés)"""
+    await french_dict.load()  # Chargé dans un thread : la boucle n’est jamais bloquée
+    return french_dict.contains(word)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ Modal de saisie du mot
@@ -94,7 +90,7 @@ class MotContraintView(View):
             return await safe_respond(interaction, f"❌ Le mot ne commence pas par `{self.start_letter}`.", ephemeral=True)
         if not word_clean.endswith(self.end_letter.lower()):
             return await safe_respond(interaction, f"❌ Le mot ne se termine pas par `{self.end_letter}`.", ephemeral=True)
-        if not is_valid_word(word_clean):
+        if not await is_valid_word(word_clean):
             return await safe_respond(interaction, f"❌ `{word}` n’est pas reconnu comme un mot français valide.", ephemeral=True)
 
         self.score += 1
@@ -153,6 +149,7 @@ class MotContraint(commands.Cog):
         start = weighted_random_letter()
         end = weighted_random_letter()
         view = MotContraintView(start, end, author_id)
+        french_dict.warmup()
         embed = view.build_embed()
         view.message = await safe_send(channel, embed=embed, view=view)
 
@@ -13,11 +13,12 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from utils.discord_utils import safe_send, safe_respond
-from utils.supabase_client import supabase
+from utils.supabase_client import supabase, run_db
+from utils.reiatsu_utils import add_points
+from utils.session_manager import session_manager, SessionRefused
 import json
 from pathlib import Path
-from datetime import datetime, timedelta
-import asyncio
+from datetime import datetime
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement des données JSON
@@ -34,8 +35,7 @@ class MotsSecretsMulti(commands.Cog):
     🎮 Jeu des Mots Secrets Multijoueur — Pendant 3 minutes, proposez des mots pour gagner du Reiatsu !
     """
     def __init__(self, bot: commands.Bot):
-        self.bot = bot
-        self.active_games = {}  # channel_id : end_time
+        self.bot = bot  # Parties : session_manager, jeu "motssecrets", clé = salon
 
     # ────────────────────────────────────────────────────────────
     # 🔧 Méthodes internes
@@ -45,12 +45,16 @@ class MotsSecretsMulti(commands.Cog):
 
     async def start_game(self, channel: discord.TextChannel):
         """Démarre un nouveau jeu de 3 minutes dans le channel."""
-        if channel.id in self.active_games:
-            await safe_send(channel, "⚠️ Un jeu est déjà en cours ici !")
+        # Fin automatique après 3 minutes (roue du gestionnaire de sessions, pas de tâche par partie)
+        try:
+            session_manager.open(
+                "motssecrets", channel.id, channel, ttl=180, on_expire=self.stop_game,
+                channel_id=channel.id, on_message=self.on_proposition, prefixes=(".", "*")
+            )
+        except SessionRefused as e:
+            await safe_send(channel, str(e))
             return
 
-        self.active_games[channel.id] = datetime.utcnow() + timedelta(minutes=3)
-
         embed = discord.Embed(
             title="📝 Jeu des Mots Secrets !",
             description=(
@@ -64,16 +68,11 @@ class MotsSecretsMulti(commands.Cog):
             color=discord.Color.green()
         )
         embed.set_footer(text="⏳ Le jeu se terminera automatiquement dans 3 minutes.")
-        await safe_send(channel, embed=embed)
-
-        # Fin automatique après 3 minutes
-        async def stop_later():
-            await asyncio.sleep(180)
-            if channel.id in self.active_games:
-                await safe_send(channel, "⏰ Le jeu des mots secrets est terminé !")
-                del self.active_games[channel.id]
+        if await safe_send(channel, embed=embed) is None:
+            session_manager.close("motssecrets", channel.id)
 
-        asyncio.create_task(stop_later())
+    async def stop_game(self, channel: discord.TextChannel):
+        await safe_send(channel, "⏰ Le jeu des mots secrets est terminé !")
 
     async def handle_guess(self, message: discord.Message):
         """Gère la vérification d’un mot proposé."""
@@ -87,7 +86,7 @@ class MotsSecretsMulti(commands.Cog):
         username = str(message.author)
 
         # Récupère les mots déjà trouvés
-        user_data = supabase.table("mots_trouves").select("*").eq("user_id", user_id).execute()
+        user_data = await run_db(supabase.table("mots_trouves").select("*").eq("user_id", user_id))
         if user_data.data:
             mots_trouves = user_data.data[0].get("mots") or []
             if isinstance(mots_trouves, str):
@@ -102,28 +101,19 @@ class MotsSecretsMulti(commands.Cog):
         # Ajoute le mot trouvé
         mots_trouves.append(mot_id)
         if user_data.data:
-            supabase.table("mots_trouves").update({
+            await run_db(supabase.table("mots_trouves").update({
                 "mots": mots_trouves,
                 "last_found_at": datetime.utcnow().isoformat()
-            }).eq("user_id", user_id).execute()
+            }).eq("user_id", user_id))
         else:
-            supabase.table("mots_trouves").insert({
+            await run_db(supabase.table("mots_trouves").insert({
                 "user_id": user_id,
                 "username": username,
                 "mots": mots_trouves
-            }).execute()
+            }))
 
         # Donne 10 Reiatsu
-        reiatsu_data = supabase.table("reiatsu").select("*").eq("user_id", user_id).execute()
-        if reiatsu_data.data:
-            points = reiatsu_data.data[0].get("points") or 0
-            supabase.table("reiatsu").update({"points": points + 10}).eq("user_id", user_id).execute()
-        else:
-            supabase.table("reiatsu").insert({
-                "user_id": user_id,
-                "username": username,
-                "points": 10
-            }).execute()
+        await add_points(user_id, 10, username=username, reason="mots_secrets")
 
         await message.reply(f"✅ Bravo {message.author.mention} ! Tu as trouvé un mot secret et gagnes **10 Reiatsu** 🎉")
 
@@ -148,16 +138,9 @@ class MotsSecretsMulti(commands.Cog):
         await self.start_game(ctx.channel)
 
     # ────────────────────────────────────────────────────────────
-    # 🎧 Événement : Proposition de mot
+    # 🎧 Proposition de mot (".mot" / "*mot", via le routeur de messages)
     # ────────────────────────────────────────────────────────────
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.author.bot:
-            return
-        if message.channel.id not in self.active_games:
-            return
-        if not (message.content.startswith(".") or message.content.startswith("*")):
-            return
+    async def on_proposition(self, message: discord.Message):
         mot_propose = message.content[1:]
         if not mot_propose.strip():
             return  # ignore les messages comme "." ou "*"
@@ -14,41 +14,21 @@ from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Modal, TextInput, Button
 import random
-import aiohttp
 import unicodedata
-from spellchecker import SpellChecker
 from utils.discord_utils import safe_send, safe_edit, safe_respond
+from utils.word_pool import word_pool
+from utils.french_dictionary import french_dict
+from utils.session_manager import session_manager, SessionRefused
 
-# ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Initialisation du spellchecker français
-# ────────────────────────────────────────────────────────────────────────────────
-spell = SpellChecker(language='fr')
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Fonction pour récupérer un mot français aléatoire
-# ────────────────────────────────────────────────────────────────────────────────
-async def get_random_french_word(length: int | None = None) -> str:
-    """Récupère un mot français aléatoire depuis l'API trouve-mot.fr"""
-    url = "https://trouve-mot.fr/api/random"
-    if length:
-        url += f"?size={length}"
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if isinstance(data, list) and len(data) > 0:
-                        return data[0]["name"].upper()
-    except Exception as e:
-        print(f"[ERREUR API Motus] {e}")
-    return "PYTHON"
+DUREE_PARTIE = 180  # Secondes avant la fin automatique d’une partie
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Fonction pour vérifier qu’un mot existe via SpellChecker
+# 🌐 Fonction pour vérifier qu’un mot existe (dictionnaire partagé)
 # ────────────────────────────────────────────────────────────────────────────────
-def is_valid_word(word: str) -> bool:
-    """Retourne True si le mot est reconnu par SpellChecker"""
-    return word.lower() in spell.word_frequency
+async def is_valid_word(word: str) -> bool:
+    """Retourne True si le mot est dans le dictionnaire français (accents ignorés)"""
+    await french_dict.load()  # Chargé dans un thread : la boucle n’est jamais bloquée
+    return french_dict.contains(word)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ Modal pour proposer un mot
@@ -75,7 +55,8 @@ class MotusModal(Modal):
 # ────────────────────────────────────────────────────────────────────────────────
 class MotusView(View):
     def __init__(self, target_word: str, max_attempts: int | None = None, author_id: int | None = None):
-        super().__init__(timeout=180)
+        # Pas de timeout discord.py : la fin automatique passe par le gestionnaire de sessions
+        super().__init__(timeout=None)
 
         # 🔤 Normalisation du mot (œ → oe) et retrait des tirets
         normalized = target_word.replace("Œ", "OE").replace("œ", "oe")
@@ -194,7 +175,7 @@ class MotusView(View):
         if len(filtered_guess) != self.display_length:
             return await safe_respond(interaction, f"⚠️ Le mot doit faire {self.display_length} lettres.", ephemeral=True)
 
-        if not is_valid_word(filtered_guess):
+        if not await is_valid_word(filtered_guess):
             return await safe_respond(interaction, f"❌ `{guess}` n’est pas reconnu comme un mot valide.", ephemeral=True)
 
         self.attempts.append({'word': guess.upper(), 'hint': False})
@@ -204,12 +185,24 @@ class MotusView(View):
             self.finished = True
             for child in self.children:
                 child.disabled = True
+            self.end_session()
 
         await safe_edit(self.message, embed=self.build_embed(), view=self)
         if not interaction.response.is_done():
             await interaction.response.defer(ephemeral=True)
 
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Comme l’ancien timeout de la View : chaque clic (proposition, indice) repousse la fin
+        session_manager.touch("motus", id(self))
+        return True
+
+    def end_session(self):
+        session_manager.close("motus", id(self))
+        self.stop()
+
     async def on_timeout(self):
+        """Fin automatique (appelée par le gestionnaire de sessions)."""
+        self.stop()
         if self.finished:
             return
         self.finished = True
@@ -264,6 +257,7 @@ class HintButton(Button):
             pv.finished = True
             for child in pv.children:
                 child.disabled = True
+            pv.end_session()
 
         await safe_edit(pv.message, embed=pv.build_embed(), view=pv)
         await interaction.response.send_message(f"🔎 Indice utilisé — lettre **{pv.target_word[idx]}** révélée.", ephemeral=True)
@@ -278,11 +272,23 @@ class Motus(commands.Cog):
 
     async def _start_game(self, channel: discord.abc.Messageable, author_id: int, mode: str = "solo"):
         length = random.choice(range(5, 9))
-        target_word = await get_random_french_word(length=length)
+        target_word = word_pool.get_word(length).upper()
+        french_dict.warmup()
         author_filter = None if mode.lower() in ("multi", "m") else author_id
         view = MotusView(target_word, max_attempts=None, author_id=author_filter)
+        try:
+            session_manager.open(
+                "motus", id(view), view,
+                owner_id=author_filter, idle=DUREE_PARTIE, on_expire=MotusView.on_timeout
+            )
+        except SessionRefused as e:
+            view.stop()
+            return await safe_send(channel, str(e))
         embed = view.build_embed()
         view.message = await safe_send(channel, embed=embed, view=view)
+        if view.message is None:
+            view.stop()
+            session_manager.close("motus", id(view))
 
     @app_commands.command(name="motus", description="Lance une partie de Motus (multi = tout le monde peut jouer)")
     @app_commands.describe(mode="Mode de jeu : solo ou multi")
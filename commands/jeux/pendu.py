@@ -9,10 +9,10 @@
 # 📦 Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
 import discord
-from discord.ext import commands, tasks
-import aiohttp
-import asyncio
+from discord.ext import commands
 from utils.discord_utils import safe_send, safe_edit, safe_respond  # ✅ Utilisation safe_
+from utils.word_pool import word_pool
+from utils.session_manager import session_manager, SessionRefused
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎨 Constantes et ASCII
@@ -88,7 +88,6 @@ class PenduSession:
         self.game = game
         self.message = message
         self.mode = mode  # "solo" ou "multi"
-        self.last_activity = asyncio.get_event_loop().time()  # ⏱️ Pour le timer
         if mode == "multi":
             self.players = set()
         else:
@@ -103,13 +102,7 @@ class Pendu(commands.Cog):
     """
 
     def __init__(self, bot: commands.Bot):
-        self.bot = bot
-        self.sessions = {}  # dict channel_id -> PenduSession
-        self.http_session = aiohttp.ClientSession()
-        self.verif_inactivite.start()
-
-    def cog_unload(self):
-        self.verif_inactivite.cancel()
+        self.bot = bot  # Parties : session_manager, jeu "pendu", clé = salon
 
     @commands.command(
         name="pendu",
@@ -122,64 +115,49 @@ class Pendu(commands.Cog):
             mode = "solo"
 
         channel_id = ctx.channel.id
-        if channel_id in self.sessions:
+        if session_manager.get("pendu", channel_id):
             await safe_send(ctx.channel, "❌ Une partie est déjà en cours dans ce salon.")
             return
 
-        mot = await self._fetch_random_word()
-        if not mot:
-            await safe_send(ctx.channel, "❌ Impossible de récupérer un mot, réessaie plus tard.")
-            return
+        mot = word_pool.get_word()
 
         game = PenduGame(mot, mode=mode)
-        embed = game.create_embed()
-        message = await safe_send(ctx.channel, embed=embed)
-
-        session = PenduSession(game, message, mode=mode, author_id=ctx.author.id)
-        self.sessions[channel_id] = session
-
-    async def _fetch_random_word(self) -> str | None:
-        url = "https://trouve-mot.fr/api/random/1"
+        session = PenduSession(game, None, mode=mode, author_id=ctx.author.id)
         try:
-            async with self.http_session.get(url) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-                return data[0]["name"].lower()
-        except Exception:
-            return None
+            # Réservé avant l’envoi : deux !pendu simultanés ne créent pas deux parties
+            session_manager.open(
+                "pendu", channel_id, session,
+                owner_id=ctx.author.id if mode == "solo" else None,
+                idle=INACTIVITE_MAX, on_expire=self.on_inactivite,
+                channel_id=channel_id, on_message=self.on_proposition
+            )
+        except SessionRefused as e:
+            await safe_send(ctx.channel, str(e))
+            return
+
+        session.message = await safe_send(ctx.channel, embed=game.create_embed())
+        if session.message is None:
+            session_manager.close("pendu", channel_id)
 
     # ───────────────────────────────────────────────────────────────────────
-    # 🔄 Vérification d’inactivité toutes les 30 secondes
+    # ⏰ Fin pour inactivité (appelée par le gestionnaire de sessions)
     # ───────────────────────────────────────────────────────────────────────
-    @tasks.loop(seconds=30)
-    async def verif_inactivite(self):
-        now = asyncio.get_event_loop().time()
-        a_supprimer = []
-
-        for channel_id, session in list(self.sessions.items()):
-            if now - session.last_activity > INACTIVITE_MAX:
-                a_supprimer.append(channel_id)
-
-        for cid in a_supprimer:
-            session = self.sessions.pop(cid, None)
-            if session:
-                await safe_send(
-                    session.message.channel,
-                    "⏰ Partie terminée pour inactivité (3 minutes sans réponse)."
-                )
+    async def on_inactivite(self, session: PenduSession):
+        await safe_send(
+            session.message.channel,
+            "⏰ Partie terminée pour inactivité (3 minutes sans réponse)."
+        )
 
     # ───────────────────────────────────────────────────────────────────────
-    # 💬 Réception des messages (propositions)
+    # 💬 Réception des messages (propositions, via le routeur de messages)
     # ───────────────────────────────────────────────────────────────────────
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.author.bot or not message.guild:
+    async def on_proposition(self, message: discord.Message):
+        if not message.guild:
             return
 
         channel_id = message.channel.id
-        session: PenduSession = self.sessions.get(channel_id)
-        if not session:
+        session: PenduSession = session_manager.get("pendu", channel_id)
+        if not session or session.message is None:
             return
 
         # Solo : uniquement le joueur qui a lancé la partie
@@ -191,7 +169,7 @@ class Pendu(commands.Cog):
         if len(content) != 1 or not content.isalpha():
             return
 
-        session.last_activity = asyncio.get_event_loop().time()  # 🔁 reset timer
+        session_manager.touch("pendu", channel_id)  # 🔁 reset timer
         game = session.game
         resultat = game.propose_lettre(content)
 
@@ -204,7 +182,7 @@ class Pendu(commands.Cog):
         try:
             await safe_edit(session.message, embed=embed)
         except discord.NotFound:
-            del self.sessions[channel_id]
+            session_manager.close("pendu", channel_id)
             await safe_send(message.channel, "❌ Partie annulée car le message du jeu a été supprimé.")
             return
 
@@ -212,12 +190,12 @@ class Pendu(commands.Cog):
 
         if resultat == "gagne":
             await safe_send(message.channel, f"🎉 Bravo {message.author.mention}, le mot `{game.mot}` a été deviné !")
-            del self.sessions[channel_id]
+            session_manager.close("pendu", channel_id)
             return
 
         if resultat == "perdu":
             await safe_send(message.channel, f"💀 Partie terminée ! Le mot était `{game.mot}`.")
-            del self.sessions[channel_id]
+            session_manager.close("pendu", channel_id)
             return
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -15,7 +15,7 @@ from discord.ext import commands
 from discord.ui import View, Modal, TextInput, Button
 from pathlib import Path
 from utils.discord_utils import safe_send
-from utils.supabase_client import supabase
+from utils.supabase_client import supabase, run_db
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement des énigmes
@@ -85,7 +85,7 @@ class PortesView(View):
 
         if normalized in valid_answers:
             # Récupération des données Supabase
-            data = supabase.table("reiatsu_portes").select("*").eq("user_id", interaction.user.id).execute()
+            data = await run_db(supabase.table("reiatsu_portes").select("*").eq("user_id", interaction.user.id))
             user_data = data.data[0] if data.data else None
             current_door = user_data["current_door"] if user_data else 1
             points = user_data["points"] if user_data else 0
@@ -99,17 +99,17 @@ class PortesView(View):
 
             # Mise à jour ou insertion Supabase
             if user_data:
-                supabase.table("reiatsu_portes").update({
+                await run_db(supabase.table("reiatsu_portes").update({
                     "current_door": next_door,
                     "points": points
-                }).eq("user_id", interaction.user.id).execute()
+                }).eq("user_id", interaction.user.id))
             else:
-                supabase.table("reiatsu_portes").insert({
+                await run_db(supabase.table("reiatsu_portes").insert({
                     "user_id": interaction.user.id,
                     "username": interaction.user.name,
                     "current_door": next_door,
                     "points": points
-                }).execute()
+                }))
 
             await interaction.response.send_message(
                 f"✅ Bonne réponse ! Tu passes à la porte {next_door} 🚪\n{reward_message}", ephemeral=True
@@ -152,7 +152,7 @@ class Portes(commands.Cog):
         return next((e for e in ENIGMES if e["id"] == door_id), None)
 
     async def _start_portes(self, channel, user):
-        data = supabase.table("reiatsu_portes").select("*").eq("user_id", user.id).execute()
+        data = await run_db(supabase.table("reiatsu_portes").select("*").eq("user_id", user.id))
         current_door = data.data[0]["current_door"] if data.data else 1
         enigme = self.get_enigme(current_door)
         if not enigme:
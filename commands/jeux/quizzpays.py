@@ -12,22 +12,37 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
-import aiohttp, random, asyncio
+import random, asyncio, time
 from utils.discord_utils import safe_send, safe_respond, safe_edit
+from utils.http_session import get_session
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧩 Fonctions utilitaires
 # ────────────────────────────────────────────────────────────────────────────────
-async def get_random_countries(n=4):
-    """Retourne n pays aléatoires valides depuis restcountries."""
-    url = "https://restcountries.com/v3.1/all?fields=name,flags,capital,cca2,region,currencies"
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, timeout=10) as r:
+COUNTRIES_URL = "https://restcountries.com/v3.1/all?fields=name,flags,capital,cca2,region,currencies"
+COUNTRIES_TTL = 24 * 3600  # La liste des pays change rarement : un appel par jour suffit
+_countries_cache = {"data": [], "fetched_at": 0.0}
+
+async def _get_valid_countries() -> list[dict]:
+    """Liste des pays valides, mise en cache (l’ancienne liste sert de secours si l’API échoue)."""
+    if _countries_cache["data"] and time.time() - _countries_cache["fetched_at"] < COUNTRIES_TTL:
+        return _countries_cache["data"]
+    try:
+        async with get_session().get(COUNTRIES_URL, timeout=10) as r:
             if r.status != 200:
                 raise RuntimeError(f"Erreur API : {r.status}")
             data = await r.json()
+    except Exception:
+        if _countries_cache["data"]:
+            return _countries_cache["data"]
+        raise
+    _countries_cache["data"] = [c for c in data if c.get("flags") and c.get("capital") and c.get("cca2")]
+    _countries_cache["fetched_at"] = time.time()
+    return _countries_cache["data"]
 
-    valid = [c for c in data if c.get("flags") and c.get("capital") and c.get("cca2")]
+async def get_random_countries(n=4):
+    """Retourne n pays aléatoires valides depuis restcountries."""
+    valid = await _get_valid_countries()
     if len(valid) < n:
         raise RuntimeError("Pas assez de pays valides récupérés.")
     return random.sample(valid, n)
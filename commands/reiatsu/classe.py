@@ -18,9 +18,9 @@ from dateutil import parser
 import json
 import os
 
-from utils.supabase_client import supabase
 from utils.discord_utils import safe_send, safe_respond, safe_edit
-from utils.reiatsu_utils import ensure_profile
+from utils.reiatsu_utils import ensure_profile, update_profile
+from utils.reiatsu_rules import ReiatsuRules
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement de la configuration Reiatsu
@@ -97,11 +97,11 @@ class ClassePageView(View):
     async def choose_class(self, interaction: discord.Interaction):
         nom, data = CLASSES[self.index]
         try:
-            nouveau_cd = 19 if nom == "Voleur" else 24
-            supabase.table("reiatsu").update({
+            nouveau_cd = ReiatsuRules.steal_cooldown(nom)
+            await update_profile(self.user_id, {
                 "classe": nom,
                 "steal_cd": nouveau_cd
-            }).eq("user_id", str(self.user_id)).execute()
+            })
 
             symbole = data.get("Symbole", "🌀")
             embed = discord.Embed(
@@ -140,15 +140,13 @@ class ChoisirClasse(commands.Cog):
     # ────────────────────────────────────────────────────────────────────────
     async def _verif_cooldown(self, user_id: int):
         """Empêche le changement de classe si skill en cours ou en cooldown."""
-        player = ensure_profile(user_id, "Unknown")  # auto création si nécessaire
+        player = await ensure_profile(user_id, "Unknown")  # auto création si nécessaire
         classe = player.get("classe", None)
         classe_data = self.config["CLASSES"].get(classe, {}) if classe else {}
         base_cd = classe_data.get("Cooldown", 12)
 
-        res = supabase.table("reiatsu").select("last_skilled_at, active_skill").eq("user_id", str(user_id)).execute()
-        user_data = res.data[0] if res.data else {}
-        last_skill = user_data.get("last_skilled_at")
-        active_skill = user_data.get("active_skill", False)
+        last_skill = player.get("last_skilled_at")
+        active_skill = player.get("active_skill", False)
 
         # Skill encore actif
         if active_skill:
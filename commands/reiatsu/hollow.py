@@ -14,8 +14,9 @@ from discord.ext import commands
 import os
 import traceback
 import asyncio
-from utils.supabase_client import supabase
+from utils.reiatsu_utils import get_profile, spend_points
 from utils.taches import lancer_3_taches
+from utils.render_scheduler import renderer
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Constantes
@@ -43,8 +44,8 @@ class Hollow(commands.Cog):
 
         # ───────── Vérif reiatsu ─────────
         try:
-            res = supabase.table("reiatsu").select("points").eq("user_id", user_id).execute()
-            reiatsu = res.data[0]["points"] if res.data else 0
+            data = await get_profile(user_id)
+            reiatsu = (data.get("points") or 0) if data else 0
         except Exception:
             traceback.print_exc()
             return await ctx.send("⚠️ Erreur lors de la vérification du reiatsu.")
@@ -78,10 +79,12 @@ class Hollow(commands.Cog):
 
             # Déduire le reiatsu
             try:
-                supabase.table("reiatsu").update({"points": reiatsu - REIATSU_COST}).eq("user_id", user_id).execute()
+                paid = await spend_points(user_id, REIATSU_COST, "hollow")
             except Exception:
                 traceback.print_exc()
                 return await ctx.send("⚠️ Erreur de mise à jour du reiatsu.")
+            if paid is None:
+                return await ctx.send(f"❌ Il te faut au moins {REIATSU_COST} reiatsu pour attaquer un Hollow.")
 
             # Combat : lancement des épreuves
             embed.title = "⚔️ Combat contre le Hollow"
@@ -93,7 +96,8 @@ class Hollow(commands.Cog):
             await interaction.edit_original_response(embed=embed, attachments=[], view=None)
 
             async def update_embed(e: discord.Embed):
-                await interaction.edit_original_response(embed=e)
+                # Éditions des épreuves regroupées par le planificateur (cadence bornée)
+                await renderer.submit(("hollow", interaction.id), interaction.edit_original_response, embed=e)
 
             embed.clear_fields()
             embed.add_field(name="Préparation...", value="Les épreuves vont commencer...", inline=False)
@@ -14,7 +14,8 @@ from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
 import random
-from utils.supabase_client import supabase
+from utils.supabase_client import supabase, run_db
+from utils.reiatsu_utils import get_profile, add_points, spend_points
 from utils.discord_utils import safe_send, safe_edit, safe_respond
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -103,13 +104,10 @@ class BetButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         """Déclenchement du ticket après avoir misé"""
-        reiatsu_points = await self.parent_view.parent._get_reiatsu(str(interaction.user.id))
-        if reiatsu_points < SCRATCH_COST:
+        # Vérification du solde et déduction en une seule requête
+        if not await self.parent_view.parent._spend_reiatsu(str(interaction.user.id), SCRATCH_COST):
             return await safe_respond(interaction, f"❌ Pas assez de Reiatsu ! Il te faut {SCRATCH_COST}.", ephemeral=True)
 
-        # Déduction des points
-        await self.parent_view.parent._update_reiatsu(str(interaction.user.id), reiatsu_points - SCRATCH_COST)
-
         # Supprimer le bouton Miser et ajouter les 10 boutons
         self.parent_view.clear_items()
         for i in range(NB_BUTTONS):
@@ -236,22 +234,29 @@ class ScratchKey(commands.Cog):
     # ───────────── Gestion Reiatsu ─────────────
     async def _get_reiatsu(self, user_id: str) -> int:
         try:
-            resp = supabase.table("reiatsu").select("points").eq("user_id", user_id).single().execute()
-            return resp.data["points"] if resp.data else 0
+            data = await get_profile(user_id)
+            return (data.get("points") or 0) if data else 0
         except Exception as e:
             print(f"[ERREUR Supabase _get_reiatsu] {e}")
             return 0
 
-    async def _update_reiatsu(self, user_id: str, new_points: int):
+    async def _add_reiatsu(self, user_id: str, delta: int):
         try:
-            supabase.table("reiatsu").update({"points": new_points}).eq("user_id", user_id).execute()
+            await add_points(user_id, delta, reason="ticket")
         except Exception as e:
-            print(f"[ERREUR Supabase _update_reiatsu] {e}")
+            print(f"[ERREUR Supabase _add_reiatsu] {e}")
+
+    async def _spend_reiatsu(self, user_id: str, cost: int) -> bool:
+        try:
+            return await spend_points(user_id, cost, "ticket") is not None
+        except Exception as e:
+            print(f"[ERREUR Supabase _spend_reiatsu] {e}")
+            return False
 
     # ───────────── Gestion Steam Keys ─────────────
     async def _get_all_steam_keys(self):
         try:
-            resp = supabase.table("steam_keys").select("*").eq("won", False).execute()
+            resp = await run_db(supabase.table("steam_keys").select("*").eq("won", False))
             return resp.data or []
         except Exception as e:
             print(f"[ERREUR Supabase _get_all_steam_keys] {e}")
@@ -259,7 +264,7 @@ class ScratchKey(commands.Cog):
 
     async def _mark_steam_key_won(self, key_id: int, winner: str):
         try:
-            supabase.table("steam_keys").update({"won": True, "winner": winner}).eq("id", key_id).execute()
+            await run_db(supabase.table("steam_keys").update({"won": True, "winner": winner}).eq("id", key_id))
         except Exception as e:
             print(f"[ERREUR Supabase _mark_steam_key_won] {e}")
 
@@ -292,14 +297,12 @@ class ScratchKey(commands.Cog):
 
     # ───────────── Gestion du résultat ─────────────
     async def _handle_result(self, interaction_or_ctx, result_type: str, user_id: str):
-        reiatsu_points = await self._get_reiatsu(user_id)
-
         if result_type == "jackpot":
-            await self._update_reiatsu(user_id, reiatsu_points + SCRATCH_COST * 2)
+            await self._add_reiatsu(user_id, SCRATCH_COST * 2)
             return  # Pas de clé Steam ici
 
         elif result_type == "key":
-            await self._update_reiatsu(user_id, reiatsu_points + SCRATCH_COST)
+            await self._add_reiatsu(user_id, SCRATCH_COST)
 
             keys_dispo = await self._get_all_steam_keys()
             if not keys_dispo:
@@ -17,8 +17,10 @@ from dateutil import parser
 from datetime import datetime, timedelta, timezone
 import time
 import os
-from utils.supabase_client import supabase
+from utils.supabase_repo import get_reiatsu_top, get_reiatsu_config
 from utils.discord_utils import safe_send, safe_respond
+from utils.persistent_views import persistent_component, make_custom_id, detached
+from utils.leaderboard import reiatsu_leaderboard
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Tables utilisées
@@ -59,34 +61,59 @@ SPAWN_SPEED_INTERVALS = {
 # 🎛️ Vue interactive Reiatsu (Classement + Lien Spawn)
 # ────────────────────────────────────────────────────────────────────────────────
 class ReiatsuView(View):
+    """
+    Vue sans état en mémoire : l’auteur est encodé dans le custom_id du bouton
+    et le clic est traité par classement_button() via le routeur persistant.
+    """
     def __init__(self, author: discord.Member = None, spawn_link: str = None):
         super().__init__(timeout=None)
-        self.author = author
+        self.add_item(Button(
+            label="📊 Classement",
+            style=discord.ButtonStyle.primary,
+            custom_id=make_custom_id("reiatsu", "classement", author.id if author else 0)
+        ))
         if spawn_link:
             self.add_item(Button(label="💠 Aller au spawn", style=discord.ButtonStyle.link, url=spawn_link))
 
-    @discord.ui.button(label="📊 Classement", style=discord.ButtonStyle.primary, custom_id="reiatsu:classement")
-    async def classement_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.author and interaction.user != self.author:
-            return await interaction.response.send_message("❌ Tu ne peux pas utiliser ce bouton.", ephemeral=True)
+
+@persistent_component("reiatsu")
+async def classement_button(interaction: discord.Interaction, args: list[str]):
+    # Anciens messages : "reiatsu:classement" sans auteur → bouton ouvert à tous
+    author_id = int(args[1]) if len(args) > 1 else 0
+    if author_id and interaction.user.id != author_id:
+        return await interaction.response.send_message("❌ Tu ne peux pas utiliser ce bouton.", ephemeral=True)
+
+    def display_name(user_id: int) -> str:
+        user = interaction.guild.get_member(user_id) if interaction.guild else None
+        return user.display_name if user else (reiatsu_leaderboard.name(user_id) or f"Utilisateur ({user_id})")
+
+    # Classement tenu en mémoire (chargé par la tâche leaderboard_sync) ; sinon lecture directe
+    if reiatsu_leaderboard.loaded:
+        classement_data = reiatsu_leaderboard.top(10)
+        shown = {e[1] for e in classement_data}
+        voisins = [e for e in reiatsu_leaderboard.around(interaction.user.id, 2) if e[1] not in shown]
+    else:
         try:
-            classement_data = supabase.table("reiatsu").select("user_id, points").order("points", desc=True).limit(10).execute()
+            rows = await get_reiatsu_top(10)
         except Exception as e:
             print(f"[ERREUR DB] Impossible de récupérer le classement : {e}")
             return await interaction.response.send_message("❌ Erreur lors du chargement du classement.", ephemeral=True)
-        if not classement_data.data:
-            return await interaction.response.send_message("⚠️ Aucun classement disponible pour le moment.", ephemeral=True)
-
-        description = ""
-        for i, entry in enumerate(classement_data.data, start=1):
-            user_id = int(entry["user_id"])
-            points = entry["points"]
-            user = interaction.guild.get_member(user_id) if interaction.guild else None
-            name = user.display_name if user else f"Utilisateur ({user_id})"
-            description += f"**{i}. {name}** — {points} points\n"
-
-        embed = discord.Embed(title="📊 Classement Reiatsu", description=description, color=discord.Color.purple())
-        await interaction.response.send_message(embed=embed)
+        classement_data = [(i, int(r["user_id"]), r["points"], None) for i, r in enumerate(rows, start=1)]
+        voisins = []
+    if not classement_data:
+        return await interaction.response.send_message("⚠️ Aucun classement disponible pour le moment.", ephemeral=True)
+
+    description = ""
+    for rank, user_id, points, _ in classement_data:
+        description += f"**{rank}. {display_name(user_id)}** — {points} points\n"
+    if voisins:
+        description += "\n**Autour de toi :**\n"
+        for rank, user_id, points, _ in voisins:
+            line = f"{rank}. {display_name(user_id)} — {points} points"
+            description += f"**{line}**\n" if user_id == interaction.user.id else f"{line}\n"
+
+    embed = discord.Embed(title="📊 Classement Reiatsu", description=description, color=discord.Color.purple())
+    await interaction.response.send_message(embed=embed)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -98,7 +125,6 @@ class ReiatsuCommand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.bot.add_view(ReiatsuView())
         self.user_cooldowns = {}
 
     async def _check_cooldown(self, user_id: int):
@@ -112,12 +138,11 @@ class ReiatsuCommand(commands.Cog):
     async def _send_server_info(self, channel_or_interaction, author, guild):
         guild_id = int(guild.id)
         try:
-            config_data = supabase.table("reiatsu_config").select("*").eq("guild_id", guild_id).execute()
+            config = await get_reiatsu_config(guild_id)
         except Exception as e:
             print(f"[ERREUR DB] Lecture config échouée : {e}")
             return await safe_send(channel_or_interaction, "❌ Erreur lors de la récupération de la configuration du serveur.")
 
-        config = config_data.data[0] if config_data and config_data.data else None
         salon_text, spawn_speed_text, temps_text, spawn_link = "❌", "⚠️ Inconnu", "⚠️ Inconnu", None
 
         if config:
@@ -156,7 +181,7 @@ class ReiatsuCommand(commands.Cog):
             color=discord.Color.purple()
         )
         embed.set_footer(text="💠 Utilise /reiatsuprofil pour ton profil personnel.")
-        view = ReiatsuView(author, spawn_link=spawn_link)
+        view = detached(ReiatsuView(author, spawn_link=spawn_link))
 
         if isinstance(channel_or_interaction, discord.Interaction):
             await channel_or_interaction.response.send_message(embed=embed, view=view)
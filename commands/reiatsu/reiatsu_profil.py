@@ -14,26 +14,17 @@ from discord import app_commands
 from discord.ext import commands
 from dateutil import parser
 from datetime import datetime, timedelta, timezone
-import os
-import json
 
-from utils.supabase_client import supabase
 from utils.discord_utils import safe_send, safe_respond
 from utils.reiatsu_utils import ensure_profile  # ✅ Ajout pour auto-création profil
+from utils.game_data import game_data
+from utils.leaderboard import reiatsu_leaderboard
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement des classes depuis JSON
 # ────────────────────────────────────────────────────────────────────────────────
-CONFIG_JSON_PATH = os.path.join("data", "reiatsu_config.json")
-
 def load_classes():
-    try:
-        with open(CONFIG_JSON_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("CLASSES", {})
-    except Exception as e:
-        print(f"[ERREUR JSON] Impossible de charger {CONFIG_JSON_PATH} : {e}")
-        return {}
+    return game_data.get("reiatsu_config", {}).get("CLASSES", {})
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -51,19 +42,13 @@ class ReiatsuProfil(commands.Cog):
         user = target_user or author
         user_id = int(user.id)
 
-        # ✅ Création automatique du profil si inexistant
-        ensure_profile(user_id, user.name)
-
-        # Récupération des données Reiatsu
+        # ✅ Récupération (et création automatique si inexistant) du profil Reiatsu
         try:
-            res = supabase.table("reiatsu").select(
-                "username, points, bonus5, classe, last_steal_attempt, steal_cd, last_skilled_at, active_skill"
-            ).eq("user_id", user_id).execute()
+            data = await ensure_profile(user_id, user.name)
         except Exception as e:
             print(f"[ERREUR DB] Lecture Reiatsu échouée : {e}")
             return await safe_send(channel_or_interaction, "❌ Impossible de récupérer ton profil.")
         
-        data = res.data[0] if res.data else {}
         if not data:
             return await safe_send(channel_or_interaction, "⚠️ Impossible de créer ton profil Reiatsu.")
         
@@ -137,10 +122,12 @@ class ReiatsuProfil(commands.Cog):
             color=discord.Color.purple()
         )
 
-        # Statistiques
+        # Statistiques (rang seulement si le classement en mémoire est chargé)
+        rank = reiatsu_leaderboard.rank(user_id) if reiatsu_leaderboard.loaded else None
+        rank_text = f"\n**Rang :** #{rank} / {len(reiatsu_leaderboard)}" if rank else ""
         embed.add_field(
             name="💠 Statistiques",
-            value=f"**Reiatsu :** {points}\n**Bonus :** +{bonus}%",
+            value=f"**Reiatsu :** {points}\n**Bonus :** +{bonus}%{rank_text}",
             inline=False
         )
 
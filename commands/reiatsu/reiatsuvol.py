@@ -14,10 +14,9 @@ from discord import app_commands
 from discord.ext import commands
 from datetime import datetime, timedelta, timezone
 from dateutil import parser
-from utils.supabase_client import supabase
 from utils.discord_utils import safe_send, safe_respond
-from utils.reiatsu_utils import ensure_profile  # ✅ Ajout pour auto-création profil
-import random
+from utils.reiatsu_utils import ensure_profile, update_profile, transfer, move, InsufficientReiatsu  # ✅ Profils via le cache
+from utils.reiatsu_rules import reiatsu_rules
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Tables utilisées
@@ -54,17 +53,12 @@ class ReiatsuVol(commands.Cog):
         voleur_id = int(voleur.id)
         cible_id = int(cible.id)
 
-        # ✅ Création automatique des profils si inexistants
-        ensure_profile(voleur_id, voleur.name)
-        ensure_profile(cible_id, cible.name)
-
-        # 📥 Récupération des données voleur
-        voleur_res = supabase.table("reiatsu").select("*").eq("user_id", voleur_id).execute()
-        if not voleur_res.data:
+        # 📥 Récupération des données voleur (cache des profils, création automatique si inexistant)
+        voleur_data = await ensure_profile(voleur_id, voleur.name)
+        if not voleur_data:
             await safe_send(channel, "⚠️ Données introuvables pour toi.")
             return
 
-        voleur_data = voleur_res.data[0]
         voleur_classe = voleur_data.get("classe")
         voleur_cd = voleur_data.get("steal_cd") or 24
 
@@ -90,12 +84,11 @@ class ReiatsuVol(commands.Cog):
                 print(f"[WARN] Impossible de parser last_steal_attempt pour {voleur_id}: {e}")
 
         # 📥 Récupération des données cible
-        cible_res = supabase.table("reiatsu").select("*").eq("user_id", cible_id).execute()
-        if not cible_res.data:
+        cible_data = await ensure_profile(cible_id, cible.name)
+        if not cible_data:
             await safe_send(channel, "⚠️ Données introuvables pour la cible.")
             return
 
-        cible_data = cible_res.data[0]
         voleur_points = voleur_data.get("points", 0) or 0
         cible_points = cible_data.get("points", 0) or 0
         cible_classe = cible_data.get("classe")
@@ -108,39 +101,37 @@ class ReiatsuVol(commands.Cog):
             await safe_send(channel, "⚠️ Tu dois avoir au moins **1 point** de Reiatsu pour tenter un vol.")
             return
 
-        # 🎲 Calcul du vol
-        montant = max(1, cible_points // 10)  # 10%
-
-        # 🔹 Si voleur a activé son skill → vol garanti + double récompense
-        if voleur_classe == "Voleur" and voleur_data.get("active_skill", False):
-            succes = True
-            montant *= 2  # 💥 double vol uniquement via le skill actif
-            try:
-                supabase.table("reiatsu").update({"active_skill": False}).eq("user_id", voleur_id).execute()
-            except Exception as e:
-                print(f"[WARN] Impossible de désactiver active_skill pour {voleur_id}: {e}")
-        else:
-            # Passif : vol normal avec proba 67% pour voleur, 25% pour les autres
-            if voleur_classe == "Voleur":
-                succes = random.random() < 0.67
-            else:
-                succes = random.random() < 0.25
+        # 🎲 Calcul du vol (10% de la cible ; skill Voleur actif → vol garanti et doublé ;
+        # passif : 67% pour un voleur, 25% pour les autres ; illusionniste : 50% de ne rien perdre)
+        succes, montant, illusion, skill_utilise = reiatsu_rules.roll_steal(
+            voleur_classe, voleur_data.get("active_skill", False), cible_classe, cible_points
+        )
 
         # Préparation du payload voleur (enregistre la tentative)
         payload_voleur = {"last_steal_attempt": now.isoformat()}
+        if skill_utilise:
+            payload_voleur["active_skill"] = False
 
         if succes:
-            payload_voleur["points"] = voleur_points + montant
-            supabase.table("reiatsu").update(payload_voleur).eq("user_id", voleur_id).execute()
+            moves = [move(voleur_id, montant, payload_voleur)]
+            if not illusion:
+                moves.append(move(cible_id, -montant))
+
+            # Gain du voleur et perte de la cible dans la même transaction
+            try:
+                await transfer(moves, "vol")
+            except InsufficientReiatsu:
+                # Aucun vol n’a eu lieu : seul le cooldown est enregistré, le skill reste actif
+                await update_profile(voleur_id, {"last_steal_attempt": payload_voleur["last_steal_attempt"]})
+                await safe_send(channel, f"😵 {cible.mention} n’a plus assez de Reiatsu : le vol de {voleur.mention} échoue !")
+                return
 
-            # Si cible est illusionniste et illusion active -> elle ne perd rien
-            if cible_classe == "Illusionniste" and random.random() < 0.5:
+            if illusion:
                 await safe_send(channel, f"🩸 {voleur.mention} a volé **{montant}** points à {cible.mention}... mais c'était une illusion, {cible.mention} n'a rien perdu !")
             else:
-                supabase.table("reiatsu").update({"points": max(0, cible_points - montant)}).eq("user_id", cible_id).execute()
                 await safe_send(channel, f"🩸 {voleur.mention} a réussi à voler **{montant}** points de Reiatsu à {cible.mention} !")
         else:
-            supabase.table("reiatsu").update(payload_voleur).eq("user_id", voleur_id).execute()
+            await update_profile(voleur_id, payload_voleur)
             await safe_send(channel, f"😵 {voleur.mention} a tenté de voler {cible.mention}... mais a échoué !")
 
     # ────────────────────────────────────────────────────────────────────────────
@@ -19,8 +19,9 @@ from datetime import datetime, timedelta, timezone
 import os
 import json
 from utils.discord_utils import safe_send, safe_respond
-from utils.supabase_client import supabase
-from utils.reiatsu_utils import ensure_profile, has_class
+from utils.supabase_repo import get_reiatsu_config
+from utils.reiatsu_utils import ensure_profile, has_class, update_profile, add_points, spend_points
+from utils.reiatsu_rules import reiatsu_rules, BET_COST, BET_GAIN
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement de la configuration Reiatsu
@@ -56,7 +57,7 @@ class Skill(commands.Cog):
 
         async with self.skill_locks[user.id]:
             # ✅ Création automatique du profil
-            player = ensure_profile(user.id, user.name)
+            player = await ensure_profile(user.id, user.name)
 
             # ❌ Si pas de classe
             if not has_class(player):
@@ -81,12 +82,10 @@ class Skill(commands.Cog):
             classe_data = self.config["CLASSES"].get(classe, {})
             base_cd = classe_data.get("Cooldown", 12)
 
-            # 🔹 Récupération du timestamp en base
-            res = supabase.table("reiatsu").select("last_skilled_at, active_skill, fake_spawn_id").eq("user_id", user.id).execute()
-            data = res.data[0] if res.data else {}
-            last_skill = data.get("last_skilled_at")
-            active_skill = data.get("active_skill", False)
-            fake_spawn_id = data.get("fake_spawn_id")
+            # 🔹 Timestamp du dernier skill (profil déjà en cache)
+            last_skill = player.get("last_skilled_at")
+            active_skill = player.get("active_skill", False)
+            fake_spawn_id = player.get("fake_spawn_id")
 
             cooldown_text = "✅ Disponible"
 
@@ -96,7 +95,7 @@ class Skill(commands.Cog):
                     last_dt = parser.parse(last_skill)
                     if not last_dt.tzinfo:
                         last_dt = last_dt.replace(tzinfo=timezone.utc)
-                    next_cd = last_dt + timedelta(hours=8 if classe == "Illusionniste" else base_cd)
+                    next_cd = last_dt + timedelta(hours=reiatsu_rules.skill_cd.get(classe, base_cd))
                     now_dt = datetime.now(timezone.utc)
                     if now_dt < next_cd:
                         restant = next_cd - now_dt
@@ -120,6 +119,7 @@ class Skill(commands.Cog):
 
             # 🔹 Activation du skill
             update_data = {"last_skilled_at": datetime.utcnow().isoformat()}
+            points_delta = 0
             msg = ""
 
             if classe == "Illusionniste":
@@ -128,15 +128,15 @@ class Skill(commands.Cog):
                     return
 
                 update_data["active_skill"] = True
-                supabase.table("reiatsu").update(update_data).eq("user_id", user.id).execute()
+                await update_profile(user.id, update_data)
 
                 # Vérification du salon de spawn configuré
-                conf_data = supabase.table("reiatsu_config").select("*").eq("guild_id", channel.guild.id).execute()
-                if not conf_data.data or not conf_data.data[0].get("channel_id"):
+                conf = await get_reiatsu_config(channel.guild.id)
+                if not conf or not conf.get("channel_id"):
                     await safe_send(channel, "❌ Aucun canal de spawn configuré pour ce serveur.")
                     return
 
-                spawn_channel = self.bot.get_channel(int(conf_data.data[0]["channel_id"]))
+                spawn_channel = self.bot.get_channel(int(conf["channel_id"]))
 
                 # Spawn du faux Reiatsu identique au vrai
                 cog = self.bot.get_cog("ReiatsuSpawner")
@@ -160,22 +160,23 @@ class Skill(commands.Cog):
                 msg = "🌀 **Super Absorption !** Le prochain Reiatsu sera forcément un Super Reiatsu."
 
             elif classe == "Parieur":
-                points = player.get("points", 0)
-                if points < 10:
-                    await safe_send(channel, "❌ Tu n'as pas assez de Reiatsu pour parier (10 requis).")
+                # Mise débitée atomiquement : refusée si le solde en base ne suffit plus
+                if await spend_points(user.id, BET_COST, "skill", update_data) is None:
+                    await safe_send(channel, f"❌ Tu n'as pas assez de Reiatsu pour parier ({BET_COST} requis).")
                     return
-                import random
-                gain = 30
-                if random.random() < 0.5:
-                    update_data["points"] = points - 10
-                    msg = "🎲 **Perdu !** Tu as perdu 10 Reiatsu."
+                update_data = {}  # Déjà écrit avec la mise
+                if reiatsu_rules.roll_bet() < 0:
+                    msg = f"🎲 **Perdu !** Tu as perdu {BET_COST} Reiatsu."
                 else:
-                    update_data["points"] = points - 10 + gain
-                    msg = f"🎲 **Gagné !** Tu as misé 10 Reiatsu et remporté **{gain}**."
+                    points_delta = BET_GAIN
+                    msg = f"🎲 **Gagné !** Tu as misé {BET_COST} Reiatsu et remporté **{BET_GAIN}**."
 
             # ✅ Mise à jour Supabase pour les autres classes
             if classe != "Illusionniste":
-                supabase.table("reiatsu").update(update_data).eq("user_id", user.id).execute()
+                if points_delta:
+                    await add_points(user.id, points_delta, update_data, reason="skill")
+                elif update_data:
+                    await update_profile(user.id, update_data)
                 embed = discord.Embed(
                     title=f"🎴 Skill de {player.get('username', user.name)}",
                     description=f"**Classe :** {classe}\n**Statut :** 🌀 En cours\n\n{msg}",
@@ -15,8 +15,10 @@ from discord.ext import commands
 from discord.ui import View, Button
 import random
 import asyncio
-from utils.discord_utils import safe_send, safe_respond, safe_edit
-from utils.supabase_client import supabase
+from utils.discord_utils import safe_send, safe_respond
+from utils.render_scheduler import queue_edit, safe_render
+from utils.supabase_client import supabase, run_db
+from utils.supabase_repo import get_voitures_user
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎮 Classe du bouton pour rejoindre la course
@@ -31,8 +33,7 @@ class JoinRaceButton(Button):
 
         # Récupération sûre des données utilisateur (Supabase)
         try:
-            res = supabase.table("voitures_users").select("*").eq("user_id", user_id).execute()
-            user_data = res.data[0] if res.data else None
+            user_data = await get_voitures_user(user_id)
         except Exception as e:
             print(f"[SUPABASE ERR get user] {e}")
             return await interaction.response.send_message("⚠️ Erreur base de données.", ephemeral=True)
@@ -46,7 +47,7 @@ class JoinRaceButton(Button):
 
         # Récupérer stats voiture
         try:
-            car_res = supabase.table("voitures_data").select("*").eq("nom", voiture_choisie).execute()
+            car_res = await run_db(supabase.table("voitures_data").select("*").eq("nom", voiture_choisie))
             car_data = car_res.data[0] if car_res.data else None
         except Exception as e:
             print(f"[SUPABASE ERR get car] {e}")
@@ -124,6 +125,8 @@ class JoinRaceButton(Button):
             })
 
         start_msg = await safe_send(channel, "🏎️ **La course commence !** Préparez-vous...")
+        if not start_msg:
+            return
         await asyncio.sleep(2.0)
         await self.run_race(channel, start_msg)
 
@@ -154,16 +157,11 @@ class JoinRaceButton(Button):
                 for i, p in enumerate(sorted_p)
             )
 
-            try:
-                await safe_edit(message, f"🏎️ **Course en cours...**\n{track_text}\n\n**Classement provisoire :**\n{leaderboard}")
-            except Exception as e:
-                print("[EDIT ERR]", e)
+            # Non bloquant : si Discord ralentit, seules les positions les plus récentes sont affichées
+            queue_edit(message, f"🏎️ **Course en cours...**\n{track_text}\n\n**Classement provisoire :**\n{leaderboard}")
 
         final = f"🏆 **Course terminée !**\nLe gagnant est **{winner['emoji']} {winner['username']}** avec sa **{winner['voiture']}** ! 🎉"
-        try:
-            await safe_edit(message, final)
-        except Exception:
-            await message.edit(content=final)
+        await safe_render(message, final)
 
     def render_track(self, participants, track_length):
         lines = []
@@ -12,22 +12,9 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import os, json
 
 from utils.discord_utils import safe_send
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 📂 Chargement des données JSON des voitures
-# ────────────────────────────────────────────────────────────────────────────────
-DATA_PATH = "data/voitures"
-
-def load_voitures():
-    voitures = []
-    for file in os.listdir(DATA_PATH):
-        if file.endswith(".json"):
-            with open(os.path.join(DATA_PATH, file), "r", encoding="utf-8") as f:
-                voitures.append(json.load(f))
-    return voitures
+from utils.game_data import game_data
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -38,13 +25,12 @@ class InfoVoitures(commands.Cog):
     """
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.voitures = load_voitures()
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Fonction pour afficher toutes les voitures (pagination 20 par page)
     # ────────────────────────────────────────────────────────────────────────────
     async def send_liste_voitures(self, channel):
-        voitures_sorted = sorted(self.voitures, key=lambda x: x["nom"])
+        voitures_sorted = game_data.cars()  # Déjà triées par nom
         pages = [voitures_sorted[i:i + 20] for i in range(0, len(voitures_sorted), 20)]
 
         class VoituresPaginator(discord.ui.View):
@@ -87,8 +73,9 @@ class InfoVoitures(commands.Cog):
     # 🔹 Fonction pour afficher une voiture spécifique
     # ────────────────────────────────────────────────────────────────────────────
     async def send_voiture_details(self, channel, nom_voiture):
-        voiture = next(
-            (v for v in self.voitures if nom_voiture.lower() in v["nom"].lower()), 
+        # Nom exact : accès direct à l’index, sinon recherche partielle
+        voiture = game_data.car(nom_voiture) or next(
+            (v for v in game_data.cars() if nom_voiture.lower() in v["nom"].lower()),
             None
         )
 
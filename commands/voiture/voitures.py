@@ -13,27 +13,19 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ui import View, Button
-import json, os, random
+import random
 from datetime import datetime, timedelta
 
 from utils.discord_utils import safe_send
-from utils.supabase_client import supabase
+from utils.game_data import game_data
+from utils.supabase_repo import get_voitures_user, insert_voitures_user, update_voitures_user
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 📂 Chargement des données JSON des voitures
+# 📂 Données des voitures (registre des données de jeu, chargé une seule fois)
 # ────────────────────────────────────────────────────────────────────────────────
-DATA_PATH = "data/voitures"
 COOLDOWN_VOITURE = 5 * 60       # 5 min
 COOLDOWN_ACHETER = 60 * 60      # 1h
 
-def load_voitures():
-    voitures = []
-    for file in os.listdir(DATA_PATH):
-        if file.endswith(".json"):
-            with open(os.path.join(DATA_PATH, file), "r", encoding="utf-8") as f:
-                voitures.append(json.load(f))
-    return voitures
-
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ UI — Bouton pour acheter une voiture
 # ────────────────────────────────────────────────────────────────────────────────
@@ -47,10 +39,9 @@ class VoitureButton(Button):
         if str(interaction.user.id) != str(self.user["user_id"]):
             return await interaction.response.send_message("❌ Ce bouton n'est pas pour toi !", ephemeral=True)
 
-        res = supabase.table("voitures_users").select("*").eq("user_id", str(self.user["user_id"])).execute()
-        if not res.data:
+        user_data = await get_voitures_user(self.user["user_id"])
+        if not user_data:
             return await interaction.response.send_message("⚠️ Erreur : utilisateur introuvable.", ephemeral=True)
-        user_data = res.data[0]
 
         # Cooldown achat
         last = user_data.get("last_acheter")
@@ -68,10 +59,10 @@ class VoitureButton(Button):
         voitures_user.add(self.voiture["nom"])
         voitures_user = sorted(voitures_user)
 
-        supabase.table("voitures_users").update({
+        await update_voitures_user(user_data["user_id"], {
             "voitures": voitures_user,
             "last_acheter": datetime.utcnow().isoformat()
-        }).eq("user_id", str(user_data["user_id"])).execute()
+        })
 
         self.disabled = True
         await interaction.response.edit_message(
@@ -90,22 +81,21 @@ class Voitures(commands.Cog):
     """
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.voitures = load_voitures()
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Récupération ou création d'un utilisateur Supabase
     # ────────────────────────────────────────────────────────────────────────────
     async def get_user(self, user: discord.User):
-        res = supabase.table("voitures_users").select("*").eq("user_id", str(user.id)).execute()
-        if res.data:
-            return res.data[0]
-        supabase.table("voitures_users").insert({
+        user_data = await get_voitures_user(user.id)
+        if user_data:
+            return user_data
+        await insert_voitures_user({
             "user_id": str(user.id),
             "username": str(user),
             "voitures": [],
             "last_voiture": None,
             "last_acheter": None
-        }).execute()
+        })
         return await self.get_user(user)
 
     # ────────────────────────────────────────────────────────────────────────────
@@ -122,12 +112,12 @@ class Voitures(commands.Cog):
                 return await safe_send(channel, f"⏳ Attends encore {h}h {m}m {s}s pour tirer une voiture.")
 
         owned_names = set(user.get("voitures", []))
-        available = [v for v in self.voitures if v["nom"] not in owned_names]
+        available = [v for v in game_data.cars() if v["nom"] not in owned_names]
         if not available:
             return await safe_send(channel, "🎉 Tu possèdes déjà toutes les voitures !")
 
         voiture = random.choice(available)
-        supabase.table("voitures_users").update({"last_voiture": datetime.utcnow().isoformat()}).eq("user_id", str(user["user_id"])).execute()
+        await update_voitures_user(user["user_id"], {"last_voiture": datetime.utcnow().isoformat()})
 
         embed = discord.Embed(
             title=f"{voiture['nom']} ({voiture['rarete']})",
@@ -258,9 +248,9 @@ class Voitures(commands.Cog):
         if not voiture_match:
             return await safe_send(channel, f"❌ Tu ne possèdes pas de voiture nommée `{voiture_nom}`.")
 
-        supabase.table("voitures_users").update({
+        await update_voitures_user(user_data["user_id"], {
             "voiture_choisie": voiture_match
-        }).eq("user_id", str(user_data["user_id"])).execute()
+        })
 
         embed = discord.Embed(
             title="🚘 Voiture sélectionnée",
@@ -0,0 +1,58 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 asset_sync.py — Préparation et entretien des URLs d’images
+# Objectif : Indexer data/images au démarrage, envoyer une fois les images sans
+#            URL dans le salon d’assets, puis rafraîchir les URLs signées avant
+#            qu’elles n’expirent
+# Catégorie : Général
+# Accès : Interne (aucune commande ici)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from discord.ext import commands, tasks
+from utils.instance_lease import is_leader
+from utils.asset_store import asset_store
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class AssetSyncTask(commands.Cog):
+    """
+    Premier passage : index + envoi des images manquantes. Ensuite, toutes les
+    6 heures, nouvelle URL pour celles qui expirent (sans renvoyer le fichier).
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.sync_task.start()
+
+    def cog_unload(self):
+        self.sync_task.cancel()
+
+    @commands.Cog.listener()
+    async def on_lease_acquired(self):
+        self.sync_task.restart()  # Relève : premier passage immédiat
+
+    @tasks.loop(hours=6)
+    async def sync_task(self):
+        if not is_leader(self.bot):
+            return  # Instance en attente : la boucle tourne sur l’instance maître
+        try:
+            if not asset_store.ready:
+                await asset_store.setup(self.bot)
+                await asset_store.warm()
+            else:
+                await asset_store.refresh_expiring()
+        except Exception as e:
+            print(f"[Assets] Synchronisation impossible → {e}")
+
+    @sync_task.before_loop
+    async def before_sync(self):
+        await self.bot.wait_until_ready()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    await bot.add_cog(AssetSyncTask(bot))
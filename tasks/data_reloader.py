@@ -0,0 +1,52 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 data_reloader.py — Rechargement à chaud des données de jeu
+# Objectif : Relire les JSON de data/ modifiés sur disque sans redémarrer le bot
+# Catégorie : Général
+# Accès : Interne (aucune commande ici)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from discord.ext import commands, tasks
+from utils.instance_lease import is_leader
+from utils.game_data import game_data
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class DataReloaderTask(commands.Cog):
+    """
+    Task qui vérifie toutes les 30 secondes si un JSON de data/ a changé
+    (un simple stat par fichier) et ne relit que ceux-là.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        game_data.reload_changed()  # Chargement initial
+        self.reload_task.start()
+
+    def cog_unload(self):
+        self.reload_task.cancel()
+
+    @commands.Cog.listener()
+    async def on_lease_acquired(self):
+        self.reload_task.restart()  # Relève : premier passage immédiat
+
+    @tasks.loop(seconds=30)
+    async def reload_task(self):
+        if not is_leader(self.bot):
+            return  # Instance en attente : la boucle tourne sur l’instance maître
+        changed = game_data.reload_changed()
+        if changed:
+            print(f"[DATA] Rechargé : {', '.join(changed)}")
+
+    @reload_task.before_loop
+    async def before_reload(self):
+        await self.bot.wait_until_ready()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    await bot.add_cog(DataReloaderTask(bot))
@@ -12,6 +12,8 @@ import discord
 from discord.ext import commands, tasks
 from datetime import datetime, timezone
 from utils.discord_utils import safe_send  # <-- Import safe_send
+from utils.supabase_repo import get_setting
+from utils.instance_lease import is_leader
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -23,19 +25,24 @@ class HeartbeatTask(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.supabase = bot.supabase
         self.heartbeat_channel_id = None
         self.heartbeat_task.start()
 
     def cog_unload(self):
         self.heartbeat_task.cancel()
 
+    @commands.Cog.listener()
+    async def on_lease_acquired(self):
+        self.heartbeat_task.restart()  # Relève : premier passage immédiat
+
     @tasks.loop(minutes=5)
     async def heartbeat_task(self):
+        if not is_leader(self.bot):
+            return  # Instance en attente : la boucle tourne sur l’instance maître
         # 🔒 Vérifie si le heartbeat est en pause
         try:
-            pause_res = self.supabase.table("bot_settings").select("value").eq("key", "heartbeat_paused").execute()
-            if pause_res.data and pause_res.data[0]["value"].lower() == "true":
+            paused = await get_setting("heartbeat_paused")
+            if paused and paused.lower() == "true":
                 print("[Heartbeat] Pausé — aucune action envoyée.")
                 return
         except Exception as e:
@@ -62,9 +69,8 @@ class HeartbeatTask(commands.Cog):
 
     async def load_heartbeat_channel(self):
         try:
-            resp = self.supabase.table("bot_settings").select("value").eq("key", "heartbeat_channel_id").execute()
-            if resp.data and len(resp.data) > 0:
-                val = resp.data[0]["value"]
+            val = await get_setting("heartbeat_channel_id")
+            if val is not None:
                 if val.isdigit():
                     self.heartbeat_channel_id = int(val)
                     print(f"[Heartbeat] Salon heartbeat chargé depuis Supabase : {self.heartbeat_channel_id}")
@@ -0,0 +1,56 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 leaderboard_sync.py — Chargement et resynchronisation des classements
+# Objectif : Lire les classements en base au démarrage, puis les relire de temps
+#            en temps pour rattraper les écritures faites hors du bot
+# Catégorie : Général
+# Accès : Interne (aucune commande ici)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from discord.ext import commands, tasks
+from utils.instance_lease import is_leader
+from utils.leaderboard import reiatsu_leaderboard, kawashima_leaderboard
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class LeaderboardSyncTask(commands.Cog):
+    """
+    Task qui recharge les classements en mémoire au démarrage puis toutes les
+    30 minutes. Entre deux passages, ils sont tenus à jour par add_points /
+    update_profile et l’enregistrement des scores.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.sync_task.start()
+
+    def cog_unload(self):
+        self.sync_task.cancel()
+
+    @commands.Cog.listener()
+    async def on_lease_acquired(self):
+        self.sync_task.restart()  # Relève : premier passage immédiat
+
+    @tasks.loop(minutes=30)
+    async def sync_task(self):
+        if not is_leader(self.bot):
+            return  # Instance en attente : la boucle tourne sur l’instance maître
+        for name, board in (("reiatsu", reiatsu_leaderboard), ("kawashima", kawashima_leaderboard)):
+            try:
+                await board.reload()
+                print(f"[Classement] {name} : {len(board)} entrées")
+            except Exception as e:
+                print(f"[Classement] Resynchronisation {name} impossible → {e}")
+
+    @sync_task.before_loop
+    async def before_sync(self):
+        await self.bot.wait_until_ready()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    await bot.add_cog(LeaderboardSyncTask(bot))
@@ -0,0 +1,57 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 reiatsu_ledger.py — Compaction du journal des points Reiatsu
+# Objectif : Regrouper chaque jour les vieux mouvements de reiatsu_ledger en une
+#            ligne par joueur pour que le journal ne grossisse pas sans fin
+# Catégorie : Reiatsu
+# Accès : Interne (aucune commande ici)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from discord.ext import commands, tasks
+from utils.instance_lease import is_leader
+from utils.supabase_repo import compact_reiatsu_ledger
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+KEEP_DAYS = 30          # Mouvements gardés en détail
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class ReiatsuLedgerTask(commands.Cog):
+    """Task quotidienne qui appelle la fonction SQL reiatsu_ledger_compact."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.compact_task.start()
+
+    def cog_unload(self):
+        self.compact_task.cancel()
+
+    @commands.Cog.listener()
+    async def on_lease_acquired(self):
+        self.compact_task.restart()  # Relève : premier passage immédiat
+
+    @tasks.loop(hours=24)
+    async def compact_task(self):
+        if not is_leader(self.bot):
+            return  # Instance en attente : la boucle tourne sur l’instance maître
+        try:
+            count = await compact_reiatsu_ledger(KEEP_DAYS)
+            if count:
+                print(f"[Reiatsu] Journal compacté : {count} joueur(s)")
+        except Exception as e:
+            print(f"[Reiatsu] Compaction du journal impossible → {e}")
+
+    @compact_task.before_loop
+    async def before_compact(self):
+        await self.bot.wait_until_ready()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ReiatsuLedgerTask(bot))
@@ -13,13 +13,19 @@ import discord
 import random
 import time
 import asyncio
+import heapq
 import json
 from datetime import datetime
 from dateutil import parser
 from pathlib import Path
-from discord.ext import commands, tasks
-from utils.supabase_client import supabase
+from discord.ext import commands
+from utils.supabase_repo import (
+    get_reiatsu_by_classe, get_all_reiatsu_configs, update_reiatsu_config
+)
+from utils.reiatsu_utils import get_profile, update_profile, add_points
 from utils.discord_utils import safe_send, safe_delete
+from utils.reiatsu_rules import reiatsu_rules, FAKE_REIATSU_GAIN
+from utils.instance_lease import is_leader
 
 # ────────────────────────────────────────────────────────────────────────────────
 # ⚙️ Paramètres globaux
@@ -29,9 +35,6 @@ with CONFIG_PATH.open("r", encoding="utf-8") as f:
     CONFIG = json.load(f)
 
 SPAWN_LOOP_INTERVAL = CONFIG["SPAWN_LOOP_INTERVAL"]
-SUPER_REIATSU_CHANCE = CONFIG["SUPER_REIATSU_CHANCE"]
-SUPER_REIATSU_GAIN = CONFIG["SUPER_REIATSU_GAIN"]
-NORMAL_REIATSU_GAIN = CONFIG["NORMAL_REIATSU_GAIN"]
 SPAWN_SPEED_RANGES = CONFIG["SPAWN_SPEED_RANGES"]
 DEFAULT_SPAWN_SPEED = CONFIG["DEFAULT_SPAWN_SPEED"]
 CLASSES = CONFIG["CLASSES"]
@@ -44,69 +47,147 @@ class ReiatsuSpawner(commands.Cog):
         self.bot = bot
         self.locks = {}
 
+        # ── Planificateur : tas (min-heap) des prochains spawns par serveur
+        self._heap = []               # (timestamp_du_spawn, guild_id)
+        self._due = {}                # guild_id -> (timestamp_du_spawn, channel_id)
+        self._configs = {}            # guild_id -> copie mémoire de la ligne reiatsu_config
+        self._fakes = {}              # message_id -> owner_id des faux Reiatsu actifs
+        self._wakeup = asyncio.Event()
+        self._loaded = asyncio.Event()
+        self._scheduler_task = None
+
     async def cog_load(self):
-        asyncio.create_task(self._check_on_startup())
-        self.spawn_loop.start()
+        self._scheduler_task = asyncio.create_task(self._scheduler_loop())
 
     def cog_unload(self):
-        self.spawn_loop.cancel()
+        if self._scheduler_task:
+            self._scheduler_task.cancel()
+
+    @commands.Cog.listener()
+    async def on_lease_acquired(self):
+        # L’ancienne instance maître a pu poster un spawn depuis notre démarrage
+        await self.reload()
 
     # ──────────────────────────────────────────────────────────────
-    async def _check_on_startup(self):
+    async def reload(self):
+        """Recharge les configurations et reconstruit le planning depuis la base."""
         await self.bot.wait_until_ready()
-        configs = supabase.table("reiatsu_config").select("*").execute()
-        for conf in configs.data:
-            if not conf.get("is_spawn") or not conf.get("message_id"):
-                continue
-            guild = self.bot.get_guild(int(conf["guild_id"]))
-            if not guild:
-                continue
-            channel = guild.get_channel(int(conf.get("channel_id") or 0))
-            if not channel:
-                continue
+        self._loaded.clear()
+        configs = await get_all_reiatsu_configs()
+        self._heap.clear()
+        self._due.clear()
+        self._configs.clear()
+        for conf in configs:
+            if conf.get("is_spawn") and conf.get("message_id"):
+                guild = self.bot.get_guild(int(conf["guild_id"]))
+                channel = guild.get_channel(int(conf.get("channel_id") or 0)) if guild else None
+                if channel:
+                    try:
+                        await channel.fetch_message(int(conf["message_id"]))
+                    except Exception:
+                        await update_reiatsu_config(int(conf["guild_id"]), {
+                            "is_spawn": False,
+                            "message_id": None
+                        })
+                        conf["is_spawn"] = False
+                        print(f"[RESET] Reiatsu fantôme nettoyé pour guild {conf['guild_id']}")
             try:
-                await channel.fetch_message(int(conf["message_id"]))
-            except Exception:
-                supabase.table("reiatsu_config").update({
-                    "is_spawn": False,
-                    "message_id": None
-                }).eq("guild_id", int(conf["guild_id"])).execute()
-                print(f"[RESET] Reiatsu fantôme nettoyé pour guild {conf['guild_id']}")
+                self.schedule_guild(conf)
+            except Exception as e:
+                print(f"[ERREUR planification] guild {conf.get('guild_id')} → {e}")
+
+        # Reconstruction de l’index des faux Reiatsu encore actifs
+        illusionnistes = await get_reiatsu_by_classe("Illusionniste")
+        self._fakes.clear()
+        for player in illusionnistes:
+            if player.get("fake_spawn_id"):
+                self._fakes[int(player["fake_spawn_id"])] = int(player["user_id"])
+        self._loaded.set()
+
+        # Faux Reiatsu restés en attente (skill activé mais spawn non effectué),
+        # postés uniquement par l’instance maître pour ne pas les dupliquer
+        if not is_leader(self.bot):
+            return
+        for conf in configs:
+            channel = self.bot.get_channel(int(conf["channel_id"])) if conf.get("channel_id") else None
+            if channel:
+                await self._spawn_faux_reiatsu(channel, illusionnistes)
+                break
 
     # ──────────────────────────────────────────────────────────────
-    @tasks.loop(seconds=SPAWN_LOOP_INTERVAL)
-    async def spawn_loop(self):
-        await self.bot.wait_until_ready()
-        if not getattr(self.bot, "is_main_instance", True):
-            return
-        try:
-            await self._spawn_tick()
-        except Exception as e:
-            print(f"[ERREUR spawn_loop] {e}")
-
-    async def _spawn_tick(self):
-        now = int(time.time())
-        configs = supabase.table("reiatsu_config").select("*").execute()
-        for conf in configs.data:
-            guild_id = int(conf["guild_id"])
-            channel_id = conf.get("channel_id")
-            if not channel_id:
+    # ⏱️ Planification des spawns
+    # ──────────────────────────────────────────────────────────────
+    @staticmethod
+    def _next_spawn_at(conf: dict):
+        """Timestamp du prochain spawn d’un serveur, ou None s’il n’y a rien à planifier."""
+        if not conf.get("channel_id") or conf.get("is_spawn"):
+            return None
+        last_spawn_str = conf.get("last_spawn_at")
+        if not last_spawn_str:
+            return time.time()
+        spawn_speed = conf.get("spawn_speed") or DEFAULT_SPAWN_SPEED
+        min_delay, max_delay = SPAWN_SPEED_RANGES.get(spawn_speed, SPAWN_SPEED_RANGES[DEFAULT_SPAWN_SPEED])
+        delay = conf.get("spawn_delay") or random.randint(min_delay, max_delay)
+        return int(parser.parse(last_spawn_str).timestamp()) + delay
+
+    def _schedule_at(self, guild_id: int, channel_id: int, due: float):
+        self._due[guild_id] = (due, channel_id)
+        heapq.heappush(self._heap, (due, guild_id))
+        self._wakeup.set()
+
+    def schedule_guild(self, conf: dict):
+        """(Re)planifie le prochain spawn d’un serveur à partir de sa ligne reiatsu_config."""
+        guild_id = int(conf["guild_id"])
+        self._configs[guild_id] = dict(conf)
+        due = self._next_spawn_at(conf)
+        if due is None:
+            self.unschedule_guild(guild_id)
+        else:
+            self._schedule_at(guild_id, int(conf["channel_id"]), due)
+
+    def unschedule_guild(self, guild_id: int):
+        """Retire un serveur du planning (les entrées du tas deviennent obsolètes)."""
+        self._due.pop(int(guild_id), None)
+
+    def forget_guild(self, guild_id: int):
+        """Oublie complètement un serveur (configuration supprimée)."""
+        self.unschedule_guild(guild_id)
+        self._configs.pop(int(guild_id), None)
+
+    async def _scheduler_loop(self):
+        """Dort jusqu’au prochain spawn dû ; coût proportionnel au nombre de spawns."""
+        await self._loaded.wait()
+        while True:
+            self._wakeup.clear()
+            # Purge des entrées obsolètes (serveur replanifié ou retiré)
+            while self._heap and self._due.get(self._heap[0][1], (None,))[0] != self._heap[0][0]:
+                heapq.heappop(self._heap)
+
+            timeout = self._heap[0][0] - time.time() if self._heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
                 continue
 
-            last_spawn_str = conf.get("last_spawn_at")
-            spawn_speed = conf.get("spawn_speed") or DEFAULT_SPAWN_SPEED
-            min_delay, max_delay = SPAWN_SPEED_RANGES.get(spawn_speed, SPAWN_SPEED_RANGES[DEFAULT_SPAWN_SPEED])
-            delay = conf.get("spawn_delay") or random.randint(min_delay, max_delay)
-            should_spawn = not last_spawn_str or (now - int(parser.parse(last_spawn_str).timestamp()) >= delay)
+            _, guild_id = heapq.heappop(self._heap)
+            _, channel_id = self._due.pop(guild_id)
+            try:
+                await self._spawn_due(guild_id, channel_id)
+            except Exception as e:
+                print(f"[ERREUR spawn_loop] {e}")
+                self._schedule_at(guild_id, channel_id, time.time() + SPAWN_LOOP_INTERVAL)
 
-            if should_spawn and not conf.get("is_spawn", False):
-                channel = self.bot.get_channel(int(channel_id))
-                if channel:
-                    await self._spawn_message(channel, guild_id)
+    async def _spawn_due(self, guild_id: int, channel_id: int):
+        retry_at = time.time() + SPAWN_LOOP_INTERVAL
+        if not getattr(self.bot, "is_main_instance", True) or not is_leader(self.bot):
+            return self._schedule_at(guild_id, channel_id, retry_at)
 
-            channel = self.bot.get_channel(int(channel_id))
-            if channel:
-                await self._spawn_faux_reiatsu(channel)
+        channel = self.bot.get_channel(channel_id)
+        message = await self._spawn_message(channel, guild_id) if channel else None
+        if not message:
+            self._schedule_at(guild_id, channel_id, retry_at)
 
     # ──────────────────────────────────────────────────────────────
     async def _spawn_message(self, channel, guild_id: int, is_fake=False, owner_id=None):
@@ -119,36 +200,37 @@ class ReiatsuSpawner(commands.Cog):
 
         message = await safe_send(channel, embed=embed)
         if not message:
-            return
+            return None
         try:
             await message.add_reaction("💠")
         except discord.HTTPException:
             pass
 
         if is_fake:
-            supabase.table("reiatsu").update({"fake_spawn_id": str(message.id)}).eq("user_id", owner_id).execute()
+            self._fakes[message.id] = int(owner_id)
+            await update_profile(owner_id, {"fake_spawn_id": str(message.id)})
             asyncio.create_task(self._delete_fake_after_delay(channel, message, owner_id))
         else:
-            supabase.table("reiatsu_config").update({
+            # Un Reiatsu est visible : plus rien à planifier jusqu’à sa capture
+            self.unschedule_guild(guild_id)
+            spawn_data = {
                 "is_spawn": True,
                 "last_spawn_at": datetime.utcnow().isoformat(timespec="seconds"),
                 "message_id": str(message.id)
-            }).eq("guild_id", guild_id).execute()
+            }
+            self._configs.setdefault(guild_id, {"guild_id": guild_id}).update(spawn_data)
+            await update_reiatsu_config(guild_id, spawn_data)
+        return message
 
     # ──────────────────────────────────────────────────────────────
     async def _delete_fake_after_delay(self, channel, message, owner_id):
         await asyncio.sleep(180)  # 3 minutes
-        
-        # Vérifie toujours que le fake existe encore
-        data = supabase.table("reiatsu").select("fake_spawn_id").eq("user_id", owner_id).execute()
-        if not data.data:
-            print(f"[FAKE] Aucun fake trouvé pour user {owner_id}")
-            return
-        
-        fake_id = data.data[0].get("fake_spawn_id")
-        if not fake_id:
-            print(f"[FAKE] Pas de fake_spawn_id enregistré pour user {owner_id}")
+
+        # Vérifie toujours que le fake existe encore (absent de l’index s’il a été absorbé)
+        if self._fakes.pop(message.id, None) is None:
+            print(f"[FAKE] Faux reiatsu {message.id} déjà absorbé pour user {owner_id}")
             return
+        fake_id = message.id
 
         try:
             # Refetch le message depuis Discord (objet original peut être expiré)
@@ -159,16 +241,17 @@ class ReiatsuSpawner(commands.Cog):
             print(f"[FAKE DELETE] Échec suppression message {fake_id} → {e}")
 
         # Nettoie la DB, même si le message n'existe plus
-        supabase.table("reiatsu").update({
+        await update_profile(owner_id, {
             "fake_spawn_id": None,
             "active_skill": False
-        }).eq("user_id", owner_id).execute()
+        })
 
 
     # ──────────────────────────────────────────────────────────────
-    async def _spawn_faux_reiatsu(self, channel: discord.TextChannel):
-        players = supabase.table("reiatsu").select("*").eq("classe", "Illusionniste").execute()
-        for player in players.data:
+    async def _spawn_faux_reiatsu(self, channel: discord.TextChannel, players: list | None = None):
+        if players is None:
+            players = await get_reiatsu_by_classe("Illusionniste")
+        for player in players:
             if player.get("active_skill") and not player.get("fake_spawn_id"):
                 await self._spawn_message(channel, guild_id=None, is_fake=True, owner_id=int(player["user_id"]))
 
@@ -177,16 +260,18 @@ class ReiatsuSpawner(commands.Cog):
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         if str(payload.emoji) != "💠" or payload.user_id == self.bot.user.id:
             return
+        if not is_leader(self.bot):
+            return  # Sinon l’instance en attente créditerait la capture une seconde fois
 
         guild_id = int(payload.guild_id)
         if guild_id not in self.locks:
             self.locks[guild_id] = asyncio.Lock()
 
         async with self.locks[guild_id]:
-            conf_data = supabase.table("reiatsu_config").select("*").eq("guild_id", guild_id).execute()
-            if not conf_data.data:
+            await self._loaded.wait()
+            conf = self._configs.get(guild_id)
+            if not conf:
                 return
-            conf = conf_data.data[0]
 
             guild = self.bot.get_guild(payload.guild_id)
             channel = guild.get_channel(payload.channel_id)
@@ -194,38 +279,32 @@ class ReiatsuSpawner(commands.Cog):
             if not channel or not user:
                 return
 
-            # ── Vérification faux Reiatsu
-            player_list = supabase.table("reiatsu").select("*").eq("classe", "Illusionniste").execute()
-            for p in player_list.data:
-                fake_id = p.get("fake_spawn_id")
-                if fake_id and payload.message_id == int(fake_id):
-                    owner_id = int(p["user_id"])
-                    if payload.user_id == owner_id:
-                        return  # L’illusionniste ne peut pas absorber son propre faux Reiatsu
-                    owner = guild.get_member(owner_id)
-                    if owner:
-                        gain = 50
-                        user_data = supabase.table("reiatsu").select("points").eq("user_id", owner_id).execute()
-                        current_points = user_data.data[0]["points"] if user_data.data else 0
-                        supabase.table("reiatsu").update({
-                            "points": current_points + gain,
-                            "fake_spawn_id": None,
-                            "active_skill": False
-                        }).eq("user_id", owner_id).execute()
-                        await safe_send(channel, f"🎭 {user.mention} a absorbé un **faux Reiatsu** ! {owner.mention} gagne **+{gain}** reiatsu !")
-                    try:
-                        msg = await channel.fetch_message(payload.message_id)
-                        await safe_delete(msg)
-                    except Exception:
-                        pass
-                    return
+            # ── Vérification faux Reiatsu (index mémoire, aucune requête)
+            owner_id = self._fakes.get(payload.message_id)
+            if owner_id is not None:
+                if payload.user_id == owner_id:
+                    return  # L’illusionniste ne peut pas absorber son propre faux Reiatsu
+                del self._fakes[payload.message_id]
+                owner = guild.get_member(owner_id)
+                if owner:
+                    gain = FAKE_REIATSU_GAIN
+                    await add_points(owner_id, gain, {"fake_spawn_id": None, "active_skill": False}, reason="faux_reiatsu")
+                    await safe_send(channel, f"🎭 {user.mention} a absorbé un **faux Reiatsu** ! {owner.mention} gagne **+{gain}** reiatsu !")
+                else:
+                    await update_profile(owner_id, {"fake_spawn_id": None, "active_skill": False})
+                try:
+                    msg = await channel.fetch_message(payload.message_id)
+                    await safe_delete(msg)
+                except Exception:
+                    pass
+                return
 
             # ── Reiatsu normal
             if not conf.get("is_spawn") or payload.message_id != int(conf.get("message_id")):
                 return
 
-            gain, is_super, bonus5, classe, new_total = self._calculate_gain(user.id)
-            self._update_player(user, gain, bonus5, new_total, classe)
+            gain, is_super, bonus5, classe, reset_skill = await self._calculate_gain(user.id)
+            await self._update_player(user, gain, bonus5, reset_skill)
             await self._send_feedback(channel, user, gain, is_super, classe)
 
             # Recalcule du delay
@@ -234,11 +313,12 @@ class ReiatsuSpawner(commands.Cog):
             new_delay = random.randint(min_delay, max_delay)
             msg_id = conf.get("message_id")
 
-            supabase.table("reiatsu_config").update({
+            await update_reiatsu_config(guild_id, {
                 "is_spawn": False,
                 "message_id": None,
                 "spawn_delay": new_delay
-            }).eq("guild_id", guild_id).execute()
+            })
+            self.schedule_guild({**conf, "is_spawn": False, "message_id": None, "spawn_delay": new_delay})
 
             try:
                 if msg_id:
@@ -248,57 +328,26 @@ class ReiatsuSpawner(commands.Cog):
                 print(f"[WARN] Impossible de delete message spawn {msg_id}: {e}")
 
     # ───────────────────────────────────────────────────────────────
-    def _calculate_gain(self, user_id: int, is_fake=False):
-        user_data = supabase.table("reiatsu").select("classe", "points", "bonus5", "active_skill").eq("user_id", user_id).execute()
-        if user_data.data:
-            classe = user_data.data[0].get("classe")
-            current_points = user_data.data[0].get("points", 0)
-            bonus5 = user_data.data[0].get("bonus5", 0) or 0
-            active_skill = user_data.data[0].get("active_skill", False)
+    async def _calculate_gain(self, user_id: int, is_fake=False):
+        user_data = await get_profile(user_id)
+        if user_data:
+            classe = user_data.get("classe")
+            bonus5 = user_data.get("bonus5", 0) or 0
+            active_skill = user_data.get("active_skill", False)
         else:
             classe = None
-            current_points = 0
             bonus5 = 0
             active_skill = False
 
-        if classe == "Absorbeur" and active_skill and not is_fake:
-            is_super = True
-            supabase.table("reiatsu").update({"active_skill": False}).eq("user_id", user_id).execute()
-        else:
-            is_super = random.randint(1, 100) <= SUPER_REIATSU_CHANCE
-
-        gain = SUPER_REIATSU_GAIN if is_super else NORMAL_REIATSU_GAIN
+        gain, is_super, bonus5, reset_skill = reiatsu_rules.roll_gain(classe, bonus5, active_skill, is_fake)
+        return gain, is_super, bonus5, classe, reset_skill
 
-        if not is_super:
-            if classe == "Absorbeur":
-                gain += 4
-            elif classe == "Parieur":
-                gain = 0 if random.random() < 0.5 else random.randint(5, 12)
-            elif classe == "Illusionniste":
-                pass
-            else:
-                bonus5 += 1
-                if bonus5 >= 5:
-                    gain = 6
-                    bonus5 = 0
-        else:
-            bonus5 = 0
-
-        return gain, is_super, bonus5, classe, current_points + gain
-
-    def _update_player(self, user, gain, bonus5, new_total, classe):
-        user_id = int(user.id)
-        user_data = supabase.table("reiatsu").select("user_id").eq("user_id", user_id).execute()
-        if user_data.data:
-            supabase.table("reiatsu").update({"points": new_total, "bonus5": bonus5}).eq("user_id", user_id).execute()
-        else:
-            supabase.table("reiatsu").insert({
-                "user_id": user_id,
-                "username": user.name,
-                "points": gain,
-                "classe": classe,
-                "bonus5": 1
-            }).execute()
+    async def _update_player(self, user, gain, bonus5, reset_skill):
+        """Une seule écriture : points + bonus5 (+ fin du skill actif) via l’incrément atomique."""
+        fields = {"bonus5": bonus5}
+        if reset_skill:
+            fields["active_skill"] = False
+        await add_points(user.id, gain, fields, username=user.name, reason="capture")
 
     async def _send_feedback(self, channel, user, gain, is_super, classe):
         if is_super:
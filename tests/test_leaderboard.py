@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from utils.leaderboard import Leaderboard
+
+
+def make_board(rows, maxsize=None):
+    async def loader():
+        return list(rows)
+    board = Leaderboard(loader, maxsize=maxsize)
+    asyncio.run(board.reload())
+    return board
+
+
+def test_ties_share_rank():
+    board = make_board([(1, 50, "a"), (2, 80, "b"), (3, 50, "c"), (4, 10, "d")])
+    assert board.rank(2) == 1
+    assert board.rank(1) == board.rank(3) == 2
+    assert board.rank(4) == 4
+    assert board.rank(99) is None
+
+
+def test_set_moves_key_up_and_down():
+    board = make_board([(1, 50, "a"), (2, 80, "b"), (3, 30, "c")])
+    board.set(3, 100)
+    assert board.rank(3) == 1 and board.rank(2) == 2
+    board.set(3, 0)
+    assert board.rank(3) == 3
+    assert len(board) == 3
+    assert board.name(3) == "c"                 # Le nom est gardé sans nouveau nom
+
+
+def test_top_pages_and_around():
+    board = make_board([(k, k * 10, f"j{k}") for k in range(1, 8)])
+    assert [key for _, key, _, _ in board.top(3)] == [7, 6, 5]
+    assert [key for _, key, _, _ in board.top(3, page=2)] == [1]
+    assert board.around(4, radius=1) == [(3, 5, 50, "j5"), (4, 4, 40, "j4"), (5, 3, 30, "j3")]
+    assert [key for _, key, _, _ in board.around(7, radius=2)] == [7, 6, 5]
+    assert board.around(99) == []
+
+
+def test_maxsize_keeps_best_scores():
+    board = make_board([(k, k, None) for k in range(1, 6)], maxsize=3)
+    assert [key for _, key, _, _ in board.top(10)] == [5, 4, 3]
+    board.set(9, 1)                             # Pas assez bon : ignoré
+    assert board.score(9) is None
+    board.set(8, 10)                            # Entre en tête, le dernier sort
+    assert [key for _, key, _, _ in board.top(10)] == [8, 5, 4]
+    assert board.score(3) is None
+
+
+def test_updates_during_reload_win_over_snapshot():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return [(1, 10, "a"), (2, 20, "b")]
+
+        board = Leaderboard(loader)
+        reload = asyncio.create_task(board.reload())
+        await asyncio.sleep(0)
+        board.set(1, 99, "a")                   # Gain arrivé pendant la lecture
+        release.set()
+        await reload
+        return board
+
+    board = asyncio.run(scenario())
+    assert board.score(1) == 99
+    assert board.rank(1) == 1
+
+
+def test_failed_load_is_reported():
+    async def loader():
+        raise ConnectionError("base injoignable")
+
+    board = Leaderboard(loader)
+    assert asyncio.run(board.ensure_loaded()) is False
+    assert board.loaded is False
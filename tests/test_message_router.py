@@ -0,0 +1,108 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from utils.message_router import MessageRouter
+
+CHANNEL = 42
+
+
+def message(content, channel_id=CHANNEL, author=1):
+    return SimpleNamespace(content=content, channel=SimpleNamespace(id=channel_id), author=SimpleNamespace(id=author))
+
+
+def test_route_only_receives_its_channel_and_prefix():
+    async def scenario():
+        router = MessageRouter()
+        received = []
+
+        async def handler(msg):
+            received.append(msg.content)
+
+        router.route(CHANNEL, handler, prefixes=("*",))
+        for content in ("*mot", "bonjour", "", "*autre"):
+            await router.dispatch(message(content))
+        await router.dispatch(message("*ailleurs", channel_id=7))
+        return received, router.stats()
+
+    received, stats = asyncio.run(scenario())
+    assert received == ["*mot", "*autre"]
+    assert stats["dispatched"] == 4             # Le salon 7 n’a aucun abonnement
+
+
+def test_route_without_prefix_receives_everything():
+    async def scenario():
+        router = MessageRouter()
+        received = []
+
+        async def handler(msg):
+            received.append(msg.content)
+
+        router.route(CHANNEL, handler)
+        for content in ("*mot", "bonjour", ""):
+            await router.dispatch(message(content))
+        return received
+
+    assert asyncio.run(scenario()) == ["*mot", "bonjour", ""]
+
+
+def test_unroute_cleans_up_the_channel():
+    async def scenario():
+        router = MessageRouter()
+
+        async def handler(msg):
+            raise AssertionError("ne doit plus être appelé")
+
+        route = router.route(CHANNEL, handler, prefixes=(".", "*"))
+        router.unroute(route)
+        await router.dispatch(message(".mot"))
+        return router.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["channels"] == 0 and stats["routes"] == 0
+
+
+def test_wait_for_returns_first_accepted_message():
+    async def scenario():
+        router = MessageRouter()
+        waiter = asyncio.create_task(router.wait_for(CHANNEL, check=lambda m: m.author.id == 2))
+        await asyncio.sleep(0)
+        await router.dispatch(message("pas moi", author=1))
+        await router.dispatch(message("réponse", author=2))
+        await router.dispatch(message("trop tard", author=2))
+        return await waiter, router.stats()
+
+    msg, stats = asyncio.run(scenario())
+    assert msg.content == "réponse"
+    assert stats["routes"] == 0                 # Abonnement retiré après la réponse
+
+
+def test_wait_for_timeout_unroutes():
+    async def scenario():
+        router = MessageRouter()
+        with pytest.raises(asyncio.TimeoutError):
+            await router.wait_for(CHANNEL, timeout=0.01)
+        return router.stats()
+
+    assert asyncio.run(scenario())["routes"] == 0
+
+
+def test_failing_handler_does_not_block_others():
+    async def scenario():
+        router = MessageRouter()
+        received = []
+
+        async def broken(msg):
+            raise RuntimeError("boum")
+
+        async def handler(msg):
+            received.append(msg.content)
+
+        router.route(CHANNEL, broken, prefixes=("!",))       # Appelé en premier
+        router.route(CHANNEL, handler, prefixes=("!",))
+        router.route(CHANNEL, handler, prefixes=(".",))
+        await router.dispatch(message("!jeu"))
+        return received
+
+    assert asyncio.run(scenario()) == ["!jeu"]
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("discord")
+
+from utils.discord_utils import RateLimiter, COSMETIC_RESERVE, CHANNEL_LIMIT
+
+CHANNEL = 42
+
+
+def test_reaction_burst_does_not_starve_send():
+    async def scenario():
+        limiter = RateLimiter()
+        reactions = [asyncio.create_task(limiter.acquire(("add_reaction", CHANNEL), "cosmetic"))
+                     for _ in range(20)]
+        await asyncio.sleep(1.0)                # La rafale tourne depuis 1 s
+
+        start = time.monotonic()
+        await limiter.acquire(("send", CHANNEL))
+        send_wait = time.monotonic() - start
+
+        shared = limiter.buckets[("channel", CHANNEL)]
+        done = sum(task.done() for task in reactions)
+        for task in reactions:
+            task.cancel()
+        return send_wait, done, shared
+
+    send_wait, done, shared = asyncio.run(scenario())
+    assert send_wait < 0.05
+    assert 0 < done < 20                        # Les réactions avancent, mais sont freinées
+    assert shared.tokens >= COSMETIC_RESERVE - 1 - 1e-6
+
+
+def test_reaction_waits_while_channel_is_busy():
+    async def scenario():
+        limiter = RateLimiter()
+        for _ in range(CHANNEL_LIMIT[0]):
+            await limiter.acquire(("send", CHANNEL))
+        start = time.monotonic()
+        await limiter.acquire(("add_reaction", CHANNEL), "cosmetic")
+        return time.monotonic() - start
+
+    expected = (1 + COSMETIC_RESERVE) * CHANNEL_LIMIT[1] / CHANNEL_LIMIT[0]
+    assert asyncio.run(scenario()) >= expected * 0.9
+
+
+def test_interaction_is_never_queued():
+    async def scenario():
+        limiter = RateLimiter()
+        for _ in range(10):
+            await limiter.acquire(("send_message", CHANNEL), "interaction")
+        return limiter.queued
+
+    assert asyncio.run(scenario()) == 0
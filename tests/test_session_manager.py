@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from utils.session_manager import SessionManager, SessionRefused
+
+TICK = 1.0
+
+
+class FakeClock:
+    """Remplace loop.time() : le temps n’avance que par advance()."""
+
+    def __init__(self, loop):
+        self.now = 1000.0
+        loop.time = lambda: self.now
+
+    async def advance(self, seconds: float):
+        # Seconde par seconde, pour que la roue tourne comme en vrai
+        steps = int(seconds / TICK)
+        for _ in range(steps):
+            self.now += TICK
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+
+def run(scenario):
+    async def main():
+        clock = FakeClock(asyncio.get_running_loop())
+        manager = SessionManager(tick=TICK, slots=8)
+        try:
+            return await scenario(manager, clock)
+        finally:
+            if manager._task:
+                manager._task.cancel()
+    return asyncio.run(main())
+
+
+def test_idle_session_expires_after_inactivity():
+    expired = []
+
+    async def on_expire(data):
+        expired.append(data)
+
+    async def scenario(manager, clock):
+        manager.open("pendu", 1, "partie", idle=10, on_expire=on_expire)
+        await clock.advance(9)
+        alive = manager.get("pendu", 1)
+        await clock.advance(3)
+        return alive, manager.get("pendu", 1), manager.stats()
+
+    alive, after, stats = run(scenario)
+    assert alive == "partie"
+    assert after is None
+    assert expired == ["partie"]
+    assert stats["expired"] == 1 and stats["live"] == 0
+
+
+def test_touch_postpones_idle_but_not_ttl():
+    async def scenario(manager, clock):
+        manager.open("idle", 1, "a", idle=10)
+        manager.open("ttl", 1, "b", idle=10, ttl=15)
+        for _ in range(3):
+            await clock.advance(6)
+            manager.touch("idle", 1)
+            manager.touch("ttl", 1)
+        return manager.get("idle", 1), manager.get("ttl", 1)
+
+    idle, ttl = run(scenario)
+    assert idle == "a"          # Touchée toutes les 6 s : jamais inactive 10 s
+    assert ttl is None          # Durée totale de 15 s dépassée malgré l’activité
+
+
+def test_deadline_beyond_one_wheel_turn():
+    async def scenario(manager, clock):
+        manager.open("motus", 1, "partie", ttl=20)     # 20 s > 8 cases de 1 s
+        await clock.advance(12)
+        alive = manager.get("motus", 1)
+        await clock.advance(10)
+        return alive, manager.get("motus", 1)
+
+    alive, after = run(scenario)
+    assert alive == "partie"
+    assert after is None
+
+
+def test_closed_session_does_not_expire():
+    expired = []
+
+    async def on_expire(data):
+        expired.append(data)
+
+    async def scenario(manager, clock):
+        manager.open("pendu", 1, "partie", idle=5, on_expire=on_expire)
+        manager.close("pendu", 1)
+        await clock.advance(10)
+        return manager.stats()
+
+    stats = run(scenario)
+    assert expired == []
+    assert stats["expired"] == 0
+
+
+def test_duplicate_session_is_refused():
+    async def scenario(manager, clock):
+        manager.open("pendu", 42, "première", owner_id=7)
+        with pytest.raises(SessionRefused):
+            manager.open("pendu", 42, "seconde")
+        manager.open("motus", 42, "autre jeu")        # Même salon, autre jeu : accepté
+        return manager.get("pendu", 42), manager.get_by_user("pendu", 7), manager.stats()
+
+    data, by_user, stats = run(scenario)
+    assert data == by_user == "première"
+    assert stats["refused"] == 1 and stats["live"] == 2
+
+
+def test_global_cap_refuses_new_sessions():
+    async def scenario(manager, clock):
+        for key in range(manager.max_sessions):
+            manager.open("pendu", key, key)
+        with pytest.raises(SessionRefused):
+            manager.open("motus", "un de trop", None)
+        manager.close("pendu", 0)
+        manager.open("motus", "un de trop", None)      # Une place libérée
+        return manager.stats()
+
+    stats = run(scenario)
+    assert stats["live"] == 500
+    assert stats["refused"] == 1
+
+
+def test_per_game_limit():
+    async def scenario(manager, clock):
+        manager.open("anagramme", 1, None, limit=2)
+        manager.open("anagramme", 2, None, limit=2)
+        with pytest.raises(SessionRefused):
+            manager.open("anagramme", 3, None, limit=2)
+        manager.open("pendu", 3, None, limit=2)
+        return manager.stats()["by_kind"]
+
+    assert run(scenario) == {"anagramme": 2, "pendu": 1}
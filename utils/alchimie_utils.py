@@ -0,0 +1,129 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 alchimie_utils.py — Table des recettes d’alchimie
+# Objectif : Précalculer, à partir de FLEUR_VALUES / FLEUR_SIGNS, quelles potions
+#            sont réalisables et avec quelles fleurs au minimum, pour répondre
+#            à « que puis-je concocter ? » sans essais à l’aveugle
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import threading
+from functools import lru_cache
+from itertools import product
+from utils.jardin_utils import FLEUR_NAMES, FLEUR_SIGNS, FLEUR_VALUES, POTIONS
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+MAX_FLOWERS = 6         # Longueur maximale des recettes explorées (6^6 mélanges)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚗️ Règles de mélange
+# ────────────────────────────────────────────────────────────────────────────────
+def apply_flower(value: int, flower: str) -> int:
+    """Valeur du mélange après ajout d’une fleur (+, - ou ×, × sur 0 = valeur de la fleur)."""
+    sign = FLEUR_SIGNS[flower]
+    val = FLEUR_VALUES[flower]
+    if sign == "+":
+        return value + val
+    if sign == "-":
+        return value - val
+    if sign == "×":
+        return value * val if value != 0 else val
+    return value
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📖 Table des recettes
+# ────────────────────────────────────────────────────────────────────────────────
+class AlchemyTable:
+    """
+    Toutes les suites de MAX_FLOWERS fleurs au plus sont évaluées une fois, dans
+    un thread au chargement du cog jardin (voir build()). Pour chaque potion, on garde les combinaisons minimales
+    (aucune autre n’utilise moins de chaque fleur), avec un ordre d’ajout qui
+    marche, de la moins chère à la plus chère.
+    """
+
+    def __init__(self, max_flowers: int = MAX_FLOWERS):
+        self.max_flowers = max_flowers
+        self._lock = threading.Lock()
+        self._recipes: dict[int, list[tuple]] | None = None   # valeur -> [(quantités, ordre)]
+
+    # ──────────────────────────────────────────────────────────────
+    def _build(self):
+        index = {name: k for k, name in enumerate(FLEUR_NAMES)}
+        found: dict[int, dict[tuple, tuple]] = {}   # valeur -> {quantités: ordre}
+
+        # Parcours en largeur : les suites courtes sont vues avant les longues
+        for length in range(1, self.max_flowers + 1):
+            for seq in product(FLEUR_NAMES, repeat=length):
+                value = 0
+                for flower in seq:
+                    value = apply_flower(value, flower)
+                if str(value) not in POTIONS:
+                    continue
+                counts = [0] * len(FLEUR_NAMES)
+                for flower in seq:
+                    counts[index[flower]] += 1
+                found.setdefault(value, {}).setdefault(tuple(counts), seq)
+
+        recipes = {}
+        for value, combos in found.items():
+            ordered = sorted(combos.items(), key=lambda c: (sum(c[0]), c[0]))
+            minimal = []
+            for counts, seq in ordered:
+                # On écarte les combinaisons qui en contiennent une plus petite
+                if not any(all(a <= b for a, b in zip(m, counts)) for m, _ in minimal):
+                    minimal.append((counts, seq))
+            recipes[value] = minimal
+        self._recipes = recipes
+
+    def _ensure_built(self):
+        if self._recipes is None:
+            with self._lock:
+                if self._recipes is None:
+                    self._build()
+
+    async def build(self):
+        """Construit la table hors de la boucle d’événements (~0,2 s de calcul)."""
+        await asyncio.to_thread(self._ensure_built)
+
+    # ──────────────────────────────────────────────────────────────
+    def recipes(self, potion_value: int) -> list[tuple]:
+        """Recettes minimales d’une potion : [(ordre des fleurs), ...], la moins chère d’abord."""
+        self._ensure_built()
+        return [seq for _, seq in self._recipes.get(int(potion_value), [])]
+
+    def cheapest(self, potion_value: int) -> tuple | None:
+        recipes = self.recipes(potion_value)
+        return recipes[0] if recipes else None
+
+    def reachable_values(self) -> list[int]:
+        """Valeurs de potion réalisables avec un inventaire illimité."""
+        self._ensure_built()
+        return sorted(self._recipes)
+
+    def brewable(self, inventory: dict) -> dict[str, tuple]:
+        """{potion: ordre des fleurs} de tout ce qui est réalisable avec cet inventaire."""
+        self._ensure_built()
+        # Au-delà de max_flowers, une fleur de plus ne change rien : la clé reste petite
+        key = tuple(min(int(inventory.get(f, 0) or 0), self.max_flowers) for f in FLEUR_NAMES)
+        return self._brewable(key)
+
+    @lru_cache(maxsize=4096)
+    def _brewable(self, key: tuple) -> dict[str, tuple]:
+        result = {}
+        for value in sorted(self._recipes):
+            for counts, seq in self._recipes[value]:
+                if all(c <= k for c, k in zip(counts, key)):
+                    result[POTIONS[str(value)]] = seq
+                    break
+        return result
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+alchemy_table = AlchemyTable()
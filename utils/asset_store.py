@@ -0,0 +1,213 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 asset_store.py — URLs Discord des images locales (data/images)
+# Objectif : Envoyer chaque image une seule fois dans un salon d’assets privé,
+#            garder l’URL du CDN (clé : hash du contenu, table asset_urls) et
+#            la mettre dans les embeds au lieu de renvoyer le fichier à chaque
+#            affichage ou changement de page
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import hashlib
+import os
+import time
+from urllib.parse import urlparse, parse_qs
+
+import discord
+
+from utils.discord_utils import safe_send
+from utils.supabase_repo import get_asset_urls, upsert_asset_url
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+IMAGE_ROOT = os.path.join("data", "images")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+REFRESH_MARGIN = 6 * 3600       # URL signée rafraîchie s’il lui reste moins de 6 h
+
+def _hash_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _expires_at(url: str) -> float | None:
+    """Fin de validité d’une URL signée du CDN (paramètre ex=, hexadécimal)."""
+    ex = parse_qs(urlparse(url).query).get("ex")
+    try:
+        return int(ex[0], 16) if ex else None
+    except ValueError:
+        return None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Store
+# ────────────────────────────────────────────────────────────────────────────────
+class AssetStore:
+    """
+    Index chemin → hash de data/images (fait une fois au démarrage) et
+    hash → ligne asset_urls {hash, filename, channel_id, message_id, url}.
+    Sans salon d’assets (ASSET_CHANNEL_ID) ou en cas d’erreur, url() renvoie
+    None et les commandes joignent le fichier comme avant.
+    """
+
+    def __init__(self, root: str = IMAGE_ROOT):
+        self.root = root
+        self.bot = None
+        self.channel_id = 0
+        self._hashes: dict[str, str] = {}
+        self._rows: dict[str, dict] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._pending = set()           # Envois lancés par set_image
+        self.ready = False
+
+    # ──────────────────────────────────────────────────────────────
+    def _index(self) -> dict[str, str]:
+        hashes = {}
+        for folder, _, files in os.walk(self.root):
+            for name in files:
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    path = os.path.normpath(os.path.join(folder, name))
+                    hashes[path] = _hash_file(path)
+        return hashes
+
+    async def setup(self, bot):
+        """Indexe data/images et charge les URLs déjà connues."""
+        self.bot = bot
+        self.channel_id = int(os.getenv("ASSET_CHANNEL_ID", "0") or 0)
+        self._hashes = await asyncio.to_thread(self._index)
+        try:
+            self._rows = {row["hash"]: row for row in await get_asset_urls()}
+        except Exception as e:
+            print(f"[Assets] Lecture de asset_urls impossible → {e}")
+        self.ready = True
+        print(f"[Assets] {len(self._hashes)} image(s) indexée(s), {len(self._rows)} URL(s) connue(s)")
+
+    async def warm(self):
+        """Envoie dans le salon d’assets les images qui n’ont pas encore d’URL."""
+        for path in list(self._hashes):
+            await self.url(path)
+
+    async def refresh_expiring(self):
+        """Rafraîchit les URLs qui expirent bientôt (sans renvoyer les fichiers)."""
+        for digest, row in list(self._rows.items()):
+            if self._is_stale(row):
+                async with self._lock(digest):
+                    await self._refresh(digest, row)
+
+    # ──────────────────────────────────────────────────────────────
+    def _lock(self, digest: str) -> asyncio.Lock:
+        return self._locks.setdefault(digest, asyncio.Lock())
+
+    @staticmethod
+    def _is_stale(row: dict) -> bool:
+        expires = _expires_at(row.get("url") or "")
+        return expires is not None and expires - time.time() < REFRESH_MARGIN
+
+    async def _channel(self):
+        if not self.bot or not self.channel_id:
+            return None
+        return self.bot.get_channel(self.channel_id) or await self.bot.fetch_channel(self.channel_id)
+
+    async def _save(self, row: dict):
+        self._rows[row["hash"]] = row
+        try:
+            await upsert_asset_url(row)
+        except Exception as e:
+            print(f"[Assets] Sauvegarde de {row['filename']} impossible → {e}")
+
+    async def _refresh(self, digest: str, row: dict) -> str | None:
+        """Nouvelle URL signée du même message ; renvoi du fichier s’il a disparu."""
+        channel = await self._channel()
+        if channel is None:
+            return None
+        try:
+            message = await channel.fetch_message(int(row["message_id"]))
+            url = message.attachments[0].url
+        except (discord.NotFound, IndexError):
+            return None
+        await self._save({**row, "url": url})
+        return url
+
+    async def _upload(self, path: str, digest: str) -> str | None:
+        channel = await self._channel()
+        if channel is None:
+            return None
+        filename = os.path.basename(path)
+        message = await safe_send(channel, content=f"`{digest[:12]}` {path}",
+                                  file=discord.File(path, filename=filename))
+        if not message or not message.attachments:
+            return None
+        url = message.attachments[0].url
+        await self._save({
+            "hash": digest,
+            "filename": filename,
+            "channel_id": channel.id,
+            "message_id": message.id,
+            "url": url,
+        })
+        return url
+
+    # ──────────────────────────────────────────────────────────────
+    async def url(self, path: str) -> str | None:
+        """URL du CDN pour une image locale (envoyée au premier appel seulement)."""
+        if not self.ready or not self.channel_id:
+            return None
+        path = os.path.normpath(path)
+        digest = self._hashes.get(path)
+        if digest is None:
+            if not os.path.exists(path):
+                return None
+            digest = self._hashes[path] = await asyncio.to_thread(_hash_file, path)
+
+        row = self._rows.get(digest)
+        if row and not self._is_stale(row):
+            return row["url"]
+
+        try:
+            async with self._lock(digest):
+                row = self._rows.get(digest)        # Un autre appel a pu le faire entre-temps
+                if row and not self._is_stale(row):
+                    return row["url"]
+                if row:
+                    url = await self._refresh(digest, row)
+                    if url:
+                        return url
+                return await self._upload(path, digest)
+        except Exception as e:
+            print(f"[Assets] URL de {path} indisponible → {e}")
+            return None
+
+    def cached_url(self, path: str) -> str | None:
+        """URL déjà connue et encore valable, sans attendre Discord ni la base."""
+        digest = self._hashes.get(os.path.normpath(path))
+        row = self._rows.get(digest) if digest else None
+        return row["url"] if row and not self._is_stale(row) else None
+
+    def set_image(self, embed: discord.Embed, path: str, thumbnail: bool = False) -> discord.File | None:
+        """
+        Met l’image dans l’embed sans jamais attendre un envoi. Renvoie None si
+        l’URL est connue, sinon le discord.File à joindre (attachment://) ;
+        l’image part alors en arrière-plan dans le salon d’assets.
+        """
+        setter = embed.set_thumbnail if thumbnail else embed.set_image
+        url = self.cached_url(path)
+        if url:
+            setter(url=url)
+            return None
+        if self.ready and self.channel_id:
+            task = asyncio.create_task(self.url(path))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+        filename = os.path.basename(path)
+        setter(url=f"attachment://{filename}")
+        return discord.File(path, filename=filename)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+asset_store = AssetStore()
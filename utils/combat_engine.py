@@ -0,0 +1,316 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 combat_engine.py — Moteur de combat sans Discord
+# Objectif : Jouer les combats de /combat sur un état compact par combattant,
+#            avec un générateur aléatoire injectable, et enchaîner des milliers
+#            de combats (sur plusieurs processus) pour équilibrer
+#            data/personnages/*.json et data/combat.json
+# Catégorie : Utils
+# Accès : Interne (python -m utils.combat_engine --help)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import argparse
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from utils.game_data import game_data, thaw
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+MAX_TURNS = 50          # Au-delà : match nul
+DEFAULT_PP = 10         # PP d’une attaque sans champ "PP"
+EVOLVE_CHANCE = 0.15    # Passage à la forme suivante après une attaque
+CRIT_CHANCE = 0.0625
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗡️ Attaques et fiches compilées
+# ────────────────────────────────────────────────────────────────────────────────
+class Move:
+    __slots__ = ("nom", "type", "categorie", "puissance", "statut", "has_statut", "pp")
+
+    def __init__(self, nom, type_, categorie, puissance, statut=None, pp=DEFAULT_PP, has_statut=True):
+        self.nom = nom
+        self.type = type_
+        self.categorie = categorie
+        self.puissance = puissance
+        self.statut = statut
+        self.has_statut = has_statut    # Champ "statut" présent (même null) : remplace celui de la cible
+        self.pp = pp
+
+    @classmethod
+    def from_dict(cls, a) -> "Move":
+        return cls(a["nom"], a.get("type"), a.get("categorie"), a.get("puissance", 0),
+                   a.get("statut"), a.get("PP", DEFAULT_PP), "statut" in a)
+
+TACLE = Move("Tacle", "Normal", "Offensive", 40, None, 1, has_statut=False)   # Quand plus aucune attaque n’a de PP
+
+class Character:
+    """Fiche personnage réduite à ce que le combat utilise (construite une fois, partagée)."""
+    __slots__ = ("nom", "type", "attaque", "defense", "rapidite", "max_pv", "formes", "image")
+
+    def __init__(self, data):
+        stats = data["stats_base"]
+        self.nom = data["nom"]
+        self.type = data.get("type")
+        self.attaque = stats["attaque"]
+        self.defense = stats["defense"]
+        self.rapidite = stats["rapidite"]
+        self.max_pv = stats["total_stats"] // 3
+        self.formes = tuple(
+            (name, tuple(Move.from_dict(a) for a in forme["attaques"]))
+            for name, forme in data["formes"].items()
+        )
+        self.image = data.get("image")
+
+class Fighter:
+    """État d’un combattant pendant un combat."""
+    __slots__ = ("char", "nom", "type", "pv", "boost_atk", "boost_def", "boost_rap",
+                 "statut", "sleep_turns", "forme", "pp")
+
+    def __init__(self, char: Character):
+        self.char = char
+        self.nom = char.nom
+        self.type = char.type
+        self.pv = char.max_pv
+        self.boost_atk = 0
+        self.boost_def = 0
+        self.boost_rap = 0
+        self.statut = None
+        self.sleep_turns = 0
+        self.forme = 0
+        self.pp = [[m.pp for m in moves] for _, moves in char.formes]
+
+    @property
+    def forme_name(self) -> str:
+        return self.char.formes[self.forme][0]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Moteur
+# ────────────────────────────────────────────────────────────────────────────────
+class CombatEngine:
+    """
+    Règles de /combat. `log` (liste ou None) reçoit le récit du combat ; sans
+    récit, aucun texte n’est construit. `rng` : random.Random(seed) pour
+    rejouer un combat à l’identique.
+    """
+
+    def __init__(self, data=None, rng=random, max_turns: int = MAX_TURNS):
+        data = data or game_data.get("combat")
+        self.type_eff = data["type_effectiveness"]
+        self.type_emoji = data["types_emoji"]
+        self.categorie_emoji = data["categories_emoji"]
+        self.statuts = data["statuts"]
+        self.rng = rng
+        self.max_turns = max_turns
+
+    # ──────────────────────────────────────────────────────────────
+    def status_skip(self, f: Fighter, log) -> bool:
+        """Effet du statut en début d’action ; True si le combattant perd son tour."""
+        if not f.statut:
+            return False
+        rng = self.rng
+        s = self.statuts[f.statut]
+        if f.statut == "Paralysie":
+            if rng.random() < s["chance_move"]:
+                if log is not None:
+                    log.append(f"{s['emoji']} **{f.nom}** est paralysé et rate son tour !")
+                return True
+        elif f.statut == "Sommeil":
+            if f.sleep_turns == 0:
+                f.sleep_turns = rng.randint(1, s["tour_max"])
+            if f.sleep_turns > 0:
+                f.sleep_turns -= 1
+                if log is not None:
+                    log.append(f"{s['emoji']} **{f.nom}** dort et ne peut agir !")
+                return True
+        elif f.statut == "Gel":
+            if rng.random() < s["chance_move"]:
+                if log is not None:
+                    log.append(f"{s['emoji']} **{f.nom}** est gelé et rate son tour !")
+                return True
+        elif f.statut == "Confusion":
+            if rng.random() < s["chance_self"]:
+                f.pv -= s["degats"]
+                if log is not None:
+                    log.append(f"{s['emoji']} **{f.nom}** est confus et se blesse ({s['degats']} PV) !")
+                return True
+        elif f.statut == "Poison":
+            f.pv -= s["degats"]
+            if log is not None:
+                log.append(f"{s['emoji']} **{f.nom}** subit {s['degats']} PV de dégâts de poison !")
+        elif f.statut == "Brûlure":
+            f.pv -= s["degats"]
+            f.boost_atk *= s["attaque_mod"]
+            if log is not None:
+                log.append(f"{s['emoji']} **{f.nom}** subit {s['degats']} PV de brûlure et attaque réduite !")
+        elif f.statut == "Peut réduire rapidité ennemi":
+            if rng.random() < s["chance"]:
+                f.boost_rap += s["mod_rapidite"]
+                if log is not None:
+                    log.append(f"{s['emoji']} **{f.nom}** voit sa rapidité réduite !")
+        elif f.statut == "Augmente défense":
+            if rng.random() < s["chance"]:
+                f.boost_def += s["mod_defense"]
+                if log is not None:
+                    log.append(f"{s['emoji']} **{f.nom}** augmente sa défense !")
+        return False
+
+    def damage(self, a: Fighter, d: Fighter, move: Move):
+        """(dégâts, multiplicateur de type, coup critique)."""
+        if move.categorie != "Offensive":
+            return 0, 1, False
+        atk_stat = a.char.attaque * (1 + a.boost_atk / 2)
+        def_stat = d.char.defense * (1 + d.boost_def / 2)
+        base = ((2 * 50 / 5 + 2) * move.puissance * (atk_stat / def_stat)) / 50 + 2
+        mult = self.type_eff.get(move.type, {}).get(d.type, 1)
+        rand = self.rng.uniform(0.85, 1)
+        crit = 1.5 if self.rng.random() < CRIT_CHANCE else 1
+        return int(base * mult * rand * crit), mult, crit > 1
+
+    def attack(self, a: Fighter, d: Fighter, move: Move, log):
+        if move.categorie == "Soin":
+            a.pv = min(a.char.max_pv, a.pv + move.puissance)
+            if log is not None:
+                log.append(f"{self.categorie_emoji['Soin']} **{a.nom}** utilise *{move.nom}* et se soigne {move.puissance} PV !")
+            return
+        degats, mult, crit = self.damage(a, d, move)
+        d.pv -= degats
+        if log is not None:
+            emoji_type = self.type_emoji.get(move.type, "")
+            txt = f"{self.categorie_emoji['Offensive']} **{a.nom}** utilise *{move.nom}* {emoji_type} et inflige {degats} PV à **{d.nom}** !"
+            if crit: txt += " ⚡ Coup critique !"
+            if mult > 1: txt += " 💥 Super efficace !"
+            elif mult < 1: txt += " ⚠️ Pas très efficace..."
+            log.append(txt)
+        if move.has_statut:
+            d.statut = move.statut
+
+    def choose_move(self, f: Fighter) -> Move:
+        """Attaque au hasard parmi celles de la forme actuelle qui ont encore des PP."""
+        moves = f.char.formes[f.forme][1]
+        pp = f.pp[f.forme]
+        dispo = [i for i, left in enumerate(pp) if left > 0]
+        if not dispo:
+            return TACLE
+        i = self.rng.choice(dispo)
+        pp[i] -= 1
+        return moves[i]
+
+    def evolve(self, f: Fighter) -> str | None:
+        if f.forme < len(f.char.formes) - 1 and self.rng.random() < EVOLVE_CHANCE:
+            f.forme += 1
+            return f"✨ **{f.nom}** passe en **{f.forme_name}** !"
+        return None
+
+    # ──────────────────────────────────────────────────────────────
+    def fight(self, c1: Character, c2: Character, log: list | None = None):
+        """Un combat complet → (gagnant : 0, 1 ou None si nul, nombre de tours)."""
+        rng = self.rng
+        f1, f2 = Fighter(c1), Fighter(c2)
+        tour = 0
+        while f1.pv > 0 and f2.pv > 0 and tour < self.max_turns:
+            tour += 1
+            if log is not None:
+                log.append(f"\n🔁 **Tour {tour}**")
+            k1 = c1.rapidite + rng.randint(0, 10)
+            k2 = c2.rapidite + rng.randint(0, 10)
+            order = (f1, f2) if k1 >= k2 else (f2, f1)
+            for attaquant in order:
+                defenseur = f2 if attaquant is f1 else f1
+                if attaquant.pv <= 0 or defenseur.pv <= 0:
+                    continue
+                if self.status_skip(attaquant, log):
+                    continue
+                self.attack(attaquant, defenseur, self.choose_move(attaquant), log)
+                fs = self.evolve(attaquant)
+                if fs and log is not None:
+                    log.append(fs)
+                if defenseur.pv <= 0:
+                    if log is not None:
+                        log.append(f"\n🏆 **{attaquant.nom}** remporte le combat !")
+                    return (0 if attaquant is f1 else 1), tour
+
+        if f1.pv > 0 and f2.pv <= 0:
+            return 0, tour
+        if f2.pv > 0 and f1.pv <= 0:
+            return 1, tour
+        return None, tour
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📊 Combats en série
+# ────────────────────────────────────────────────────────────────────────────────
+def _run_chunk(args) -> tuple:
+    data1, data2, fights, seed, max_turns = args
+    engine = CombatEngine(rng=random.Random(seed), max_turns=max_turns)
+    c1, c2 = Character(data1), Character(data2)
+    results = Counter()
+    turns = Counter()
+    for _ in range(fights):
+        winner, tour = engine.fight(c1, c2)
+        results[winner] += 1
+        turns[tour] += 1
+    return results, turns
+
+def simulate(name1: str, name2: str, fights: int = 1000, seed: int = 0,
+             workers: int | None = None, max_turns: int = MAX_TURNS) -> dict:
+    """
+    `fights` combats name1 contre name2, répartis en paquets de graines
+    différentes sur un pool de processus. Taux de victoire et durée des combats.
+    """
+    data1, data2 = game_data.character(name1), game_data.character(name2)
+    if data1 is None or data2 is None:
+        raise KeyError(f"Personnage inconnu : {name1 if data1 is None else name2}")
+    # Les fiches sont des vues gelées : on envoie des dict simples aux processus
+    data1, data2 = thaw(data1), thaw(data2)
+
+    chunks = max(1, min(workers or 4, fights))
+    sizes = [fights // chunks + (1 if i < fights % chunks else 0) for i in range(chunks)]
+    jobs = [(data1, data2, n, seed + i, max_turns) for i, n in enumerate(sizes) if n]
+
+    start = time.perf_counter()
+    if len(jobs) == 1 or workers == 1:
+        parts = [_run_chunk(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_run_chunk, jobs))
+    elapsed = time.perf_counter() - start
+
+    results, turns = Counter(), Counter()
+    for r, t in parts:
+        results.update(r)
+        turns.update(t)
+    return {
+        "fights": fights,
+        "wins": (results[0], results[1]),
+        "draws": results[None],
+        "win_rate": (results[0] / fights, results[1] / fights),
+        "avg_turns": sum(t * n for t, n in turns.items()) / fights,
+        "turns": dict(sorted(turns.items())),
+        "elapsed": elapsed,
+        "fights_per_sec": fights / elapsed if elapsed else 0.0,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Combats /combat en série (équilibrage).")
+    parser.add_argument("persos", nargs="*", help="Deux noms de fichier de data/personnages (défaut : toutes les paires)")
+    parser.add_argument("-n", "--fights", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    pairs = [tuple(args.persos[:2])] if len(args.persos) >= 2 else list(combinations(sorted(game_data.character_names()), 2))
+    for name1, name2 in pairs:
+        res = simulate(name1, name2, args.fights, args.seed, args.workers)
+        print(
+            f"{name1} vs {name2} : {res['win_rate'][0]:.1%} / {res['win_rate'][1]:.1%} "
+            f"(nuls {res['draws']}), {res['avg_turns']:.1f} tours en moyenne, "
+            f"{res['fights_per_sec']:,.0f} combats/s"
+        )
+
+if __name__ == "__main__":
+    main()
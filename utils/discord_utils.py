@@ -1,43 +1,196 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📌 discord_utils.py — Fonctions utilitaires sécurisées pour Discord
 # Objectif : Fournir des fonctions send/edit/respond optimisées avec gestion du rate-limit
-# Version : ✅ Optimisée et robuste, backoff exponentiel, logs clairs
+# Version : ✅ Buckets par route/salon, respect de retry_after, logs clairs
 # ────────────────────────────────────────────────────────────────────────────────
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
+import re
+import time
 import asyncio
 import discord
 from discord.errors import HTTPException
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 🛡️ Gestion centralisée des appels Discord avec backoff 429
+# 🚦 Moteur de rate-limit : buckets par route et par salon
 # ────────────────────────────────────────────────────────────────────────────────
-async def _discord_action(action_func, *args, retry=3, delay=0.3, **kwargs):
+# (capacité, fenêtre en secondes) par défaut ; recalibré par les en-têtes X-RateLimit des 429
+ROUTE_LIMITS = {
+    "send": (5, 5.0),
+    "reply": (5, 5.0),
+    "edit": (5, 5.0),
+    "delete": (5, 1.0),
+    "add_reaction": (1, 0.25),
+    "clear_reactions": (1, 0.25),
+}
+DEFAULT_LIMIT = (5, 5.0)
+# Budget commun d’un salon : envois, réponses, éditions et réactions y puisent
+CHANNEL_LIMIT = (5, 5.0)
+CHANNEL_ACTIONS = {"send", "reply", "edit", "add_reaction", "clear_reactions"}
+COSMETIC_RESERVE = 2     # Jetons du salon qu’une réaction ne prend jamais
+
+# Actions liées à une interaction : jamais mises en file (Discord exige une réponse en 3 s)
+INTERACTION_ACTIONS = {"send_message", "edit_message", "edit_original_response", "defer"}
+# Actions cosmétiques : laissent toujours COSMETIC_RESERVE jetons du salon aux envois et éditions
+COSMETIC_ACTIONS = {"add_reaction", "clear_reactions"}
+
+class _Bucket:
+    __slots__ = ("capacity", "per", "tokens", "updated", "blocked_until")
+
+    def __init__(self, capacity: int, per: float):
+        self.capacity = capacity
+        self.per = per
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / self.per)
+        self.updated = now
+
+    def wait_for(self, now: float, needed: float) -> float:
+        """Secondes avant d’avoir `needed` jetons (0 : disponible tout de suite)."""
+        self.refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) * self.per / self.capacity
+
+    def take(self):
+        self.tokens = max(0.0, self.tokens - 1)
+
+class RateLimiter:
+    """
+    Token buckets par (route, salon), plus un budget commun par salon :
+    - on n’attend que si le bucket est vide (plus de pause fixe après chaque appel)
+    - un 429 bloque le bucket pendant retry_after et recalibre sa capacité
+    - les interactions passent en priorité ; envois et éditions consomment le
+      budget du salon sans l’attendre, les réactions n’y puisent que s’il en
+      reste COSMETIC_RESERVE après elles (une rafale ne prive jamais un envoi)
+    """
+
+    def __init__(self):
+        self.buckets: dict[tuple, _Bucket] = {}
+        self.calls = 0
+        self.queued = 0          # Appels ayant dû attendre un jeton
+        self.throttled = 0       # 429 reçus
+        self.wait_total = 0.0    # Secondes passées à attendre
+
+    def _bucket(self, key: tuple) -> _Bucket:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            limit = CHANNEL_LIMIT if key[0] == "channel" else ROUTE_LIMITS.get(key[0], DEFAULT_LIMIT)
+            bucket = self.buckets[key] = _Bucket(*limit)
+        return bucket
+
+    async def acquire(self, key: tuple, priority: str = "normal"):
+        self.calls += 1
+        bucket = self._bucket(key)
+        shared = self._bucket(("channel", key[1])) if key[0] in CHANNEL_ACTIONS and key[1] else None
+        waited = False
+        while True:
+            now = time.monotonic()
+            wait = bucket.wait_for(now, 0 if priority == "interaction" else 1)
+            if priority == "cosmetic" and shared:
+                wait = max(wait, shared.wait_for(now, 1 + COSMETIC_RESERVE))
+            if wait <= 0:
+                bucket.take()
+                if shared:
+                    shared.refill(now)
+                    shared.take()
+                return
+            if not waited:
+                self.queued += 1
+                waited = True
+            self.wait_total += wait
+            await asyncio.sleep(wait)
+
+    def on_rate_limited(self, key: tuple, retry_after: float, headers=None):
+        self.throttled += 1
+        bucket = self._bucket(key)
+        bucket.tokens = 0.0
+        bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + retry_after)
+        try:
+            if headers and headers.get("X-RateLimit-Limit") and headers.get("X-RateLimit-Reset-After"):
+                bucket.capacity = max(1, int(headers["X-RateLimit-Limit"]))
+                bucket.per = max(0.1, float(headers["X-RateLimit-Reset-After"]))
+        except (TypeError, ValueError):
+            pass
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "calls": self.calls,
+            "queued": self.queued,
+            "throttled": self.throttled,
+            "wait_total": round(self.wait_total, 1),
+            "blocked_buckets": sum(1 for b in self.buckets.values() if b.blocked_until > now),
+        }
+
+rate_limiter = RateLimiter()
+
+def _route_key(action_func) -> tuple:
+    """(route, salon) d’une méthode liée discord.py (send, edit, add_reaction...)."""
+    name = getattr(action_func, "__name__", "action")
+    target = getattr(action_func, "__self__", None)
+    channel = getattr(target, "channel", None)
+    channel_id = getattr(channel, "id", None) or getattr(target, "id", None)
+    return name, channel_id
+
+def _retry_after(e: HTTPException, attempt: int) -> float:
+    """Délai demandé par Discord (en-tête Retry-After ou corps JSON), sinon backoff."""
+    retry = getattr(e, "retry_after", None)
+    if retry is None:
+        headers = getattr(getattr(e, "response", None), "headers", None) or {}
+        retry = headers.get("Retry-After")
+    if retry is None and isinstance(getattr(e, "text", None), str):
+        match = re.search(r'"retry_after"\s*:\s*([0-9.]+)', e.text)
+        retry = match.group(1) if match else None
+    try:
+        return max(0.0, float(retry))
+    except (TypeError, ValueError):
+        return float(2 ** attempt)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🛡️ Gestion centralisée des appels Discord avec le moteur de rate-limit
+# ────────────────────────────────────────────────────────────────────────────────
+async def _discord_action(action_func, *args, retry=3, delay=0, **kwargs):
     """
     Exécute une action Discord sécurisée avec gestion du rate-limit et des exceptions.
     - action_func : fonction Discord à appeler (send, edit, reply, etc.)
     - retry : nombre de tentatives en cas de 429
-    - delay : délai entre chaque tentative (anti-429)
+    - delay : pause optionnelle après succès (le moteur de buckets rend la pause fixe inutile)
     """
+    key = _route_key(action_func)
+    if key[0] in INTERACTION_ACTIONS:
+        priority = "interaction"
+    elif key[0] in COSMETIC_ACTIONS:
+        priority = "cosmetic"
+    else:
+        priority = "normal"
+
     for attempt in range(1, retry + 2):
         try:
+            await rate_limiter.acquire(key, priority)
             result = await action_func(*args, **kwargs)
             if delay > 0:
                 await asyncio.sleep(delay)
             return result
         except HTTPException as e:
             if e.status == 429:
-                wait_time = 10 * attempt  # backoff exponentiel
-                print(f"[RateLimit] {action_func.__name__} → 429 Too Many Requests. Pause {wait_time}s...")
-                await asyncio.sleep(wait_time)
+                wait_time = _retry_after(e, attempt)
+                headers = getattr(getattr(e, "response", None), "headers", None)
+                rate_limiter.on_rate_limited(key, wait_time, headers)
+                print(f"[RateLimit] {key[0]} → 429 Too Many Requests. Pause {wait_time:.1f}s...")
             else:
                 raise e
         except Exception as e:
-            print(f"[Erreur] {action_func.__name__} → {e}")
+            print(f"[Erreur] {key[0]} → {e}")
             return None
-    print(f"[Erreur] {action_func.__name__} → Échec après {retry+1} tentatives")
+    print(f"[Erreur] {key[0]} → Échec après {retry+1} tentatives")
     return None
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -81,7 +234,7 @@ async def safe_interact(interaction: discord.Interaction, content=None, edit=Fal
 async def safe_reply(ctx_or_message, content=None, **kwargs):
     return await _discord_action(ctx_or_message.reply, content=content, **kwargs)
 
-async def safe_add_reaction(message: discord.Message, emoji: str, delay: float = 0.3):
+async def safe_add_reaction(message: discord.Message, emoji: str, delay: float = 0):
     return await _discord_action(message.add_reaction, emoji, delay=delay)
 
 async def safe_delete(message: discord.Message, delay: float = 0):
@@ -90,7 +243,7 @@ async def safe_delete(message: discord.Message, delay: float = 0):
         await asyncio.sleep(delay)
     return result
 
-async def safe_clear_reactions(message: discord.Message, delay: float = 0.3):
+async def safe_clear_reactions(message: discord.Message, delay: float = 0):
     result = await _discord_action(message.clear_reactions)
     if delay > 0:
         await asyncio.sleep(delay)
@@ -0,0 +1,129 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 french_dictionary.py — Dictionnaire français partagé par les jeux de mots
+# Objectif : Charger une seule fois (au premier usage) la liste des mots
+#            français de pyspellchecker et l’indexer de façon compacte :
+#            recherche sans accents, mots par longueur, anagrammes
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import gzip
+import asyncio
+import json
+import threading
+import unicodedata
+from importlib import resources
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔤 Normalisation
+# ────────────────────────────────────────────────────────────────────────────────
+def normalize(word: str) -> str:
+    """Minuscules sans accents ("Élève" → "eleve")."""
+    return "".join(
+        c for c in unicodedata.normalize("NFD", word.strip().lower())
+        if unicodedata.category(c) != "Mn"
+    )
+
+def signature(word: str) -> str:
+    """Signature d’anagramme : lettres normalisées triées."""
+    return "".join(sorted(normalize(word)))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📚 Dictionnaire
+# ────────────────────────────────────────────────────────────────────────────────
+class FrenchDictionary:
+    """
+    Dictionnaire français en lecture seule, chargé paresseusement :
+    - on ne garde que les mots (pas les fréquences de pyspellchecker)
+    - un frozenset des formes normalisées pour le test d’appartenance
+    - des tuples triés par longueur ; l’index d’anagrammes est construit
+      seulement au premier appel de anagrams()
+    Côté boucle d’événements, `await load()` avant contains() : le chargement
+    tourne dans un thread et tous les appelants attendent le même future.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._plain: frozenset | None = None
+        self._by_length: dict[int, tuple] = {}
+        self._anagrams: dict[str, tuple] | None = None
+        self._loading: asyncio.Future | None = None
+
+    # ──────────────────────────────────────────────────────────────
+    @staticmethod
+    def _load_words() -> list[str]:
+        """Mots du dictionnaire français fourni par pyspellchecker."""
+        try:
+            path = resources.files("spellchecker") / "resources" / "fr.json.gz"
+            with path.open("rb") as raw, gzip.open(raw, "rt", encoding="utf-8") as f:
+                return list(json.load(f))
+        except (FileNotFoundError, ModuleNotFoundError, OSError):
+            # Format interne différent : on passe par l’API publique (chargement unique)
+            from spellchecker import SpellChecker
+            return list(SpellChecker(language="fr").word_frequency.keys())
+
+    def _ensure_loaded(self):
+        if self._plain is not None:
+            return
+        with self._lock:
+            if self._plain is not None:
+                return
+            words = sorted({w.lower() for w in self._load_words()})
+            by_length: dict[int, list] = {}
+            for w in words:
+                by_length.setdefault(len(w), []).append(w)
+            self._by_length = {n: tuple(ws) for n, ws in by_length.items()}
+            self._plain = frozenset(normalize(w) for w in words)
+            print(f"[DICO] Dictionnaire français chargé : {len(words)} mots")
+
+    def _start_loading(self) -> asyncio.Future:
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(asyncio.to_thread(self._ensure_loaded))
+            self._loading.add_done_callback(self._on_loaded)
+        return self._loading
+
+    def _on_loaded(self, future: asyncio.Future):
+        if future.cancelled() or future.exception() is not None:
+            self._loading = None  # Nouvel essai au prochain appel
+
+    def warmup(self):
+        """Lance le chargement en tâche de fond (appelé au début d’une partie, avant la 1re proposition)."""
+        if self._plain is None:
+            self._start_loading()
+
+    async def load(self):
+        """Attend le dictionnaire sans bloquer la boucle d’événements (chargement partagé)."""
+        if self._plain is None:
+            await asyncio.shield(self._start_loading())
+
+    # ──────────────────────────────────────────────────────────────
+    def contains(self, word: str) -> bool:
+        """Le mot existe-t-il ? (insensible à la casse et aux accents)"""
+        self._ensure_loaded()
+        return normalize(word) in self._plain
+
+    def words_of_length(self, length: int) -> tuple:
+        """Tous les mots (accentués, en minuscules) d’une longueur donnée, triés."""
+        self._ensure_loaded()
+        return self._by_length.get(length, ())
+
+    def anagrams(self, word: str) -> tuple:
+        """Mots du dictionnaire formés des mêmes lettres (accents ignorés)."""
+        self._ensure_loaded()
+        if self._anagrams is None:
+            with self._lock:
+                if self._anagrams is None:
+                    index: dict[str, list] = {}
+                    for words in self._by_length.values():
+                        for w in words:
+                            index.setdefault(signature(w), []).append(w)
+                    self._anagrams = {sig: tuple(ws) for sig, ws in index.items()}
+        return self._anagrams.get(signature(word), ())
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+french_dict = FrenchDictionary()
@@ -0,0 +1,150 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 game_data.py — Registre des données de jeu (JSON de data/)
+# Objectif : Charger une seule fois data/*.json, data/personnages/*.json et
+#            data/voitures/*.json, les indexer (personnage, voiture) et les
+#            distribuer en lecture seule, avec rechargement à chaud
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import os
+import json
+from types import MappingProxyType
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+DATA_DIR = "data"
+CHAR_SUBDIR = "personnages"
+CAR_SUBDIR = "voitures"
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧊 Vues en lecture seule
+# ────────────────────────────────────────────────────────────────────────────────
+def freeze(obj):
+    """dict → MappingProxyType, list → tuple (récursivement)."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+def thaw(obj):
+    """Copie modifiable d’une vue gelée (pour les commandes qui modifient les données)."""
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [thaw(v) for v in obj]
+    return obj
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Registre
+# ────────────────────────────────────────────────────────────────────────────────
+class GameData:
+    """
+    Registre unique des JSON de data/ :
+    - chargé au premier accès, puis servi depuis la mémoire
+    - personnages indexés par nom de fichier, voitures par "nom" (minuscules)
+    - reload_changed() ne relit que les fichiers modifiés (mtime)
+    """
+
+    def __init__(self, root: str = DATA_DIR):
+        self.root = root
+        self._files = {}        # chemin -> (mtime, données gelées)
+        self._characters = {}   # nom -> fiche personnage
+        self._cars = {}         # nom (minuscules) -> fiche voiture
+        self._loaded = False
+        self.generation = 0     # Incrémenté à chaque réindexation (pour les index dérivés)
+
+    # ──────────────────────────────────────────────────────────────
+    def _paths(self) -> list[str]:
+        paths = []
+        for folder in (self.root, os.path.join(self.root, CHAR_SUBDIR), os.path.join(self.root, CAR_SUBDIR)):
+            if os.path.isdir(folder):
+                paths += [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(".json")]
+        return paths
+
+    def _read(self, path: str):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if os.path.dirname(path) == os.path.join(self.root, CHAR_SUBDIR) and isinstance(data, dict):
+            data["image"] = data["images"][0] if data.get("images") else ""
+        return freeze(data)
+
+    def _reindex(self):
+        characters, cars = {}, {}
+        char_dir = os.path.join(self.root, CHAR_SUBDIR)
+        car_dir = os.path.join(self.root, CAR_SUBDIR)
+        for path, (_, data) in self._files.items():
+            folder = os.path.dirname(path)
+            if folder == char_dir:
+                characters[os.path.basename(path)[:-5].lower()] = data
+            elif folder == car_dir and data.get("nom"):
+                cars[data["nom"].lower()] = data
+        self._characters = dict(sorted(characters.items()))
+        self._cars = dict(sorted(cars.items()))
+        self.generation += 1
+
+    def reload_changed(self) -> list[str]:
+        """Relit les fichiers nouveaux ou modifiés, oublie les supprimés ; renvoie les chemins changés."""
+        changed = []
+        seen = set()
+        for path in self._paths():
+            seen.add(path)
+            try:
+                mtime = os.path.getmtime(path)
+                if path in self._files and self._files[path][0] == mtime:
+                    continue
+                self._files[path] = (mtime, self._read(path))
+                changed.append(path)
+            except Exception as e:
+                # On garde l’ancienne version en cas de JSON invalide
+                print(f"[ERREUR JSON] Impossible de charger {path} : {e}")
+        for path in set(self._files) - seen:
+            del self._files[path]
+            changed.append(path)
+        if changed or not self._loaded:
+            self._reindex()
+        self._loaded = True
+        return changed
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.reload_changed()
+
+    # ──────────────────────────────────────────────────────────────
+    def get(self, name: str, default=None):
+        """Données d’un fichier de data/ (ex. "kido" ou "kido.json")."""
+        self._ensure_loaded()
+        if not name.endswith(".json"):
+            name += ".json"
+        entry = self._files.get(os.path.join(self.root, name))
+        return entry[1] if entry else default
+
+    def character(self, name: str):
+        self._ensure_loaded()
+        return self._characters.get(name.lower())
+
+    def character_names(self) -> list[str]:
+        self._ensure_loaded()
+        return list(self._characters)
+
+    def characters(self) -> list:
+        self._ensure_loaded()
+        return list(self._characters.values())
+
+    def car(self, name: str):
+        self._ensure_loaded()
+        return self._cars.get(name.lower())
+
+    def cars(self) -> list:
+        self._ensure_loaded()
+        return list(self._cars.values())
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+game_data = GameData()
@@ -0,0 +1,102 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 gif_writer.py — Encodeur GIF animé minimal (sans dépendance)
+# Objectif : Produire un GIF89a à palette fixe à partir de frames partielles
+#            (seul le rectangle qui change est encodé), pour envoyer une
+#            animation en un seul message au lieu de dizaines d’éditions
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import struct
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗜️ Compression LZW (variante GIF, codes de 3 à 12 bits)
+# ────────────────────────────────────────────────────────────────────────────────
+def _lzw(pixels: bytes, min_code_size: int) -> bytes:
+    clear = 1 << min_code_size
+    eoi = clear + 1
+    code_size = min_code_size + 1
+    next_code = eoi + 1
+    table = {}
+    out = bytearray()
+    buffer = nbits = 0
+
+    def emit(code):
+        nonlocal buffer, nbits
+        buffer |= code << nbits
+        nbits += code_size
+        while nbits >= 8:
+            out.append(buffer & 0xFF)
+            buffer >>= 8
+            nbits -= 8
+
+    emit(clear)
+    prefix = pixels[0]
+    for k in pixels[1:]:
+        key = prefix << 8 | k
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code == 4096:                   # Table pleine → on repart de zéro
+            emit(clear)
+            table.clear()
+            code_size = min_code_size + 1
+            next_code = eoi + 1
+        else:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        prefix = k
+    emit(prefix)
+    emit(eoi)
+    if nbits:
+        out.append(buffer & 0xFF)
+    return bytes(out)
+
+def _sub_blocks(data: bytes) -> bytes:
+    chunks = [bytes((len(data[i:i + 255]),)) + data[i:i + 255] for i in range(0, len(data), 255)]
+    return b"".join(chunks) + b"\x00"
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎞️ Écriture du fichier
+# ────────────────────────────────────────────────────────────────────────────────
+class GifWriter:
+    """
+    GIF animé de `width`×`height` avec une palette globale (liste de (r, g, b),
+    256 couleurs max). Chaque frame est un rectangle (x, y, w, h) posé sur la
+    précédente, avec ses indices de palette ligne par ligne et sa durée en
+    centièmes de seconde.
+    """
+
+    def __init__(self, width: int, height: int, palette: list[tuple[int, int, int]], loop: int = 0):
+        self.width = width
+        self.height = height
+        bits = max(1, (len(palette) - 1).bit_length())
+        self._bits = bits
+        self._min_code_size = max(2, bits)
+        colors = list(palette) + [(0, 0, 0)] * ((1 << bits) - len(palette))
+        self._parts = [
+            b"GIF89a",
+            struct.pack("<HHBBB", width, height, 0x80 | (bits - 1), 0, 0),
+            b"".join(bytes(c) for c in colors),
+            b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00",
+        ]
+        self.frames = 0
+
+    def add_frame(self, x: int, y: int, w: int, h: int, pixels: bytes, delay: int = 10):
+        """Ajoute une frame partielle (disposal « laisser en place »)."""
+        if len(pixels) != w * h:
+            raise ValueError("taille de frame incohérente")
+        self._parts.append(b"\x21\xF9\x04" + struct.pack("<BHBB", 0x04, delay, 0, 0))
+        self._parts.append(b"\x2C" + struct.pack("<HHHHB", x, y, w, h, 0))
+        self._parts.append(bytes((self._min_code_size,)) + _sub_blocks(_lzw(pixels, self._min_code_size)))
+        self.frames += 1
+
+    def getvalue(self) -> bytes:
+        return b"".join(self._parts) + b"\x3B"
@@ -0,0 +1,41 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 http_session.py — Session HTTP partagée (aiohttp)
+# Objectif : Une seule ClientSession pour tout le processus, avec pool de
+#            connexions et cache DNS, au lieu d’une session par requête
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import aiohttp
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+HTTP_TIMEOUT = 10          # Timeout total par défaut (secondes)
+HTTP_POOL_LIMIT = 20       # Connexions simultanées max
+DNS_CACHE_TTL = 300        # Durée du cache DNS (secondes)
+
+_session: aiohttp.ClientSession | None = None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌐 Accès à la session
+# ────────────────────────────────────────────────────────────────────────────────
+def get_session() -> aiohttp.ClientSession:
+    """Renvoie la session partagée (créée à la première utilisation, dans la boucle courante)."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=HTTP_POOL_LIMIT, ttl_dns_cache=DNS_CACHE_TTL),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        )
+    return _session
+
+async def close_session():
+    """Ferme la session partagée (à l’arrêt du bot)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -0,0 +1,149 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 instance_lease.py — Bail (lease) de l’instance maître du bot
+# Objectif : Garder en mémoire la propriété du verrou bot_lock, renouvelée avec un
+#            TTL et protégée par un jeton de fencing, pour que le traitement des
+#            messages ne coûte aucune requête Supabase
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import time
+import asyncio
+from datetime import datetime, timezone
+from utils.supabase_client import supabase, run_db
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres du bail
+# ────────────────────────────────────────────────────────────────────────────────
+LOCK_ID = "bot_lock"
+LEASE_TTL = 30        # Durée de validité du bail en secondes sans renouvellement
+RENEW_INTERVAL = 10   # Fréquence de renouvellement (doit rester < LEASE_TTL)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔎 Vérification depuis un cog / listener / task
+# ────────────────────────────────────────────────────────────────────────────────
+def is_leader(bot) -> bool:
+    """
+    True si cette instance doit traiter les événements. L’instance en attente
+    reste connectée à Discord : tout ce qui répond ou écrit doit passer par ici.
+    """
+    lease = getattr(bot, "lease", None)
+    return lease is None or lease.is_leader()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔐 Bail de l’instance
+# ────────────────────────────────────────────────────────────────────────────────
+class InstanceLease:
+    """
+    Verrou d’instance basé sur un bail :
+    - acquire() prend le verrou s’il est libre ou expiré, en une seule
+      instruction SQL (fonction bot_lock_acquire) qui incrémente le jeton de fencing
+    - renew() prolonge le bail par un update conditionnel (instance_id + jeton)
+    - release() rend le verrou à l’arrêt pour que la relève n’attende pas le TTL
+    - is_leader() est purement en mémoire (aucun appel DB)
+    Si le renouvellement échoue trop longtemps, le bail expire localement et
+    l’instance arrête d’elle-même de traiter les messages.
+    """
+
+    def __init__(self, instance_id: str):
+        self.instance_id = instance_id
+        self.token = None
+        self.expires_at = 0.0
+        self.lost = False
+        self.waiting = False    # Une autre instance détient le bail : attente de sa fin
+        self.enabled = supabase is not None
+
+    # ──────────────────────────────────────────────────────────────
+    def is_leader(self) -> bool:
+        """Vérification gratuite : bail détenu, non expiré et non perdu."""
+        if not self.enabled:
+            return True
+        return not self.lost and self.token is not None and time.monotonic() < self.expires_at
+
+    def _extend(self):
+        self.expires_at = time.monotonic() + LEASE_TTL
+
+    # ──────────────────────────────────────────────────────────────
+    async def acquire(self) -> int | None:
+        """
+        Prend le verrou s’il est libre, expiré ou déjà à cette instance (upsert
+        conditionnel atomique côté SQL) et renvoie le jeton. None si une autre
+        instance détient un bail encore valide.
+        """
+        res = await run_db(supabase.rpc("bot_lock_acquire", {
+            "p_instance_id": self.instance_id,
+            "p_ttl_seconds": LEASE_TTL
+        }))
+        row = res.data[0] if res.data else None
+        if not row or row.get("instance_id") != self.instance_id:
+            return None
+        self.token = int(row["fencing_token"])
+        self.lost = False
+        self._extend()
+        return self.token
+
+    async def wait_acquire(self) -> int:
+        """Réessaie acquire() jusqu’à la libération ou l’expiration du bail en cours."""
+        self.waiting = True
+        try:
+            while True:
+                try:
+                    token = await self.acquire()
+                    if token is not None:
+                        return token
+                except Exception as e:
+                    print(f"⚠️ Erreur lors de la prise du verrou (nouvel essai) : {e}")
+                await asyncio.sleep(RENEW_INTERVAL)
+        finally:
+            self.waiting = False
+
+    async def release(self):
+        """Rend le verrou (arrêt propre) s’il appartient toujours à cette instance."""
+        if not self.enabled or self.token is None:
+            return
+        token, self.token = self.token, None
+        try:
+            await run_db(
+                supabase.table("bot_lock")
+                .update({"instance_id": None})
+                .eq("id", LOCK_ID)
+                .eq("instance_id", self.instance_id)
+                .eq("fencing_token", token)
+            )
+        except Exception as e:
+            print(f"⚠️ Libération du verrou impossible (il expirera seul) : {e}")
+
+    async def renew(self) -> bool:
+        """
+        Renouvelle le bail seulement si la ligne appartient toujours à cette
+        instance avec le même jeton. Renvoie False si le verrou a été repris.
+        """
+        res = await run_db(
+            supabase.table("bot_lock")
+            .update({"updated_at": datetime.now(timezone.utc).isoformat()})
+            .eq("id", LOCK_ID)
+            .eq("instance_id", self.instance_id)
+            .eq("fencing_token", self.token)
+        )
+        if not res.data:
+            self.lost = True
+            return False
+        self._extend()
+        return True
+
+    # ──────────────────────────────────────────────────────────────
+    async def keep_alive(self, on_lost):
+        """Boucle de renouvellement ; appelle on_lost() dès que le verrou est perdu."""
+        while True:
+            await asyncio.sleep(RENEW_INTERVAL)
+            try:
+                if not await self.renew():
+                    await on_lost()
+                    return
+            except Exception as e:
+                # Le bail continue d’expirer localement : après LEASE_TTL sans
+                # renouvellement, is_leader() renvoie False.
+                print(f"⚠️ Erreur lors du renouvellement du bail (ignorée) : {e}")
@@ -0,0 +1,146 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 jardin_store.py — Jardins en mémoire avec écriture différée
+# Objectif : Garder les jardins actifs en mémoire (grille compacte) et regrouper
+#            les clics successifs d’un joueur en une seule mise à jour de la
+#            table gardens, limitée aux colonnes modifiées
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+from collections import OrderedDict
+from utils.jardin_utils import GardenGrid, get_or_create_garden
+from utils.supabase_repo import get_garden, update_garden
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+FLUSH_DELAY = 5.0       # Secondes entre le 1er clic d’une rafale et l’écriture en base
+MAX_CACHED = 500        # Jardins gardés en mémoire (seuls les jardins sauvegardés sont évincés)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Magasin des jardins
+# ────────────────────────────────────────────────────────────────────────────────
+class GardenStore:
+    """
+    Cache LRU des jardins (garden_grid décodé en GardenGrid) :
+    - get() ne lit la base qu’au premier accès
+    - mark_dirty() note les colonnes modifiées ; une seule écriture part
+      FLUSH_DELAY secondes après la première modification
+    """
+
+    def __init__(self, delay: float = FLUSH_DELAY, maxsize: int = MAX_CACHED):
+        self.delay = delay
+        self.maxsize = maxsize
+        self._gardens = OrderedDict()   # user_id -> jardin
+        self._dirty = {}                # user_id -> colonnes à écrire
+        self._timers = {}               # user_id -> tâche d’écriture programmée
+        self._loading = {}              # user_id -> tâche de chargement en cours
+        self.writes = 0
+        self.changes = 0
+
+    # ──────────────────────────────────────────────────────────────
+    async def get(self, user_id: int, username: str | None = None) -> dict | None:
+        """Jardin d’un joueur ; créé s’il n’existe pas et qu’un pseudo est fourni."""
+        user_id = int(user_id)
+        garden = self._gardens.get(user_id)
+        if garden is not None:
+            self._gardens.move_to_end(user_id)
+            return garden
+
+        # Un seul chargement par joueur, même si plusieurs clics arrivent en même temps
+        task = self._loading.get(user_id)
+        if task is None:
+            task = self._loading[user_id] = asyncio.create_task(self._load(user_id, username))
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._loading.pop(user_id, None)
+
+    async def _load(self, user_id: int, username: str | None) -> dict | None:
+        if username is not None:
+            garden = await get_or_create_garden(user_id, username)
+        else:
+            garden = await get_garden(user_id)
+        if not garden:
+            return None
+        garden = dict(garden)
+        garden["garden_grid"] = GardenGrid.from_lines(garden.get("garden_grid") or [])
+        garden["inventory"] = dict(garden.get("inventory") or {})
+        garden["potions"] = dict(garden.get("potions") or {})
+        self._gardens[user_id] = garden
+        self._evict()
+        return garden
+
+    def _evict(self):
+        for user_id in list(self._gardens):
+            if len(self._gardens) <= self.maxsize:
+                break
+            if user_id not in self._dirty:
+                del self._gardens[user_id]
+
+    # ──────────────────────────────────────────────────────────────
+    def mark_dirty(self, user_id: int, *fields: str):
+        """Note des colonnes modifiées ; l’écriture est programmée, pas immédiate."""
+        user_id = int(user_id)
+        self._dirty.setdefault(user_id, set()).update(fields)
+        self.changes += 1
+        if user_id not in self._timers:
+            self._timers[user_id] = asyncio.create_task(self._flush_later(user_id))
+
+    async def _flush_later(self, user_id: int):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            return
+        self._timers.pop(user_id, None)
+        await self.flush(user_id)
+
+    async def flush(self, user_id: int):
+        """Écrit immédiatement les colonnes en attente d’un joueur."""
+        user_id = int(user_id)
+        timer = self._timers.pop(user_id, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+        fields = self._dirty.pop(user_id, None)
+        garden = self._gardens.get(user_id)
+        if not fields or garden is None:
+            return
+
+        row = {}
+        for field in fields:
+            value = garden.get(field)
+            if isinstance(value, GardenGrid):
+                value = value.to_lines()
+            elif isinstance(value, dict):
+                value = dict(value)
+            row[field] = value
+        try:
+            await update_garden(user_id, row)
+            self.writes += 1
+        except Exception as e:
+            print(f"[ERREUR jardin] Sauvegarde de {user_id} impossible : {e}")
+            # On garde les modifications pour la prochaine tentative
+            self.mark_dirty(user_id, *fields)
+
+    async def flush_all(self):
+        """Écrit tout ce qui est en attente (arrêt du bot, dans le délai laissé après SIGTERM)."""
+        await asyncio.gather(*(self.flush(user_id) for user_id in list(self._dirty)))
+
+    def stats(self) -> dict:
+        return {
+            "cached": len(self._gardens),
+            "pending": len(self._dirty),
+            "changes": self.changes,
+            "writes": self.writes,
+        }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+garden_store = GardenStore()
@@ -9,11 +9,11 @@
 import discord
 import datetime
 from utils.jardin_utils import (
-    FLEUR_EMOJIS, FLEUR_SIGNS, FLEUR_VALUES, FLEUR_LIST,
-    POTIONS, FERTILIZE_COOLDOWN, pousser_fleurs, couper_fleurs,
-    build_garden_embed
+    FLEUR_EMOJIS, FLEUR_SIGNS, FLEUR_VALUES,
+    POTIONS, FERTILIZE_COOLDOWN, add_to_inventory, sort_potions
 )
-from utils.supabase_client import supabase
+from utils.alchimie_utils import alchemy_table, apply_flower
+from utils.jardin_store import garden_store
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🌱 GardenGridView et GardenButton
@@ -28,25 +28,14 @@ class GardenButton(discord.ui.Button):
             return await interaction.response.send_message("❌ Ce jardin n’est pas à toi !", ephemeral=True)
 
         i, j = map(int, self.custom_id.split("-"))
-        current_emoji = view.garden["garden_grid"][i][j]
+        flower = view.garden["garden_grid"].pick(i, j)
 
-        if current_emoji == "🌱":
+        if flower is None:
             return await interaction.response.send_message("🪴 Rien à cueillir ici.", ephemeral=True)
 
-        # Chercher le nom de la fleur
-        for name, emoji in FLEUR_EMOJIS.items():
-            if emoji == current_emoji:
-                view.garden["inventory"][name] = view.garden["inventory"].get(name, 0) + 1
-                line = list(view.garden["garden_grid"][i])
-                line[j] = "🌱"
-                view.garden["garden_grid"][i] = "".join(line)
-                break
-
-        # Mise à jour dans la base
-        supabase.table("gardens").update({
-            "garden_grid": view.garden["garden_grid"],
-            "inventory": view.garden["inventory"]
-        }).eq("user_id", view.user_id).execute()
+        add_to_inventory(view.garden["inventory"], {flower: 1})
+        # Sauvegarde différée : une rafale de cueillettes = une seule écriture
+        garden_store.mark_dirty(view.user_id, "garden_grid", "inventory")
 
         self.label = "🌱"
         await interaction.response.edit_message(view=view)
@@ -59,10 +48,11 @@ class GardenGridView(discord.ui.View):
         self.user_id = user_id
 
         # Créer les boutons pour chaque case du jardin
-        for i, line in enumerate(garden["garden_grid"]):
-            for j, emoji in enumerate(line):
+        grid = garden["garden_grid"]
+        for i in range(grid.rows):
+            for j in range(grid.width):
                 custom_id = f"{i}-{j}"
-                self.add_item(GardenButton(label=emoji, row=i, custom_id=custom_id))
+                self.add_item(GardenButton(label=grid.emoji(i, j), row=i, custom_id=custom_id))
 
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -86,11 +76,13 @@ class AlchimieView(discord.ui.View):
             fleurs_grouped[sign].append(f"{FLEUR_EMOJIS[f]}{sign}{val}")
         fleurs = "  ".join(" ".join(fleurs_grouped[s]) for s in ("+", "×", "-"))
         chosen = " ".join(FLEUR_EMOJIS[f] for f in self.selected_flowers) if self.selected_flowers else "—"
+        brewable = len(alchemy_table.brewable(self.temp_inventory))
 
         import discord
         return discord.Embed(
             title="⚗️ Alchimie",
-            description=f"Valeurs de fleurs : {fleurs}\n\n⚗️ {chosen}\nValeur : **{self.value}**",
+            description=f"Valeurs de fleurs : {fleurs}\n\n⚗️ {chosen}\nValeur : **{self.value}**\n"
+                        f"📖 Potions encore réalisables avec tes fleurs : **{brewable}/{len(POTIONS)}**",
             color=discord.Color.purple()
         )
 
@@ -102,15 +94,7 @@ class AlchimieView(discord.ui.View):
             return False
         self.temp_inventory[flower] -= 1
         self.selected_flowers.append(flower)
-
-        sign = FLEUR_SIGNS[flower]
-        val = FLEUR_VALUES[flower]
-        if sign == "+":
-            self.value += val
-        elif sign == "-":
-            self.value -= val
-        elif sign == "×":
-            self.value = self.value * val if self.value != 0 else val
+        self.value = apply_flower(self.value, flower)
         return True
 
     # ───────── Boutons fleurs ─────────
@@ -154,23 +138,41 @@ class AlchimieView(discord.ui.View):
     @discord.ui.button(label="Concocter", emoji="⚗️", style=discord.ButtonStyle.blurple)
     async def concocter(self, interaction, button):
         potion = POTIONS.get(str(self.value))
-        garden_update = {"inventory": self.temp_inventory.copy()}
+        garden = await garden_store.get(self.user_id) or self.garden
+
+        # On retire les fleurs utilisées du jardin à jour (une cueillette a pu avoir lieu entre-temps)
+        inv = garden["inventory"]
+        for flower in self.selected_flowers:
+            inv[flower] = max(0, inv.get(flower, 0) - 1)
+        fields = ["inventory"]
 
         if potion:
-            user_data = supabase.table("gardens").select("potions").eq("user_id", self.user_id).execute()
-            potions_data = user_data.data[0]["potions"] if user_data.data and user_data.data[0].get("potions") else {}
+            potions_data = garden.setdefault("potions", {})
             potions_data[potion] = potions_data.get(potion, 0) + 1
-            garden_update["potions"] = dict(sorted(
-                potions_data.items(),
-                key=lambda x: next((int(v) for v, n in POTIONS.items() if n == x[0]), 0)
-            ))
+            garden["potions"] = sort_potions(potions_data)
+            fields.append("potions")
             await interaction.response.send_message(f"✨ Tu as créé : **{potion}** !", ephemeral=False)
         else:
             await interaction.response.send_message("💥 Ta mixture explose ! Rien obtenu...", ephemeral=False)
 
-        supabase.table("gardens").update(garden_update).eq("user_id", self.user_id).execute()
+        garden_store.mark_dirty(self.user_id, *fields)
         self.stop()
 
+    @discord.ui.button(label="Recettes", emoji="📖", style=discord.ButtonStyle.grey)
+    async def recettes(self, interaction, button):
+        """Liste les potions réalisables avec les fleurs restantes, et l’ordre le moins cher."""
+        brewable = alchemy_table.brewable(self.temp_inventory)
+        if not brewable:
+            return await interaction.response.send_message("🥀 Aucune potion réalisable avec tes fleurs.", ephemeral=True)
+        lines = [
+            f"{name} : {''.join(FLEUR_EMOJIS[f] for f in seq)}"
+            for name, seq in brewable.items()
+        ]
+        await interaction.response.send_message(
+            "📖 **Potions réalisables** (fleurs dans l’ordre, en partant de 0) :\n" + "\n".join(lines),
+            ephemeral=True
+        )
+
     @discord.ui.button(label="Reset", emoji="🔄", style=discord.ButtonStyle.red)
     async def reset(self, interaction, button):
         self.temp_inventory = self.original_inventory.copy()
@@ -206,14 +208,12 @@ class JardinView(discord.ui.View):
             if isinstance(child, discord.ui.Button) and child.label == "Engrais":
                 child.disabled = disabled
 
-    async def update_garden_db(self):
-        supabase.table("gardens").update({
-            "garden_grid": self.garden["garden_grid"],
-            "inventory": self.garden["inventory"],
-            "last_fertilize": self.garden["last_fertilize"],
-            "argent": self.garden["argent"],
-            "armee": self.garden["armee"]
-        }).eq("user_id", self.user_id).execute()
+    def update_garden_db(self, *fields: str):
+        """Programme la sauvegarde (différée et regroupée) des colonnes modifiées."""
+        garden_store.mark_dirty(
+            self.user_id,
+            *(fields or ("garden_grid", "inventory", "last_fertilize", "argent", "armee"))
+        )
 
     @discord.ui.button(label="🪴 Voir la grille", style=discord.ButtonStyle.green)
     async def show_grid(self, interaction: discord.Interaction, button: discord.ui.Button):
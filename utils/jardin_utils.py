@@ -9,7 +9,7 @@
 import json
 import random
 import datetime
-from utils.supabase_client import supabase
+from utils.supabase_repo import get_garden, insert_garden
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 Chargement des constantes depuis un JSON
@@ -30,17 +30,110 @@ FERTILIZE_COOLDOWN = datetime.timedelta(minutes=CONFIG["FERTILIZE_COOLDOWN_MINUT
 FERTILIZE_PROBABILITY = CONFIG["FERTILIZE_PROBABILITY"]
 
 POTIONS = CONFIG["POTIONS"]
+# Index d’ordre des potions (nom → valeur numérique)
+POTION_VALUES = {name: int(value) for value, name in POTIONS.items()}
 
 TABLE_NAME = "gardens"
 
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧮 Grille compacte — un octet par case
+# ────────────────────────────────────────────────────────────────────────────────
+EMPTY = 0                                   # 🌱
+FLEUR_NAMES = list(FLEUR_EMOJIS)            # code n (≥ 1) ↔ FLEUR_NAMES[n - 1]
+CELL_EMOJIS = ["🌱"] + [FLEUR_EMOJIS[f] for f in FLEUR_NAMES]
+
+# Tables de traduction émoji ↔ code : l’encodage et le rendu d’une ligne
+# se font en un seul str.translate au lieu d’une boucle par caractère
+_ENCODE = str.maketrans({emoji: chr(code) for code, emoji in enumerate(CELL_EMOJIS)})
+_DECODE = str.maketrans({chr(code): emoji for code, emoji in enumerate(CELL_EMOJIS)})
+
+
+class GardenGrid:
+    """
+    Grille du jardin sous forme de bytearray (0 = 🌱, n = n-ième fleur de FLEUR_EMOJIS).
+    Les émojis ne sont reconstruits que pour l’affichage et la sauvegarde
+    (garden_grid reste une liste de lignes d’émojis en base).
+    """
+    __slots__ = ("cells", "width")
+
+    def __init__(self, cells: bytearray, width: int):
+        self.cells = cells
+        self.width = width
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "GardenGrid":
+        width = max((len(line) for line in lines), default=0)
+        cells = bytearray()
+        for line in lines:
+            encoded = line.translate(_ENCODE)
+            try:
+                row = encoded.encode("ascii")
+            except UnicodeEncodeError:
+                # Caractère inconnu (ligne abîmée) → pousse
+                row = bytes(ord(c) if ord(c) < len(CELL_EMOJIS) else EMPTY for c in encoded)
+            cells += row.ljust(width, bytes([EMPTY]))
+        return cls(cells, width)
+
+    # ──────────────────────────────────────────────────────────────
+    @property
+    def rows(self) -> int:
+        return len(self.cells) // self.width if self.width else 0
+
+    def emoji(self, i: int, j: int) -> str:
+        return CELL_EMOJIS[self.cells[i * self.width + j]]
+
+    def to_lines(self) -> list[str]:
+        text = self.cells.decode("ascii").translate(_DECODE)
+        return [text[k:k + self.width] for k in range(0, len(text), self.width)]
+
+    def render(self) -> str:
+        return "\n".join(self.to_lines())
+
+    # ──────────────────────────────────────────────────────────────
+    def grow(self, probability: float = FERTILIZE_PROBABILITY, rng=random) -> int:
+        """Fait pousser une fleur aléatoire sur chaque 🌱 avec la probabilité donnée ; renvoie le nombre de pousses."""
+        cells = self.cells
+        grown = 0
+        for k in [k for k, c in enumerate(cells) if c == EMPTY]:
+            if rng.random() < probability:
+                cells[k] = rng.randint(1, len(FLEUR_NAMES))
+                grown += 1
+        return grown
+
+    def harvest(self) -> dict[str, int]:
+        """Cueille toutes les fleurs d’un coup ; renvoie {fleur: quantité}."""
+        counts = {name: self.cells.count(code) for code, name in enumerate(FLEUR_NAMES, 1)}
+        self.cells[:] = bytes(len(self.cells))
+        return {name: n for name, n in counts.items() if n}
+
+    def pick(self, i: int, j: int) -> str | None:
+        """Cueille une case ; renvoie le nom de la fleur, ou None si c’est une pousse."""
+        k = i * self.width + j
+        code = self.cells[k]
+        if code == EMPTY:
+            return None
+        self.cells[k] = EMPTY
+        return FLEUR_NAMES[code - 1]
+
+
+def sort_potions(potions: dict) -> dict:
+    """Potions triées par valeur (ordre de POTIONS)."""
+    return dict(sorted(potions.items(), key=lambda x: POTION_VALUES.get(x[0], 0)))
+
+
+def add_to_inventory(inventory: dict, flowers: dict[str, int]):
+    """Ajoute une récolte à l’inventaire (modifié sur place)."""
+    for name, n in flowers.items():
+        inventory[name] = inventory.get(name, 0) + n
+
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Fonctions utilitaires
 # ────────────────────────────────────────────────────────────────────────────────
 async def get_or_create_garden(user_id: int, username: str) -> dict:
     """Récupère le jardin d'un utilisateur ou le crée s'il n'existe pas."""
-    res = supabase.table(TABLE_NAME).select("*").eq("user_id", user_id).execute()
-    if res.data:
-        return res.data[0]
+    garden = await get_garden(user_id)
+    if garden:
+        return garden
 
     new_garden = {
         "user_id": user_id,
@@ -52,14 +145,13 @@ async def get_or_create_garden(user_id: int, username: str) -> dict:
         "last_fertilize": None,
         "potions": {}
     }
-    supabase.table(TABLE_NAME).insert(new_garden).execute()
+    await insert_garden(new_garden)
     return new_garden
 
 
 def build_garden_embed(garden: dict, viewer_id: int):
-    """Construit l'embed du jardin pour Discord."""
+    """Construit l’embed du jardin pour Discord (jardin chargé via garden_store)."""
     import discord  # Import local pour éviter des conflits circulaires
-    lines = garden["garden_grid"]
     inv_dict = garden["inventory"]
     inv = " / ".join(f"{FLEUR_EMOJIS[f]}{inv_dict.get(f, 0)}" for f in FLEUR_EMOJIS)
 
@@ -79,7 +171,7 @@ def build_garden_embed(garden: dict, viewer_id: int):
 
     embed = discord.Embed(
         title=f"🏡 Jardin de {garden['username']}",
-        description="\n".join(lines),
+        description=garden["garden_grid"].render(),
         color=discord.Color.green()
     )
     embed.add_field(
@@ -92,48 +184,13 @@ def build_garden_embed(garden: dict, viewer_id: int):
     return embed
 
 
-def pousser_fleurs(lines: list[str]) -> list[str]:
-    """Fait pousser aléatoirement des fleurs dans le jardin."""
-    new_lines = []
-    for line in lines:
-        chars = []
-        for c in line:
-            if c == "🌱" and random.random() < FERTILIZE_PROBABILITY:
-                _, emoji = random.choice(FLEUR_LIST)
-                chars.append(emoji)
-            else:
-                chars.append(c)
-        new_lines.append("".join(chars))
-    return new_lines
-
-
-def couper_fleurs(lines: list[str], garden: dict) -> tuple[list[str], dict]:
-    """Cueille toutes les fleurs du jardin et les ajoute à l'inventaire."""
-    new_lines = []
-    inv = garden["inventory"]
-    for line in lines:
-        chars = []
-        for c in line:
-            for col, emoji in FLEUR_EMOJIS.items():
-                if c == emoji:
-                    inv[col] = inv.get(col, 0) + 1
-                    c = "🌱"
-            chars.append(c)
-        new_lines.append("".join(chars))
-    garden["inventory"] = inv
-    return new_lines, garden
-
-
 def build_potions_embed(potions: dict):
     """Construit l'embed pour afficher les potions."""
     import discord
     if not potions:
         desc = "🧪 Tu n’as aucune potion."
     else:
-        sorted_potions = dict(sorted(
-            potions.items(),
-            key=lambda x: next((int(v) for v, n in POTIONS.items() if n == x[0]), 0)
-        ))
+        sorted_potions = sort_potions(potions)
         desc = "\n".join(f"{name} x{qty}" for name, qty in sorted_potions.items())
 
     embed = discord.Embed(
@@ -6,16 +6,87 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
-import random
+import time
 import asyncio
 import discord
 from discord.ui import View, Button
+from utils.message_router import message_router
+from utils.round_renderer import round_renderer, Frame, field_frame
+from utils.kawashima_puzzles import puzzle_factory
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Paramètres
 # ────────────────────────────────────────────────────────────────────────────────
 TIMEOUT = 60  # 1 minute pour répondre à chaque mini-jeu
 
+async def _wait_answer(ctx, get_user_id, judge) -> bool:
+    """
+    Attend une réponse dans le salon du mini-jeu et la juge avec judge(msg).
+    Solo : la première réponse du joueur décide. Multijoueur : les mauvaises
+    réponses sont ignorées et le premier participant qui répond juste
+    (avant TIMEOUT) remporte la manche.
+    """
+    multi = round_renderer.is_multiplayer(ctx)
+
+    def check(m):
+        if not round_renderer.is_player(ctx, m.author.id, get_user_id):
+            return False
+        return not multi or _judge(judge, m)
+
+    try:
+        msg = await message_router.wait_for(ctx.channel.id, check=check, timeout=TIMEOUT)
+    except asyncio.TimeoutError:
+        return False
+    round_renderer.mark_answer(ctx, msg.author.id)  # Heure et auteur pour le score de kawa.py
+    return multi or _judge(judge, msg)
+
+async def _ask(ctx, frames, get_user_id, judge) -> bool:
+    """
+    Joue la manche et écoute les réponses dès que la question est affichée,
+    pendant son `hold` compris : le temps de réponse part de cet affichage.
+    """
+    timeline = round_renderer.timeline(ctx)
+    playing = asyncio.create_task(round_renderer.play(ctx, frames))
+    prompted = asyncio.create_task(timeline.prompted.wait())
+    try:
+        await asyncio.wait({playing, prompted}, return_when=asyncio.FIRST_COMPLETED)
+        if playing.done():
+            playing.result()  # Erreur d’affichage : remontée comme avant
+        return await _wait_answer(ctx, get_user_id, judge)
+    finally:
+        playing.cancel()   # Fin du hold inutile une fois la réponse reçue
+        prompted.cancel()
+
+def _judge(judge, msg) -> bool:
+    """Réponse illisible (int("abc"), etc.) = mauvaise réponse."""
+    try:
+        return bool(judge(msg))
+    except Exception:
+        return False
+
+def is_player(ctx, interaction, get_user_id) -> bool:
+    """Clic autorisé sur un bouton du mini-jeu (joueur solo ou participant multi)."""
+    return round_renderer.is_player(ctx, interaction.user.id, get_user_id)
+
+def settle_click(ctx, view, user_id: int, correct: bool) -> bool:
+    """
+    Clic sur un bouton du mini-jeu. Solo : le premier clic décide. Multijoueur :
+    un mauvais clic élimine son auteur pour la manche, seul le premier clic juste
+    la termine (ou la dernière élimination). Renvoie True si ce clic fait le résultat.
+    """
+    if round_renderer.is_multiplayer(ctx) and not correct:
+        if not round_renderer.eliminate(ctx, user_id):
+            view.stop()  # Tout le monde s’est trompé : manche perdue
+        return False
+    round_renderer.mark_answer(ctx, user_id)  # Heure et auteur pour le score de kawa.py
+    view.stop()
+    return True
+
+def take_puzzle(ctx, game: str):
+    """Énigme pré-générée du mini-jeu (réserve de kawashima_puzzles, sans doublon récent sur le serveur)."""
+    guild = getattr(ctx, "guild", None)
+    return puzzle_factory.take(game, guild.id if guild else None)
+
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 Mini-jeux (chacun avec .emoji et .title)
 # ────────────────────────────────────────────────────────────────────────────────
@@ -23,30 +94,20 @@ TIMEOUT = 60  # 1 minute pour répondre à chaque mini-jeu
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🧮 Addition à la suite
 # ────────────────────────────────────────────────────────────────────────────────
-async def addition_cachee(ctx, embed, get_user_id, bot):
-    additions = [random.randint(-9, 9) for _ in range(6)]
-    total = sum(additions)
+async def addition_cachee(ctx, embed, get_user_id):
+    puzzle = take_puzzle(ctx, "addition_cachee")
+    additions, total = puzzle["additions"], puzzle["total"]
 
-    embed.clear_fields()
-    embed.add_field(name="🧮 Additions à la suite", value="Observe bien les additions successives...", inline=False)
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(3)  # prep_time
-
-    for add in additions:
-        embed.clear_fields()
-        embed.add_field(name="🧮 Additions à la suite", value=f"{add:+d}", inline=False)
-        await ctx.edit(embed=embed)
-        await asyncio.sleep(1.8)
+    # Toute la manche est prévue d’avance ; chaque pause démarre à l’affichage réel
+    title = "🧮 Additions à la suite"
+    frames = [field_frame(embed, title, "Observe bien les additions successives...", hold=3)]
+    frames += [field_frame(embed, title, f"{add:+d}", hold=1.8) for add in additions]
+    frames.append(field_frame(embed, title, "Quel est le total final ?", prompt=True))
+    await round_renderer.play(ctx, frames)
 
-    embed.clear_fields()
-    embed.add_field(name="🧮 Additions à la suite", value="Quel est le total final ?", inline=False)
-    await ctx.edit(embed=embed)
-
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return int(msg.content) == total
-    except:
-        return False
+    return await _wait_answer(ctx, get_user_id, judge)
 
 addition_cachee.title = "Addition à la suite"
 addition_cachee.emoji = "➕"
@@ -55,28 +116,17 @@ addition_cachee.prep_time = 3 + 1.8 * 6  # temps total avant question
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🧮 Calcul rapide
 # ────────────────────────────────────────────────────────────────────────────────
-async def calcul_rapide(ctx, embed, get_user_id, bot):
-    op = random.choice(["+", "-", "*", "/"])
-    if op == "*":
-        a, b = random.randint(1, 10), random.randint(1, 10)
-        answer = a * b
-    elif op == "/":
-        b = random.randint(1, 10)
-        answer = random.randint(1, 10)
-        a = b * answer
-    else:
-        a, b = random.randint(10, 50), random.randint(10, 50)
-        answer = eval(f"{a}{op}{b}")
+async def calcul_rapide(ctx, embed, get_user_id):
+    puzzle = take_puzzle(ctx, "calcul_rapide")
+    a, op, b, answer = puzzle["a"], puzzle["op"], puzzle["b"], puzzle["answer"]
 
     embed.clear_fields()
     embed.add_field(name="🧮 Calcul rapide", value=f"{a} {op} {b} = ?", inline=False)
-    await ctx.edit(embed=embed)
+    await round_renderer.play(ctx, [Frame(prompt=True, embed=embed)])
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return int(msg.content) == answer
-    except:
-        return False
+    return await _wait_answer(ctx, get_user_id, judge)
 
 calcul_rapide.title = "Calcul rapide"
 calcul_rapide.emoji = "🧮"
@@ -85,26 +135,10 @@ calcul_rapide.prep_time = 0
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🔢 Carré magique 3x3 fiable emoji
 # ────────────────────────────────────────────────────────────────────────────────
-async def carre_magique_fiable_emoji(ctx, embed, get_user_id, bot):
-    base = [
-        [8, 1, 6],
-        [3, 5, 7],
-        [4, 9, 2]
-    ]
-
-    def rotate(square):
-        return [list(x) for x in zip(*square[::-1])]
-
-    def flip(square):
-        return [row[::-1] for row in square]
-
-    for _ in range(random.randint(0, 3)):
-        base = rotate(base)
-    if random.choice([True, False]):
-        base = flip(base)
-
-    row, col = random.randint(0, 2), random.randint(0, 2)
-    answer = base[row][col]
+async def carre_magique_fiable_emoji(ctx, embed, get_user_id):
+    puzzle = take_puzzle(ctx, "carre_magique_fiable_emoji")
+    base = [list(r) for r in puzzle["square"]]
+    row, col, answer = puzzle["row"], puzzle["col"], puzzle["answer"]
     base[row][col] = "❓"
 
     num_to_emoji = {i: f"{i}\u20e3" for i in range(1, 10)}
@@ -117,13 +151,11 @@ async def carre_magique_fiable_emoji(ctx, embed, get_user_id, bot):
         value=f"Complète le carré magique pour que toutes les lignes, colonnes et diagonales fassent 15 :\n{display}",
         inline=False
     )
-    await ctx.edit(embed=embed)
+    await round_renderer.play(ctx, [Frame(prompt=True, embed=embed)])
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return int(msg.content) == answer
-    except:
-        return False
+    return await _wait_answer(ctx, get_user_id, judge)
 
 carre_magique_fiable_emoji.title = "Carré magique 3x3"
 carre_magique_fiable_emoji.emoji = "🔢"
@@ -132,36 +164,22 @@ carre_magique_fiable_emoji.prep_time = 0
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 👀 Compter les emojis
 # ────────────────────────────────────────────────────────────────────────────────
-async def compter_emojis(ctx, embed, get_user_id, bot):
-    import random
-
-    emojis = ["🍎", "🍌", "🍒", "🍇", "🍊"]
-    cible = random.choice(emojis)
-
-    # Génère une grille 4x4
-    grille = [[random.choice(emojis) for _ in range(4)] for _ in range(4)]
+async def compter_emojis(ctx, embed, get_user_id):
+    puzzle = take_puzzle(ctx, "compter_emojis")
+    grille, cible, total = puzzle["grille"], puzzle["cible"], puzzle["total"]
     texte_grille = "\n".join("".join(ligne) for ligne in grille)
 
-    # Compte combien de fois l'emoji cible apparaît
-    total = sum(ligne.count(cible) for ligne in grille)
-
     embed.clear_fields()
     embed.add_field(
         name="👀 Compter les emojis",
         value=f"{texte_grille}\n\n➡️ Combien de {cible} dans cette grille ?",
         inline=False
     )
-    await ctx.edit(embed=embed)
+    await round_renderer.play(ctx, [Frame(prompt=True, embed=embed)])
 
-    try:
-        msg = await bot.wait_for(
-            "message",
-            check=lambda m: m.author.id == get_user_id(),
-            timeout=TIMEOUT
-        )
+    def judge(msg):
         return msg.content.isdigit() and int(msg.content) == total
-    except:
-        return False
+    return await _wait_answer(ctx, get_user_id, judge)
 
 compter_emojis.title = "Compter les emojis"
 compter_emojis.emoji = "👀"
@@ -170,7 +188,7 @@ compter_emojis.prep_time = 1.5
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎨 Couleurs (Stroop complet)
 # ────────────────────────────────────────────────────────────────────────────────
-async def couleurs(ctx, embed, get_user_id, bot):
+async def couleurs(ctx, embed, get_user_id):
     styles = {
         "bleu": discord.ButtonStyle.primary,
         "vert": discord.ButtonStyle.success,
@@ -178,33 +196,32 @@ async def couleurs(ctx, embed, get_user_id, bot):
         "gris": discord.ButtonStyle.secondary
     }
 
+    puzzle = take_puzzle(ctx, "couleurs")
     couleurs_list = list(styles.keys())
-    mots = couleurs_list.copy()
-    random.shuffle(mots)
+    mots = list(puzzle["mots"])
 
     buttons = []
     for couleur, mot in zip(couleurs_list, mots):
         button = Button(label=mot.upper(), style=styles[couleur])
         buttons.append(button)
 
-    question_type = random.choice(["mot", "couleur"])
+    question_type, cible = puzzle["question_type"], puzzle["cible"]
     if question_type == "mot":
-        cible = random.choice(mots)
         question = f"Appuie sur le bouton où est écrit le **MOT** `{cible.upper()}` !"
         condition = lambda b: b.label.lower() == cible
     else:
-        cible = random.choice(couleurs_list)
         question = f"Appuie sur le bouton de **COULEUR** `{cible.upper()}` !"
         condition = lambda b: b.style == styles[cible]
 
     view = View(timeout=TIMEOUT)
     for button in buttons:
         async def callback(interaction, b=button):
-            if interaction.user.id != get_user_id():
+            if not is_player(ctx, interaction, get_user_id):
                 await interaction.response.send_message("🚫 Ce jeu n’est pas pour toi !", ephemeral=True)
                 return
-            view.value = condition(b)
-            view.stop()
+            correct = condition(b)
+            if settle_click(ctx, view, interaction.user.id, correct):
+                view.value = correct
             await interaction.response.defer()
 
         button.callback = callback
@@ -212,13 +229,12 @@ async def couleurs(ctx, embed, get_user_id, bot):
 
     embed.clear_fields()
     embed.add_field(name="🎨 Couleurs (Stroop)", value=question, inline=False)
-    await ctx.edit(embed=embed, view=view)
+    await round_renderer.play(ctx, [Frame(hold=0.5, prompt=True, embed=embed, view=view)])  # prep_time
 
-    await asyncio.sleep(0.5)  # prep_time
     await view.wait()
     for child in view.children:
         child.disabled = True
-    await ctx.edit(view=view)
+    await round_renderer.play(ctx, [Frame(view=view)])
 
     return getattr(view, "value", False)
 
@@ -229,11 +245,11 @@ couleurs.prep_time = 0.5
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 📅 Datation
 # ────────────────────────────────────────────────────────────────────────────────
-async def datation(ctx, embed, get_user_id, bot):
+async def datation(ctx, embed, get_user_id):
     import datetime
 
     today = datetime.date.today()
-    delta_days = random.randint(-7, 7)
+    delta_days = take_puzzle(ctx, "datation")["delta_days"]
     date = today + datetime.timedelta(days=delta_days)
     
     jours_fr = {
@@ -254,18 +270,12 @@ async def datation(ctx, embed, get_user_id, bot):
         value=f"Quel jour de la semaine était le {date.day}/{date.month}/{date.year} ?",
         inline=False
     )
-    await ctx.edit(embed=embed)
+    await round_renderer.play(ctx, [Frame(prompt=True, embed=embed)])
 
-    try:
-        msg = await bot.wait_for(
-            "message",
-            check=lambda m: m.author.id == get_user_id(),
-            timeout=TIMEOUT
-        )
+    def judge(msg):
         reponse = msg.content.lower().strip()
         return reponse == jour_complet or reponse == jour_abr
-    except:
-        return False
+    return await _wait_answer(ctx, get_user_id, judge)
 
 datation.title = "Datation"
 datation.emoji = "📅"
@@ -274,15 +284,14 @@ datation.prep_time = 0
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🧭 Directions opposées
 # ────────────────────────────────────────────────────────────────────────────────
-async def directions_opposees(ctx, embed, get_user_id, bot):
-    import random
+async def directions_opposees(ctx, embed, get_user_id):
     from discord.ui import View, Button
     from discord import ButtonStyle
 
     arrows = ["⬆️", "⬇️", "⬅️", "➡️"]
     opposites = {"⬆️": "⬇️", "⬇️": "⬆️", "⬅️": "➡️", "➡️": "⬅️"}
 
-    arrow = random.choice(arrows)
+    arrow = take_puzzle(ctx, "directions_opposees")["arrow"]
     correct = opposites[arrow]
 
     embed.clear_fields()
@@ -301,22 +310,22 @@ async def directions_opposees(ctx, embed, get_user_id, bot):
 
     for symbol in arrows:
         async def callback(interaction, s=symbol):
-            if interaction.user.id != get_user_id():
+            if not is_player(ctx, interaction, get_user_id):
                 await interaction.response.send_message("🚫 Pas ton tour !", ephemeral=True)
                 return
-            view.result = (s == correct)
-            view.stop()
+            if settle_click(ctx, view, interaction.user.id, s == correct):
+                view.result = (s == correct)
             await interaction.response.defer()
 
         btn = Button(label=symbol, style=ButtonStyle.primary)
         btn.callback = callback
         view.add_item(btn)
 
-    # ctx est un Message → on édite le message existant
-    await ctx.edit(embed=embed, view=view)
+    # ctx est un Message → la question et ses boutons arrivent en une seule édition
+    await round_renderer.play(ctx, [Frame(prompt=True, embed=embed, view=view)])
 
     await view.wait()
-    await ctx.edit(view=None)  # Supprime les boutons
+    await round_renderer.play(ctx, [Frame(view=None)])  # Supprime les boutons
     return view.result
 
 
@@ -327,30 +336,24 @@ directions_opposees.prep_time = 1
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 ➗ Équation à trou
 # ────────────────────────────────────────────────────────────────────────────────
-async def equation_trou(ctx, embed, get_user_id, bot):
-    op = random.choice(["+", "-", "*"])
+async def equation_trou(ctx, embed, get_user_id):
+    puzzle = take_puzzle(ctx, "equation_trou")
+    a, op, b, answer = puzzle["a"], puzzle["op"], puzzle["b"], puzzle["answer"]
+    hole_a = puzzle["hole"] == "a"
     if op == "+":
-        a, b = random.randint(1, 20), random.randint(1, 20)
-        answer = random.choice([a, b])
-        question = f"? + {b} = {a + b}" if answer == a else f"{a} + ? = {a + b}"
+        question = f"? + {b} = {a + b}" if hole_a else f"{a} + ? = {a + b}"
     elif op == "-":
-        a, b = random.randint(10, 30), random.randint(1, 10)
-        answer = random.choice([a, b])
-        question = f"? - {b} = {a - b}" if answer == a else f"{a} - ? = {a - b}"
+        question = f"? - {b} = {a - b}" if hole_a else f"{a} - ? = {a - b}"
     else:
-        a, b = random.randint(1, 10), random.randint(1, 10)
-        answer = random.choice([a, b])
-        question = f"? × {b} = {a * b}" if answer == a else f"{a} × ? = {a * b}"
+        question = f"? × {b} = {a * b}" if hole_a else f"{a} × ? = {a * b}"
 
     embed.clear_fields()
     embed.add_field(name="➗ Équation à trou", value=question, inline=False)
-    await ctx.edit(embed=embed)
+    await round_renderer.play(ctx, [Frame(prompt=True, embed=embed)])
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return int(msg.content) == answer
-    except:
-        return False
+    return await _wait_answer(ctx, get_user_id, judge)
 
 equation_trou.title = "Equation à trou"
 equation_trou.emoji = "➗"
@@ -359,10 +362,9 @@ equation_trou.prep_time = 0
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🕒 Heures
 # ────────────────────────────────────────────────────────────────────────────────
-async def heures(ctx, embed, get_user_id, bot):
-    h1, m1 = random.randint(0, 23), random.randint(0, 59)
-    h2, m2 = random.randint(0, 23), random.randint(0, 59)
-    diff = abs((h1 * 60 + m1) - (h2 * 60 + m2))
+async def heures(ctx, embed, get_user_id):
+    puzzle = take_puzzle(ctx, "heures")
+    h1, m1, h2, m2, diff = puzzle["h1"], puzzle["m1"], puzzle["h2"], puzzle["m2"], puzzle["diff"]
     hours, mins = divmod(diff, 60)
 
     heure_1, heure_2 = f"{h1:02d}:{m1:02d}", f"{h2:02d}:{m2:02d}"
@@ -370,14 +372,9 @@ async def heures(ctx, embed, get_user_id, bot):
 
     embed.clear_fields()
     embed.add_field(name="🕒 Heures", value=question_type, inline=False)
-    await ctx.edit(embed=embed)
+    await round_renderer.play(ctx, [Frame(prompt=True, embed=embed)])
 
-    try:
-        msg = await bot.wait_for(
-            "message",
-            check=lambda m: m.author.id == get_user_id(),
-            timeout=TIMEOUT
-        )
+    def judge(msg):
         rep = msg.content.lower().replace("h", " ").replace(":", " ").replace("min", " ").replace("m", " ")
         nums = [int(x) for x in rep.split() if x.isdigit()]
         if len(nums) == 1:
@@ -389,8 +386,7 @@ async def heures(ctx, embed, get_user_id, bot):
         diff_user = user_hours * 60 + user_mins
         diff_real = hours * 60 + mins
         return abs(diff_user - diff_real) <= 1
-    except:
-        return False
+    return await _wait_answer(ctx, get_user_id, judge)
 
 heures.title = "Heures"
 heures.emoji = "🕒"
@@ -399,22 +395,16 @@ heures.prep_time = 0
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🔢 Mémoire numérique
 # ────────────────────────────────────────────────────────────────────────────────
-async def memoire_numerique(ctx, embed, get_user_id, bot):
-    sequence = [random.randint(0, 9) for _ in range(6)]
-    embed.clear_fields()
-    embed.add_field(name="🔢 Mémoire numérique", value=str(sequence), inline=False)
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(5)  # prep_time
+async def memoire_numerique(ctx, embed, get_user_id):
+    sequence = list(take_puzzle(ctx, "memoire_numerique")["sequence"])
+    await round_renderer.play(ctx, [
+        field_frame(embed, "🔢 Mémoire numérique", str(sequence), hold=5),  # prep_time
+        field_frame(embed, "🔢 Mémoire numérique", "🕵️‍♂️ Retape la séquence !", prompt=True),
+    ])
 
-    embed.clear_fields()
-    embed.add_field(name="🔢 Mémoire numérique", value="🕵️‍♂️ Retape la séquence !", inline=False)
-    await ctx.edit(embed=embed)
-
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return msg.content == "".join(map(str, sequence))
-    except:
-        return False
+    return await _wait_answer(ctx, get_user_id, judge)
 
 memoire_numerique.title = "Mémoire numérique"
 memoire_numerique.emoji = "🔢"
@@ -423,33 +413,16 @@ memoire_numerique.prep_time = 5
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 👁️ Mémoire visuelle (boutons)
 # ────────────────────────────────────────────────────────────────────────────────
-async def memoire_visuelle(ctx, embed, get_user_id, bot):
+async def memoire_visuelle(ctx, embed, get_user_id):
     prep_time = 4
-    base_emojis = ["🍎", "🚗", "🐶", "🌟", "⚽", "🎲", "💎", "🎵", "🍕", "🐱", "🚀", "🎁"]
-    shown_emojis = random.sample(base_emojis, 4)
-
-    embed.clear_fields()
-    embed.add_field(
-        name="👁️ Mémoire visuelle",
-        value=f"Mémorise bien ces 4 emojis :\n{' '.join(shown_emojis)}",
-        inline=False
-    )
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
+    puzzle = take_puzzle(ctx, "memoire_visuelle")
+    shown_emojis = list(puzzle["shown"])
 
-    embed.clear_fields()
-    embed.add_field(
-        name="👁️ Mémoire visuelle",
-        value="🔒 Les emojis ont disparu... retrouve celui qui **n'était PAS dans la liste !**",
-        inline=False
-    )
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(1)
+    title = "👁️ Mémoire visuelle"
+    hidden = "🔒 Les emojis ont disparu... retrouve celui qui **n'était PAS dans la liste !**"
 
-    all_choices = shown_emojis.copy()
-    intrus = random.choice([e for e in base_emojis if e not in shown_emojis])
-    all_choices.append(intrus)
-    random.shuffle(all_choices)
+    all_choices = list(puzzle["choices"])
+    intrus = puzzle["intrus"]
 
     class EmojiView(discord.ui.View):
         def __init__(self):
@@ -460,11 +433,11 @@ async def memoire_visuelle(ctx, embed, get_user_id, bot):
     for e in all_choices:
         async def make_callback(emoji=e):
             async def callback(interaction: discord.Interaction):
-                if interaction.user.id != get_user_id():
+                if not is_player(ctx, interaction, get_user_id):
                     await interaction.response.send_message("🚫 Pas ton tour.", ephemeral=True)
                     return
-                view.selected = emoji
-                view.stop()
+                if settle_click(ctx, view, interaction.user.id, emoji == intrus):
+                    view.selected = emoji
                 await interaction.response.defer()
             return callback
 
@@ -472,7 +445,12 @@ async def memoire_visuelle(ctx, embed, get_user_id, bot):
         button.callback = await make_callback(e)
         view.add_item(button)
 
-    await ctx.edit(embed=embed, view=view)
+    await round_renderer.play(ctx, [
+        field_frame(embed, title, f"Mémorise bien ces {len(shown_emojis)} emojis :\n{' '.join(shown_emojis)}",
+                    hold=prep_time),
+        field_frame(embed, title, hidden, hold=1),
+        field_frame(embed, title, hidden, prompt=True, view=view),
+    ])
     await view.wait()
     return getattr(view, "selected", None) == intrus
 
@@ -483,11 +461,10 @@ memoire_visuelle.prep_time = 4
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 💰 Monnaie
 # ────────────────────────────────────────────────────────────────────────────────
-async def monnaie(ctx, embed, get_user_id, bot):
+async def monnaie(ctx, embed, get_user_id):
     prep_time = 2
-    prix = random.randint(1, 20) + random.choice([0, 0.5, 0.2])
-    donne = prix + random.choice([0.5, 1, 2])
-    rendu = round(donne - prix, 2)
+    puzzle = take_puzzle(ctx, "monnaie")
+    prix, donne, rendu = puzzle["prix"], puzzle["donne"], puzzle["rendu"]
 
     embed.clear_fields()
     embed.add_field(
@@ -495,14 +472,11 @@ async def monnaie(ctx, embed, get_user_id, bot):
         value=f"Prix : {prix:.2f} €\nPayé : {donne:.2f} €\n➡️ Quelle monnaie rends-tu ?",
         inline=False
     )
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
+    frames = [Frame(hold=prep_time, prompt=True, embed=embed)]
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return abs(float(msg.content.replace(',', '.')) - rendu) < 0.01
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 monnaie.title = "Monnaie"
 monnaie.emoji = "💰"
@@ -511,10 +485,9 @@ monnaie.prep_time = 2
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🔁 Mot miroir
 # ────────────────────────────────────────────────────────────────────────────────
-async def mot_miroir(ctx, embed, get_user_id, bot):
+async def mot_miroir(ctx, embed, get_user_id):
     prep_time = 2
-    mots = ["maison", "cerveau", "banane", "ordinateur", "voiture"]
-    mot = random.choice(mots)
+    mot = take_puzzle(ctx, "mot_miroir")["mot"]
     mot_inverse = mot[::-1]
 
     embed.clear_fields()
@@ -523,14 +496,11 @@ async def mot_miroir(ctx, embed, get_user_id, bot):
         value=f"Tape ce mot à l'envers : {mot}",
         inline=False
     )
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
+    frames = [Frame(hold=prep_time, prompt=True, embed=embed)]
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return msg.content.lower() == mot_inverse
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 mot_miroir.title = "Mot miroir"
 mot_miroir.emoji = "🔁"
@@ -539,21 +509,18 @@ mot_miroir.prep_time = 2
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🔤 Pagaille
 # ────────────────────────────────────────────────────────────────────────────────
-async def pagaille(ctx, embed, get_user_id, bot):
+async def pagaille(ctx, embed, get_user_id):
     prep_time = 2
-    mot = random.choice(["amour", "cerveau", "maison", "voiture", "banane"])
-    melange = "".join(random.sample(mot, len(mot)))
+    puzzle = take_puzzle(ctx, "pagaille")
+    mot, melange = puzzle["mot"], puzzle["melange"]
 
     embed.clear_fields()
     embed.add_field(name="🔤 Pagaille", value=f"{melange}\n➡️ Remets les lettres dans l’ordre !", inline=False)
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
+    frames = [Frame(hold=prep_time, prompt=True, embed=embed)]
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return msg.content.lower() == mot
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 pagaille.title = "Pagaille"
 pagaille.emoji = "🔤"
@@ -562,9 +529,9 @@ pagaille.prep_time = 2
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 ⚖️ Pair ou impair
 # ────────────────────────────────────────────────────────────────────────────────
-async def pair_ou_impair(ctx, embed, get_user_id, bot):
+async def pair_ou_impair(ctx, embed, get_user_id):
     prep_time = 1.5
-    nombre = random.randint(10, 99)
+    nombre = take_puzzle(ctx, "pair_ou_impair")["nombre"]
 
     embed.clear_fields()
     embed.add_field(
@@ -572,21 +539,14 @@ async def pair_ou_impair(ctx, embed, get_user_id, bot):
         value=f"Le nombre est **{nombre}**.\n➡️ Tape `pair` ou `impair` !",
         inline=False
     )
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
+    frames = [Frame(hold=prep_time, prompt=True, embed=embed)]
 
-    try:
-        msg = await bot.wait_for(
-            "message",
-            check=lambda m: m.author.id == get_user_id(),
-            timeout=TIMEOUT
-        )
+    def judge(msg):
         reponse = msg.content.lower().strip()
         if reponse not in ["pair", "impair"]:
             return False
         return (nombre % 2 == 0 and reponse == "pair") or (nombre % 2 == 1 and reponse == "impair")
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 pair_ou_impair.title = "Pair ou impair"
 pair_ou_impair.emoji = "⚖️"
@@ -595,21 +555,18 @@ pair_ou_impair.prep_time = 1.5
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 ⚡ Rapidité
 # ────────────────────────────────────────────────────────────────────────────────
-async def rapidite(ctx, embed, get_user_id, bot):
+async def rapidite(ctx, embed, get_user_id):
     prep_time = 2
-    nums = random.sample(range(10, 99), 5)
-    mode = random.choice(["grand", "petit"])
+    puzzle = take_puzzle(ctx, "rapidite")
+    nums, mode = list(puzzle["nums"]), puzzle["mode"]
     embed.clear_fields()
     embed.add_field(name="⚡ Rapidité", value=f"Trouve le plus {mode} : {', '.join(map(str, nums))}", inline=False)
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
+    frames = [Frame(hold=prep_time, prompt=True, embed=embed)]
 
     correct = max(nums) if mode == "grand" else min(nums)
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return int(msg.content) == correct
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 rapidite.title = "Rapidité"
 rapidite.emoji = "⚡"
@@ -618,7 +575,7 @@ rapidite.prep_time = 2
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 ⚡ Réflexe couleur
 # ────────────────────────────────────────────────────────────────────────────────
-async def reflexe_couleur(ctx, embed, get_user_id, bot):
+async def reflexe_couleur(ctx, embed, get_user_id):
     prep_time = 2
     embed.clear_fields()
     embed.add_field(
@@ -626,8 +583,6 @@ async def reflexe_couleur(ctx, embed, get_user_id, bot):
         value="Appuie sur le bouton **dès qu'il devient vert**.\nMais pas avant 👀",
         inline=False
     )
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
 
     class ReflexeView(discord.ui.View):
         def __init__(self):
@@ -639,32 +594,35 @@ async def reflexe_couleur(ctx, embed, get_user_id, bot):
 
         @discord.ui.button(label="🔴 ATTENDS...", style=discord.ButtonStyle.danger)
         async def reflexe(self, interaction: discord.Interaction, button: discord.ui.Button):
-            if interaction.user.id != get_user_id():
+            if not is_player(ctx, interaction, get_user_id):
                 await interaction.response.send_message("🚫 Ce n’est pas ton jeu.", ephemeral=True)
                 return
             if button.style == discord.ButtonStyle.danger:
-                self.too_early = True
-                self.clicked = True
-                self.stop()
+                if settle_click(ctx, self, interaction.user.id, False):
+                    self.too_early = True
+                    self.clicked = True
                 await interaction.response.send_message("❌ Trop tôt !", ephemeral=True)
             elif button.style == discord.ButtonStyle.success:
-                self.reaction_time = round(asyncio.get_event_loop().time() - self.start_time, 3)
-                self.clicked = True
-                self.stop()
+                self.reaction_time = round(time.time() - self.start_time, 3)
+                self.clicked = settle_click(ctx, self, interaction.user.id, True)
                 await interaction.response.send_message(f"✅ Réflexe en {self.reaction_time}s !", ephemeral=True)
 
     view = ReflexeView()
-    msg = await ctx.edit(view=view)
-
-    await asyncio.sleep(random.uniform(2, 5))
+    delay = take_puzzle(ctx, "reflexe_couleur")["delay"]
+    await round_renderer.play(ctx, [
+        Frame(hold=prep_time, embed=embed),
+        Frame(hold=delay, view=view),
+    ])
     if view.is_finished():
         return False
 
+    # Le chrono part quand le bouton vert est réellement affiché (provisoire d’ici là)
     button = view.children[0]
     button.label = "🟢 CLIQUE !"
     button.style = discord.ButtonStyle.success
-    await msg.edit(view=view)
-    view.start_time = asyncio.get_event_loop().time()
+    view.start_time = time.time()
+    timeline = await round_renderer.play(ctx, [Frame(prompt=True, view=view)])
+    view.start_time = timeline.prompt_at or view.start_time
     await view.wait()
 
     if view.too_early or not view.clicked or view.reaction_time is None:
@@ -678,13 +636,12 @@ reflexe_couleur.prep_time = 2
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🧩 Séquence de symboles (version avec boutons)
 # ────────────────────────────────────────────────────────────────────────────────
-async def sequence_symboles(ctx, embed, get_user_id, bot):
-    import random, asyncio
+async def sequence_symboles(ctx, embed, get_user_id):
     from discord.ui import View, Button
     from discord import ButtonStyle
 
-    symbols = ["⭐", "🍎", "🐍", "⚡", "🎲", "🍀", "🐱", "🔥"]
-    seq = random.sample(symbols, 4)
+    puzzle = take_puzzle(ctx, "sequence_symboles")
+    symbols, seq = list(puzzle["symbols"]), list(puzzle["seq"])
 
     # Affichage initial
     embed.clear_fields()
@@ -694,15 +651,14 @@ async def sequence_symboles(ctx, embed, get_user_id, bot):
         inline=False
     )
     embed.add_field(name="Séquence :", value=" ".join(seq), inline=False)
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(sequence_symboles.prep_time)
+    await round_renderer.play(ctx, [Frame(hold=sequence_symboles.prep_time, embed=embed)])
 
     # On cache la séquence
-    question_type = random.choice(["position", "complete"])
+    question_type = puzzle["question_type"]
     embed.clear_fields()
 
     if question_type == "position":
-        index = random.randint(0, len(seq) - 1)
+        index = puzzle["index"]
         embed.add_field(
             name="🧩 Séquence de symboles",
             value=f"Quel était le **{index+1}ᵉ** emoji ?",
@@ -713,7 +669,7 @@ async def sequence_symboles(ctx, embed, get_user_id, bot):
     else:
         embed.add_field(
             name="🧩 Séquence de symboles",
-            value="Clique sur les 4 emojis dans **le bon ordre** !",
+            value=f"Clique sur les {len(seq)} emojis dans **le bon ordre** !",
             inline=False
         )
         correct_answer = seq
@@ -724,44 +680,50 @@ async def sequence_symboles(ctx, embed, get_user_id, bot):
         def __init__(self):
             super().__init__(timeout=TIMEOUT)
             self.result = False
-            self.selected = []
+            self.selected = {}  # user_id → symboles cliqués (une séquence par joueur)
 
     view = SequenceView()
+    multi = round_renderer.is_multiplayer(ctx)
 
     # ────────────── Création des boutons ──────────────
     for symbol in symbols:
         async def callback(interaction, s=symbol):
-            if interaction.user.id != get_user_id():
+            if not is_player(ctx, interaction, get_user_id):
                 await interaction.response.send_message("🚫 Pas ton tour !", ephemeral=True)
                 return
 
             if multiple_clicks:
-                view.selected.append(s)
-                # met à jour le bouton (désactivé après clic)
-                for btn in view.children:
-                    if btn.label == s:
-                        btn.disabled = True
-                        break
-                await interaction.response.edit_message(view=view)
+                selected = view.selected.setdefault(interaction.user.id, [])
+                selected.append(s)
+                if multi:
+                    # Boutons partagés entre les joueurs : rien n’est désactivé
+                    await interaction.response.defer()
+                else:
+                    # met à jour le bouton (désactivé après clic)
+                    for btn in view.children:
+                        if btn.label == s:
+                            btn.disabled = True
+                            break
+                    await interaction.response.edit_message(view=view)
 
                 # si 4 choix faits, on vérifie
-                if len(view.selected) == len(correct_answer):
-                    view.result = view.selected == correct_answer
-                    view.stop()
+                if len(selected) == len(correct_answer):
+                    if settle_click(ctx, view, interaction.user.id, selected == correct_answer):
+                        view.result = selected == correct_answer
             else:
-                view.result = (s == correct_answer)
-                view.stop()
+                if settle_click(ctx, view, interaction.user.id, s == correct_answer):
+                    view.result = (s == correct_answer)
                 await interaction.response.defer()
 
         btn = Button(label=symbol, style=ButtonStyle.secondary)
         btn.callback = callback
         view.add_item(btn)
 
-    await ctx.edit(embed=embed, view=view)
+    await round_renderer.play(ctx, [Frame(prompt=True, embed=embed, view=view)])
     await view.wait()
 
     # Nettoyage
-    await ctx.edit(view=None)
+    await round_renderer.play(ctx, [Frame(view=None)])
     return view.result
 
 
@@ -772,20 +734,10 @@ sequence_symboles.prep_time = 8
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🧩 Suite alphabétique
 # ────────────────────────────────────────────────────────────────────────────────
-async def suite_alpha(ctx, embed, get_user_id, bot):
+async def suite_alpha(ctx, embed, get_user_id):
     prep_time = 1
-    sens_normal = random.choice([True, False])
-
-    if sens_normal:
-        start = random.randint(65, 70)
-        step = random.randint(1, 3)
-        serie = [chr(start + i * step) for i in range(4)]
-        answer = chr(start + 4 * step)
-    else:
-        start = random.randint(85, 90)
-        step = random.randint(1, 3)
-        serie = [chr(start - i * step) for i in range(4)]
-        answer = chr(start - 4 * step)
+    puzzle = take_puzzle(ctx, "suite_alpha")
+    serie, answer = list(puzzle["serie"]), puzzle["answer"]
 
     embed.clear_fields()
     embed.add_field(
@@ -793,14 +745,11 @@ async def suite_alpha(ctx, embed, get_user_id, bot):
         value=f"{', '.join(serie)} ... ?",
         inline=False
     )
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
+    frames = [Frame(hold=prep_time, prompt=True, embed=embed)]
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return msg.content.strip().upper() == answer
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 suite_alpha.title = "Suite alphabétique"
 suite_alpha.emoji = "🧩"
@@ -809,49 +758,21 @@ suite_alpha.prep_time = 1
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 ➗ Suite logique
 # ────────────────────────────────────────────────────────────────────────────────
-async def suite_logique(ctx, embed, get_user_id, bot):
+async def suite_logique(ctx, embed, get_user_id):
     prep_time = 2
-    type_suite = random.choice(["arithmétique", "géométrique", "alternée", "carrés", "fibonacci"])
-    serie = []
-
-    if type_suite == "arithmétique":
-        start = random.randint(1, 10)
-        step = random.randint(2, 6)
-        serie = [start + i * step for i in range(5)]
-    elif type_suite == "géométrique":
-        start = random.randint(1, 5)
-        ratio = random.randint(2, 3)
-        serie = [start * (ratio ** i) for i in range(5)]
-    elif type_suite == "alternée":
-        start = random.randint(1, 10)
-        add, sub = random.randint(2, 5), random.randint(1, 4)
-        serie = [start]
-        for i in range(1, 5):
-            serie.append(serie[-1] + add if i % 2 == 1 else serie[-1] - sub)
-    elif type_suite == "carrés":
-        start = random.randint(1, 5)
-        serie = [i ** 2 for i in range(start, start + 5)]
-    elif type_suite == "fibonacci":
-        a, b = random.randint(1, 5), random.randint(1, 5)
-        serie = [a, b]
-        for _ in range(3):
-            serie.append(serie[-1] + serie[-2])
-
-    answer_index = random.randint(0, 4)
-    answer = serie[answer_index]
+    puzzle = take_puzzle(ctx, "suite_logique")
+    serie = list(puzzle["serie"])
+    answer_index, answer = puzzle["answer_index"], puzzle["answer"]
     display_serie = serie.copy()
     display_serie[answer_index] = "?"
 
     embed.clear_fields()
     embed.add_field(name="➗ Suite logique", value=f"{display_serie} ... ?", inline=False)
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)
+    frames = [Frame(hold=prep_time, prompt=True, embed=embed)]
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author.id == get_user_id(), timeout=TIMEOUT)
+    def judge(msg):
         return int(msg.content) == answer
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 suite_logique.title = "Suite logique"
 suite_logique.emoji = "➗"
@@ -860,18 +781,9 @@ suite_logique.prep_time = 2
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 🔎 Trouver la différence
 # ────────────────────────────────────────────────────────────────────────────────
-async def trouver_difference(ctx, embed, get_user_id, bot):
-    import random, asyncio
-
-    liste1 = [random.randint(1, 9) for _ in range(6)]
-    liste2 = liste1.copy()
-    diff_index = random.randint(0, 5)
-
-    while True:
-        new_val = random.randint(1, 9)
-        if new_val != liste1[diff_index]:
-            liste2[diff_index] = new_val
-            break
+async def trouver_difference(ctx, embed, get_user_id):
+    puzzle = take_puzzle(ctx, "trouver_difference")
+    liste1, liste2, diff_index = puzzle["liste1"], puzzle["liste2"], puzzle["diff_index"]
 
     embed.clear_fields()
     embed.add_field(
@@ -880,25 +792,18 @@ async def trouver_difference(ctx, embed, get_user_id, bot):
             f"Voici deux suites de nombres :\n"
             f"**1️⃣** {', '.join(map(str, liste1))}\n"
             f"**2️⃣** {', '.join(map(str, liste2))}\n\n"
-            f"➡️ Quelle **position (1 à 6)** est différente dans la deuxième suite ?"
+            f"➡️ Quelle **position (1 à {len(liste1)})** est différente dans la deuxième suite ?"
         ),
         inline=False
     )
 
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(trouver_difference.prep_time)
+    frames = [Frame(hold=trouver_difference.prep_time, prompt=True, embed=embed)]
 
-    try:
-        msg = await bot.wait_for(
-            "message",
-            check=lambda m: m.author.id == get_user_id(),
-            timeout=TIMEOUT
-        )
+    def judge(msg):
         if not msg.content.isdigit():
             return False
         return int(msg.content.strip()) == diff_index + 1
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 
 trouver_difference.title = "Trouver la différence"
@@ -908,18 +813,11 @@ trouver_difference.prep_time = 1
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 ✏️ Typographie erreur
 # ────────────────────────────────────────────────────────────────────────────────
-async def typo_trap(ctx, embed, get_user_id, bot):
+async def typo_trap(ctx, embed, get_user_id):
     prep_time = 2  # Temps pour observer le mot avant de répondre
 
-    mot = random.choice(["chien", "maison", "voiture", "ordinateur", "banane", "chocolat"])
-    typo_index = random.randint(0, len(mot) - 1)
-    mot_mod = list(mot)
-    
-    # Génère une lettre différente de la lettre originale
-    original = mot_mod[typo_index]
-    nouvelle_lettre = random.choice([chr(i) for i in range(97, 123) if chr(i) != original])
-    mot_mod[typo_index] = nouvelle_lettre
-    mot_mod = "".join(mot_mod)
+    puzzle = take_puzzle(ctx, "typo_trap")
+    mot_mod, nouvelle_lettre = puzzle["mot_mod"], puzzle["lettre"]
 
     embed.clear_fields()
     embed.add_field(
@@ -927,19 +825,12 @@ async def typo_trap(ctx, embed, get_user_id, bot):
         value=f"{mot_mod}\n➡️ Quelle lettre est incorrecte dans ce mot ? (ex: 'x')",
         inline=False
     )
-    await ctx.edit(embed=embed)
-    await asyncio.sleep(prep_time)  # temps d'observation
+    frames = [Frame(hold=prep_time, prompt=True, embed=embed)]
 
     # Attente de la réponse
-    try:
-        msg = await bot.wait_for(
-            "message",
-            check=lambda m: m.author.id == get_user_id(),
-            timeout=TIMEOUT
-        )
+    def judge(msg):
         return msg.content.lower().strip() == nouvelle_lettre
-    except:
-        return False
+    return await _ask(ctx, frames, get_user_id, judge)
 
 typo_trap.title = "Typographie erreur"
 typo_trap.emoji = "✏️"
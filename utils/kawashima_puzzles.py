@@ -0,0 +1,406 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 kawashima_puzzles.py — Énigmes pré-générées des mini-jeux Kawashima
+# Objectif : Générer et valider les énigmes de chaque mini-jeu hors de la boucle
+#            asyncio, en garder une réserve bornée par jeu, éviter de reposer à
+#            un serveur une énigme qu’il vient de voir et régler la difficulté
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import operator
+import random
+from collections import deque
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+POOL_SIZE = 40                  # Énigmes prêtes par jeu
+LOW_WATER = 10                  # En dessous, recharge en arrière-plan
+RECENT_WINDOW = 20              # Énigmes récentes évitées par serveur et par jeu
+MAX_ATTEMPTS = 50               # Tirages max pour une énigme valide / non récente
+DIFFICULTY_WEIGHTS = {1: 0, 2: 1, 3: 0}    # 1 facile, 2 normal (réglages d’origine), 3 difficile
+
+OPS = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+
+class InvalidPuzzle(Exception):
+    pass
+
+def _check(condition: bool, message: str):
+    if not condition:
+        raise InvalidPuzzle(message)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧩 Énigme
+# ────────────────────────────────────────────────────────────────────────────────
+class Puzzle:
+    """Données d’une manche (lecture seule pour les jeux) ; `key` sert au dédoublonnage."""
+    __slots__ = ("game", "difficulty", "data", "key")
+
+    def __init__(self, game: str, difficulty: int, data: dict):
+        self.game = game
+        self.difficulty = difficulty
+        self.data = data
+        self.key = repr(sorted(data.items()))
+
+    def __getitem__(self, name):
+        return self.data[name]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎲 Générateurs (rng, difficulté) → données, et leur validation
+# ────────────────────────────────────────────────────────────────────────────────
+def gen_addition_cachee(rng, level):
+    additions = [rng.randint(-9, 9) for _ in range({1: 4, 2: 6, 3: 8}[level])]
+    return {"additions": tuple(additions), "total": sum(additions)}
+
+def check_addition_cachee(d):
+    _check(d["total"] == sum(d["additions"]), "total faux")
+
+def gen_calcul_rapide(rng, level):
+    op = rng.choice(["+", "-", "*", "/"])
+    if op == "*":
+        high = {1: 5, 2: 10, 3: 15}[level]
+        a, b = rng.randint(1, high), rng.randint(1, high)
+        answer = a * b
+    elif op == "/":
+        b = rng.randint(1, 10)
+        answer = rng.randint(1, {1: 5, 2: 10, 3: 15}[level])
+        a = b * answer
+    else:
+        low, high = {1: (1, 20), 2: (10, 50), 3: (20, 99)}[level]
+        a, b = rng.randint(low, high), rng.randint(low, high)
+        answer = OPS[op](a, b)
+    return {"a": a, "op": op, "b": b, "answer": answer}
+
+def check_calcul_rapide(d):
+    if d["op"] == "/":
+        _check(d["b"] and d["a"] == d["b"] * d["answer"], "division non entière")
+    else:
+        _check(OPS[d["op"]](d["a"], d["b"]) == d["answer"], "résultat faux")
+
+def gen_carre_magique(rng, level):
+    square = [[8, 1, 6], [3, 5, 7], [4, 9, 2]]
+    for _ in range(rng.randint(0, 3)):
+        square = [list(x) for x in zip(*square[::-1])]
+    if rng.choice([True, False]):
+        square = [row[::-1] for row in square]
+    row, col = rng.randint(0, 2), rng.randint(0, 2)
+    return {"square": tuple(map(tuple, square)), "row": row, "col": col, "answer": square[row][col]}
+
+def check_carre_magique(d):
+    sq = d["square"]
+    lines = [list(r) for r in sq] + [list(c) for c in zip(*sq)]
+    lines += [[sq[i][i] for i in range(3)], [sq[i][2 - i] for i in range(3)]]
+    _check(all(sum(line) == 15 for line in lines), "carré non magique")
+    _check(sorted(v for r in sq for v in r) == list(range(1, 10)), "chiffres manquants")
+
+def gen_compter_emojis(rng, level):
+    emojis = ["🍎", "🍌", "🍒", "🍇", "🍊"]
+    size = {1: 3, 2: 4, 3: 5}[level]
+    cible = rng.choice(emojis)
+    grille = tuple(tuple(rng.choice(emojis) for _ in range(size)) for _ in range(size))
+    return {"grille": grille, "cible": cible, "total": sum(ligne.count(cible) for ligne in grille)}
+
+def check_compter_emojis(d):
+    _check(d["total"] == sum(ligne.count(d["cible"]) for ligne in d["grille"]), "compte faux")
+
+def gen_couleurs(rng, level):
+    couleurs = ["bleu", "vert", "rouge", "gris"]
+    mots = couleurs.copy()
+    rng.shuffle(mots)
+    question_type = rng.choice(["mot", "couleur"])
+    cible = rng.choice(mots if question_type == "mot" else couleurs)
+    return {"mots": tuple(mots), "question_type": question_type, "cible": cible}
+
+def check_couleurs(d):
+    _check(sorted(d["mots"]) == sorted(["bleu", "vert", "rouge", "gris"]), "mots incomplets")
+
+def gen_datation(rng, level):
+    span = {1: 3, 2: 7, 3: 30}[level]
+    return {"delta_days": rng.randint(-span, span)}
+
+def gen_directions_opposees(rng, level):
+    return {"arrow": rng.choice(["⬆️", "⬇️", "⬅️", "➡️"])}
+
+def gen_equation_trou(rng, level):
+    op = rng.choice(["+", "-", "*"])
+    if op == "+":
+        a, b = rng.randint(1, 20), rng.randint(1, 20)
+    elif op == "-":
+        a, b = rng.randint(10, 30), rng.randint(1, 10)
+    else:
+        a, b = rng.randint(1, 10), rng.randint(1, 10)
+    hole = rng.choice(["a", "b"])
+    return {"a": a, "op": op, "b": b, "hole": hole, "answer": a if hole == "a" else b}
+
+def check_equation_trou(d):
+    _check(d["answer"] == d[d["hole"]], "trou incohérent")
+
+def gen_heures(rng, level):
+    h1, m1 = rng.randint(0, 23), rng.randint(0, 59)
+    h2, m2 = rng.randint(0, 23), rng.randint(0, 59)
+    return {"h1": h1, "m1": m1, "h2": h2, "m2": m2, "diff": abs((h1 * 60 + m1) - (h2 * 60 + m2))}
+
+def gen_memoire_numerique(rng, level):
+    return {"sequence": tuple(rng.randint(0, 9) for _ in range({1: 4, 2: 6, 3: 8}[level]))}
+
+def gen_memoire_visuelle(rng, level):
+    base = ["🍎", "🚗", "🐶", "🌟", "⚽", "🎲", "💎", "🎵", "🍕", "🐱", "🚀", "🎁"]
+    shown = rng.sample(base, {1: 3, 2: 4, 3: 5}[level])
+    intrus = rng.choice([e for e in base if e not in shown])
+    choices = shown + [intrus]
+    rng.shuffle(choices)
+    return {"shown": tuple(shown), "intrus": intrus, "choices": tuple(choices)}
+
+def check_memoire_visuelle(d):
+    _check(d["intrus"] not in d["shown"] and d["intrus"] in d["choices"], "intrus invalide")
+    _check(len(set(d["choices"])) == len(d["shown"]) + 1, "choix en double")
+
+def gen_monnaie(rng, level):
+    prix = rng.randint(1, 20) + rng.choice([0, 0.5, 0.2])
+    donne = prix + rng.choice([0.5, 1, 2])
+    return {"prix": prix, "donne": donne, "rendu": round(donne - prix, 2)}
+
+def check_monnaie(d):
+    _check(0 < d["rendu"] <= 2, "rendu hors bornes")
+
+def gen_mot_miroir(rng, level):
+    return {"mot": rng.choice(["maison", "cerveau", "banane", "ordinateur", "voiture"])}
+
+def gen_pagaille(rng, level):
+    mot = rng.choice(["amour", "cerveau", "maison", "voiture", "banane"])
+    return {"mot": mot, "melange": "".join(rng.sample(mot, len(mot)))}
+
+def check_pagaille(d):
+    _check(d["melange"] != d["mot"], "mot non mélangé")
+    _check(sorted(d["melange"]) == sorted(d["mot"]), "lettres différentes")
+
+def gen_pair_ou_impair(rng, level):
+    return {"nombre": rng.randint(10, 99) if level < 3 else rng.randint(100, 9999)}
+
+def gen_rapidite(rng, level):
+    return {"nums": tuple(rng.sample(range(10, 99), {1: 4, 2: 5, 3: 7}[level])), "mode": rng.choice(["grand", "petit"])}
+
+def gen_reflexe_couleur(rng, level):
+    return {"delay": round(rng.uniform(2, 5), 2)}
+
+def gen_sequence_symboles(rng, level):
+    symbols = ["⭐", "🍎", "🐍", "⚡", "🎲", "🍀", "🐱", "🔥"]
+    seq = rng.sample(symbols, {1: 3, 2: 4, 3: 5}[level])
+    return {
+        "symbols": tuple(symbols),
+        "seq": tuple(seq),
+        "question_type": rng.choice(["position", "complete"]),
+        "index": rng.randint(0, len(seq) - 1),
+    }
+
+def check_sequence_symboles(d):
+    _check(len(set(d["seq"])) == len(d["seq"]), "symboles en double")
+
+def gen_suite_alpha(rng, level):
+    step = rng.randint(1, 3)
+    if rng.choice([True, False]):
+        start = rng.randint(65, 70)
+        serie = [chr(start + i * step) for i in range(5)]
+    else:
+        start = rng.randint(85, 90)
+        serie = [chr(start - i * step) for i in range(5)]
+    return {"serie": tuple(serie[:4]), "answer": serie[4]}
+
+def check_suite_alpha(d):
+    _check(all(c.isalpha() and c.isupper() for c in d["serie"] + (d["answer"],)), "lettre hors alphabet")
+
+SUITES = {
+    1: ("arithmétique", "carrés"),
+    2: ("arithmétique", "géométrique", "alternée", "carrés", "fibonacci"),
+    3: ("géométrique", "alternée", "fibonacci"),
+}
+
+def gen_suite_logique(rng, level):
+    type_suite = rng.choice(SUITES[level])
+    if type_suite == "arithmétique":
+        start, step = rng.randint(1, 10), rng.randint(2, 6)
+        serie = [start + i * step for i in range(5)]
+    elif type_suite == "géométrique":
+        start, ratio = rng.randint(1, 5), rng.randint(2, 3)
+        serie = [start * (ratio ** i) for i in range(5)]
+    elif type_suite == "alternée":
+        start = rng.randint(1, 10)
+        add, sub = rng.randint(2, 5), rng.randint(1, 4)
+        serie = [start]
+        for i in range(1, 5):
+            serie.append(serie[-1] + add if i % 2 == 1 else serie[-1] - sub)
+    elif type_suite == "carrés":
+        start = rng.randint(1, 5)
+        serie = [i ** 2 for i in range(start, start + 5)]
+    else:
+        serie = [rng.randint(1, 5), rng.randint(1, 5)]
+        for _ in range(3):
+            serie.append(serie[-1] + serie[-2])
+    answer_index = rng.randint(0, 4)
+    return {"type": type_suite, "serie": tuple(serie), "answer_index": answer_index, "answer": serie[answer_index]}
+
+def check_suite_logique(d):
+    _check(d["serie"][d["answer_index"]] == d["answer"], "réponse hors suite")
+
+def gen_trouver_difference(rng, level):
+    size = {1: 5, 2: 6, 3: 8}[level]
+    liste1 = [rng.randint(1, 9) for _ in range(size)]
+    liste2 = liste1.copy()
+    diff_index = rng.randint(0, size - 1)
+    liste2[diff_index] = rng.choice([v for v in range(1, 10) if v != liste1[diff_index]])
+    return {"liste1": tuple(liste1), "liste2": tuple(liste2), "diff_index": diff_index}
+
+def check_trouver_difference(d):
+    diffs = [i for i, (a, b) in enumerate(zip(d["liste1"], d["liste2"])) if a != b]
+    _check(diffs == [d["diff_index"]], "il faut exactement une différence")
+
+def gen_typo_trap(rng, level):
+    mot = rng.choice(["chien", "maison", "voiture", "ordinateur", "banane", "chocolat"])
+    index = rng.randint(0, len(mot) - 1)
+    lettre = rng.choice([chr(i) for i in range(97, 123) if chr(i) != mot[index]])
+    return {"mot": mot, "mot_mod": mot[:index] + lettre + mot[index + 1:], "lettre": lettre}
+
+def check_typo_trap(d):
+    _check(d["mot_mod"] != d["mot"] and len(d["mot_mod"]) == len(d["mot"]), "mot inchangé")
+
+# Jeu → (générateur, validation ou None, énigmes récentes évitées par serveur)
+GENERATORS = {
+    "addition_cachee": (gen_addition_cachee, check_addition_cachee, RECENT_WINDOW),
+    "calcul_rapide": (gen_calcul_rapide, check_calcul_rapide, RECENT_WINDOW),
+    "carre_magique_fiable_emoji": (gen_carre_magique, check_carre_magique, RECENT_WINDOW),
+    "compter_emojis": (gen_compter_emojis, check_compter_emojis, RECENT_WINDOW),
+    "couleurs": (gen_couleurs, check_couleurs, 8),
+    "datation": (gen_datation, None, 5),
+    "directions_opposees": (gen_directions_opposees, None, 1),
+    "equation_trou": (gen_equation_trou, check_equation_trou, RECENT_WINDOW),
+    "heures": (gen_heures, None, RECENT_WINDOW),
+    "memoire_numerique": (gen_memoire_numerique, None, RECENT_WINDOW),
+    "memoire_visuelle": (gen_memoire_visuelle, check_memoire_visuelle, RECENT_WINDOW),
+    "monnaie": (gen_monnaie, check_monnaie, RECENT_WINDOW),
+    "mot_miroir": (gen_mot_miroir, None, 2),
+    "pagaille": (gen_pagaille, check_pagaille, RECENT_WINDOW),
+    "pair_ou_impair": (gen_pair_ou_impair, None, RECENT_WINDOW),
+    "rapidite": (gen_rapidite, None, RECENT_WINDOW),
+    "reflexe_couleur": (gen_reflexe_couleur, None, 0),
+    "sequence_symboles": (gen_sequence_symboles, check_sequence_symboles, RECENT_WINDOW),
+    "suite_alpha": (gen_suite_alpha, check_suite_alpha, RECENT_WINDOW),
+    "suite_logique": (gen_suite_logique, check_suite_logique, RECENT_WINDOW),
+    "trouver_difference": (gen_trouver_difference, check_trouver_difference, RECENT_WINDOW),
+    "typo_trap": (gen_typo_trap, check_typo_trap, RECENT_WINDOW),
+}
+
+def generate(game: str, rng=random, difficulty: int | None = None, weights: dict = None) -> Puzzle:
+    """Une énigme validée (difficulté tirée selon `weights` si non imposée)."""
+    gen, check, _ = GENERATORS[game]
+    weights = weights or DIFFICULTY_WEIGHTS
+    for _ in range(MAX_ATTEMPTS):
+        level = difficulty or rng.choices(list(weights), weights=list(weights.values()))[0]
+        data = gen(rng, level)
+        try:
+            if check:
+                check(data)
+        except InvalidPuzzle:
+            continue
+        return Puzzle(game, level, data)
+    raise InvalidPuzzle(f"{game} : aucune énigme valide en {MAX_ATTEMPTS} tirages")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🏭 Réserves
+# ────────────────────────────────────────────────────────────────────────────────
+class PuzzleFactory:
+    """
+    Une réserve bornée d’énigmes par jeu, rechargée dans un thread quand elle
+    passe sous LOW_WATER. take() ne fait que piocher (aucune génération sur la
+    boucle asyncio, sauf réserve vide) en sautant les énigmes récentes du serveur.
+    """
+
+    def __init__(self, pool_size: int = POOL_SIZE, weights: dict = None):
+        self.pool_size = pool_size
+        self.weights = dict(weights or DIFFICULTY_WEIGHTS)
+        self._pools = {game: deque() for game in GENERATORS}
+        self._recent: dict[tuple, deque] = {}
+        self._refilling = set()
+        self._tasks = set()
+        self.stats = {"taken": 0, "generated_inline": 0, "skipped_recent": 0}
+
+    # ──────────────────────────────────────────────────────────────
+    def set_weights(self, weights: dict):
+        """Nouvelle répartition des difficultés ({1: 1, 2: 2, 3: 1}...) ; les réserves sont vidées."""
+        self.weights = dict(weights)
+        for pool in self._pools.values():
+            pool.clear()
+
+    def _generate_batch(self, game: str, count: int) -> list[Puzzle]:
+        rng = random.Random()
+        return [generate(game, rng, weights=self.weights) for _ in range(count)]
+
+    async def refill(self, game: str):
+        if game in self._refilling:
+            return
+        self._refilling.add(game)
+        try:
+            missing = self.pool_size - len(self._pools[game])
+            if missing > 0:
+                batch = await asyncio.to_thread(self._generate_batch, game, missing)
+                self._pools[game].extend(batch[:self.pool_size - len(self._pools[game])])
+        except Exception as e:
+            print(f"[Kawashima] Recharge des énigmes {game} impossible → {e}")
+        finally:
+            self._refilling.discard(game)
+
+    async def fill_all(self):
+        """Remplit toutes les réserves (au chargement du cog)."""
+        await asyncio.gather(*(self.refill(game) for game in GENERATORS))
+
+    def _schedule_refill(self, game: str):
+        if len(self._pools[game]) >= LOW_WATER or game in self._refilling:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self.refill(game))
+        except RuntimeError:
+            return                              # Pas de boucle (scripts, tests)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # ──────────────────────────────────────────────────────────────
+    def take(self, game: str, guild_id=None) -> Puzzle:
+        """Énigme prête pour `game`, pas vue récemment sur ce serveur."""
+        window = GENERATORS[game][2]
+        recent = self._recent.get((guild_id, game))
+        if recent is None:
+            recent = self._recent[(guild_id, game)] = deque(maxlen=window)
+
+        pool = self._pools[game]
+        puzzle = None
+        for _ in range(len(pool)):
+            candidate = pool.popleft()
+            if candidate.key not in recent:
+                puzzle = candidate
+                break
+            pool.append(candidate)              # Reste disponible pour les autres serveurs
+            self.stats["skipped_recent"] += 1
+
+        if puzzle is None:
+            self.stats["generated_inline"] += 1
+            for _ in range(MAX_ATTEMPTS):
+                puzzle = generate(game, weights=self.weights)
+                if puzzle.key not in recent:
+                    break
+
+        if window:
+            recent.append(puzzle.key)
+        self.stats["taken"] += 1
+        self._schedule_refill(game)
+        return puzzle
+
+    def sizes(self) -> dict[str, int]:
+        return {game: len(pool) for game, pool in self._pools.items()}
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+puzzle_factory = PuzzleFactory()
@@ -0,0 +1,184 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 leaderboard.py — Classements maintenus en mémoire
+# Objectif : Garder les classements (Reiatsu, entraînement cérébral) triés en
+#            mémoire et les mettre à jour à chaque gain de points, pour
+#            répondre au rang d’un joueur, au top paginé et aux « voisins »
+#            sans relire toute la table à chaque clic
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+from bisect import bisect_left, insort
+from utils.supabase_repo import get_reiatsu_scores, get_kawashima_top
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+KAWASHIMA_TOP = 100     # Meilleurs scores d’entraînement cérébral gardés en mémoire
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🏆 Classement trié
+# ────────────────────────────────────────────────────────────────────────────────
+class Leaderboard:
+    """
+    Liste triée de (-score, clé) tenue par bisect + dict clé -> score.
+    - rank() : recherche dichotomique, O(log n)
+    - top() / around() : tranches de la liste triée
+    - set() : retrait + insertion dichotomiques (déplacement mémoire en C)
+    Les ex æquo partagent le même rang (1, 2, 2, 4...).
+    Avec `maxsize`, seuls les meilleurs scores sont gardés.
+    """
+
+    def __init__(self, loader, maxsize: int | None = None):
+        self.loader = loader            # async () -> [(clé, score, nom)]
+        self.maxsize = maxsize
+        self.loaded = False
+        self._order = []                # [(-score, clé)] trié
+        self._scores = {}               # clé -> score
+        self._names = {}                # clé -> nom affiché (optionnel)
+        self._pending = None            # Mises à jour reçues pendant un rechargement
+        self._lock = asyncio.Lock()
+        self.updates = 0
+        self.reloads = 0
+
+    # ──────────────────────────────────────────────────────────────
+    async def ensure_loaded(self) -> bool:
+        """Charge le classement au premier usage ; False si la base est injoignable."""
+        if not self.loaded:
+            try:
+                await self.reload()
+            except Exception as e:
+                print(f"[Classement] Chargement impossible → {e}")
+        return self.loaded
+
+    async def reload(self):
+        """Relit la base (démarrage, resynchronisation périodique)."""
+        async with self._lock:
+            self._pending = {}
+            try:
+                rows = await self.loader()
+            except Exception:
+                self._pending = None
+                raise
+            pending, self._pending = self._pending, None
+
+            self._order, self._scores, self._names = [], {}, {}
+            for key, score, name in rows:
+                self._insert(key, score, name)
+            # Ce qui a changé pendant la lecture est plus récent que l’instantané
+            for key, (score, name) in pending.items():
+                self.set(key, score, name)
+            self.loaded = True
+            self.reloads += 1
+
+    # ──────────────────────────────────────────────────────────────
+    def set(self, key, score: int, name: str | None = None):
+        """Nouveau score d’une clé (ajout, hausse ou baisse)."""
+        score = int(score or 0)
+        if self._pending is not None:
+            self._pending[key] = (score, name)
+        old = self._scores.get(key)
+        if old == score:
+            if name:
+                self._names[key] = name
+            return
+        if old is not None:
+            self._discard(key, old)
+        self._insert(key, score, name)
+        self.updates += 1
+
+    def remove(self, key):
+        old = self._scores.get(key)
+        if old is not None:
+            self._discard(key, old)
+        self._names.pop(key, None)
+
+    def _insert(self, key, score: int, name: str | None):
+        if self.maxsize and len(self._order) >= self.maxsize and (-score, key) > self._order[-1]:
+            return      # Pas assez bon pour un classement limité
+        insort(self._order, (-score, key))
+        self._scores[key] = score
+        if name:
+            self._names[key] = name
+        if self.maxsize and len(self._order) > self.maxsize:
+            _, last = self._order.pop()
+            del self._scores[last]
+            self._names.pop(last, None)
+
+    def _discard(self, key, score: int):
+        index = bisect_left(self._order, (-score, key))
+        if index < len(self._order) and self._order[index] == (-score, key):
+            del self._order[index]
+        del self._scores[key]
+
+    # ──────────────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def score(self, key) -> int | None:
+        return self._scores.get(key)
+
+    def name(self, key) -> str | None:
+        return self._names.get(key)
+
+    def rank(self, key) -> int | None:
+        """Rang (1 = premier) ou None si la clé n’est pas classée."""
+        score = self._scores.get(key)
+        if score is None:
+            return None
+        return self._rank_of(score)
+
+    def _rank_of(self, score: int) -> int:
+        # (-score,) se range avant tous les (-score, clé) : nombre de scores strictement meilleurs
+        return bisect_left(self._order, (-score,)) + 1
+
+    def _entries(self, start: int, stop: int) -> list[tuple]:
+        return [
+            (self._rank_of(-neg), key, -neg, self._names.get(key))
+            for neg, key in self._order[max(start, 0):stop]
+        ]
+
+    def top(self, n: int = 10, page: int = 0) -> list[tuple]:
+        """Page `page` (à partir de 0) du classement : [(rang, clé, score, nom)]."""
+        return self._entries(page * n, (page + 1) * n)
+
+    def around(self, key, radius: int = 2) -> list[tuple]:
+        """La clé et ses `radius` voisins de chaque côté : [(rang, clé, score, nom)]."""
+        score = self._scores.get(key)
+        if score is None:
+            return []
+        index = bisect_left(self._order, (-score, key))
+        return self._entries(index - radius, index + radius + 1)
+
+    def stats(self) -> dict:
+        return {
+            "loaded": self.loaded,
+            "size": len(self._order),
+            "updates": self.updates,
+            "reloads": self.reloads,
+        }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📥 Chargeurs
+# ────────────────────────────────────────────────────────────────────────────────
+async def _load_reiatsu() -> list[tuple]:
+    rows = await get_reiatsu_scores()
+    return [(int(r["user_id"]), r.get("points") or 0, r.get("username")) for r in rows]
+
+async def _load_kawashima() -> list[tuple]:
+    rows = await get_kawashima_top(KAWASHIMA_TOP)
+    # Un joueur peut avoir plusieurs scores : une entrée par partie (horodatage, joueur)
+    return [
+        ((int(r.get("timestamp") or 0), int(r["user_id"])), r.get("score") or 0, r.get("username"))
+        for r in rows
+    ]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instances partagées
+# ────────────────────────────────────────────────────────────────────────────────
+reiatsu_leaderboard = Leaderboard(_load_reiatsu)
+kawashima_leaderboard = Leaderboard(_load_kawashima, maxsize=KAWASHIMA_TOP)
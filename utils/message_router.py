@@ -0,0 +1,113 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 message_router.py — Aiguillage central des messages
+# Objectif : Un seul point d’entrée (on_message de bot.py) qui n’appelle que les
+#            jeux intéressés par le salon du message, et par son premier
+#            caractère ('.', '*'…), au lieu d’un listener par cog et de
+#            prédicats wait_for évalués sur chaque message de chaque serveur
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔀 Abonnement
+# ────────────────────────────────────────────────────────────────────────────────
+class _Route:
+    __slots__ = ("channel_id", "prefixes", "handler", "check", "future")
+
+    def __init__(self, channel_id: int, prefixes, handler=None, check=None, future=None):
+        self.channel_id = channel_id
+        self.prefixes = prefixes      # Tuple de premiers caractères, ou (None,) = tous les messages
+        self.handler = handler        # async handler(message) — abonnement durable
+        self.check = check            # Filtre optionnel
+        self.future = future          # wait_for : résolue avec le premier message accepté
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Routeur
+# ────────────────────────────────────────────────────────────────────────────────
+class MessageRouter:
+    """
+    Index salon → premier caractère → abonnements. Un message ne parcourt que
+    les abonnements de son salon pour son préfixe (et ceux qui veulent tout) :
+    le coût par message ne dépend plus du nombre de cogs ni de parties.
+    """
+
+    def __init__(self):
+        self._routes: dict[int, dict[str | None, list[_Route]]] = {}
+        self.dispatched = 0
+        self.delivered = 0
+
+    # ──────────────────────────────────────────────────────────────
+    def route(self, channel_id: int, handler, prefixes: tuple | None = None) -> _Route:
+        """Envoie à `handler(message)` les messages du salon (commençant par un des `prefixes`)."""
+        return self._add(_Route(int(channel_id), tuple(prefixes) if prefixes else (None,), handler=handler))
+
+    def unroute(self, route: _Route):
+        by_prefix = self._routes.get(route.channel_id)
+        if not by_prefix:
+            return
+        for prefix in route.prefixes:
+            routes = by_prefix.get(prefix)
+            if routes and route in routes:
+                routes.remove(route)
+                if not routes:
+                    del by_prefix[prefix]
+        if not by_prefix:
+            del self._routes[route.channel_id]
+
+    async def wait_for(self, channel_id: int, check=None, timeout: float | None = None, prefixes: tuple | None = None):
+        """
+        Équivalent de bot.wait_for("message") limité à un salon : renvoie le premier
+        message accepté par `check`, lève asyncio.TimeoutError sinon.
+        """
+        future = asyncio.get_running_loop().create_future()
+        route = self._add(_Route(int(channel_id), tuple(prefixes) if prefixes else (None,), check=check, future=future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.unroute(route)
+
+    def _add(self, route: _Route) -> _Route:
+        by_prefix = self._routes.setdefault(route.channel_id, {})
+        for prefix in route.prefixes:
+            by_prefix.setdefault(prefix, []).append(route)
+        return route
+
+    # ──────────────────────────────────────────────────────────────
+    async def dispatch(self, message):
+        by_prefix = self._routes.get(message.channel.id)
+        if not by_prefix:
+            return
+        self.dispatched += 1
+        first = message.content[:1]
+        routes = [*by_prefix.get(first, ()), *by_prefix.get(None, ())] if first else [*by_prefix.get(None, ())]
+
+        for route in routes:
+            try:
+                if route.check is not None and not route.check(message):
+                    continue
+                self.delivered += 1
+                if route.future is not None:
+                    if not route.future.done():
+                        route.future.set_result(message)
+                else:
+                    await route.handler(message)
+            except Exception as e:
+                print(f"[Router] Erreur sur un message de {message.channel.id} → {e}")
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._routes),
+            "routes": sum(len(r) for p in self._routes.values() for r in p.values()),
+            "dispatched": self.dispatched,
+            "delivered": self.delivered,
+        }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+message_router = MessageRouter()
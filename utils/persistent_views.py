@@ -0,0 +1,84 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 persistent_views.py — Composants persistants sans état en mémoire
+# Objectif : Encoder l’état des boutons / menus dans leur custom_id et router
+#            les clics vers un handler enregistré une fois au démarrage, pour
+#            que les messages interactifs ne gardent aucun objet View vivant
+#            et continuent de marcher après un redémarrage
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import discord
+from utils.instance_lease import is_leader
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+SEP = ":"                   # custom_id = "<préfixe>:<arg1>:<arg2>..."
+MAX_CUSTOM_ID = 100         # Limite Discord
+
+_handlers = {}              # préfixe -> async handler(interaction, args)
+_stats = {"dispatched": 0, "errors": 0}
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Construction des composants
+# ────────────────────────────────────────────────────────────────────────────────
+def persistent_component(prefix: str):
+    """Décorateur : `handler(interaction, args)` reçoit les clics des custom_id "prefix:...". """
+    def decorator(func):
+        _handlers[prefix] = func
+        return func
+    return decorator
+
+def make_custom_id(prefix: str, *args) -> str:
+    custom_id = SEP.join([prefix, *map(str, args)])
+    if len(custom_id) > MAX_CUSTOM_ID:
+        raise ValueError(f"custom_id trop long ({len(custom_id)}) : {custom_id[:40]}…")
+    return custom_id
+
+def detached(view: discord.ui.View) -> discord.ui.View:
+    """
+    Arrête la view avant l’envoi : discord.py n’enregistre pas une view terminée,
+    le message garde ses composants mais aucun objet n’est conservé.
+    Les clics arrivent alors à dispatch() via leur custom_id.
+    """
+    view.stop()
+    return view
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📬 Routage des clics
+# ────────────────────────────────────────────────────────────────────────────────
+async def dispatch(interaction: discord.Interaction):
+    if interaction.type != discord.InteractionType.component:
+        return
+    if not is_leader(interaction.client):
+        return  # Instance en attente : l’instance maître répond
+    custom_id = (interaction.data or {}).get("custom_id", "")
+    prefix, _, rest = custom_id.partition(SEP)
+    handler = _handlers.get(prefix)
+    if handler is None or interaction.response.is_done():
+        return
+
+    _stats["dispatched"] += 1
+    try:
+        await handler(interaction, rest.split(SEP) if rest else [])
+    except Exception as e:
+        _stats["errors"] += 1
+        print(f"[Composant] Erreur sur {custom_id} → {e}")
+        if not interaction.response.is_done():
+            try:
+                await interaction.response.send_message("❌ Une erreur est survenue.", ephemeral=True)
+            except discord.HTTPException:
+                pass
+
+def setup_persistent_views(bot):
+    """Branche le routeur sur on_interaction (à appeler une seule fois, au démarrage)."""
+    if not getattr(bot, "_persistent_views_ready", False):
+        bot.add_listener(dispatch, "on_interaction")
+        bot._persistent_views_ready = True
+
+def stats() -> dict:
+    return {"handlers": len(_handlers), **_stats}
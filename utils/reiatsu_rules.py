@@ -0,0 +1,114 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 reiatsu_rules.py — Règles de l’économie Reiatsu (sans Discord ni base)
+# Objectif : Regrouper les tirages de gain (capture), de vol et de skill dans
+#            des fonctions pures, avec un générateur aléatoire injectable, pour
+#            que le bot et le simulateur hors ligne utilisent le même code
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+import random
+from pathlib import Path
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+CONFIG_PATH = Path("data/reiatsu_config.json")
+
+STEAL_SHARE = 10                # Un vol prend 1/10 des points de la cible
+STEAL_CHANCE = {"Voleur": 0.67} # Autres classes : DEFAULT_STEAL_CHANCE
+DEFAULT_STEAL_CHANCE = 0.25
+STEAL_CD = {"Voleur": 19}       # Heures entre deux vols (autres : DEFAULT_STEAL_CD)
+DEFAULT_STEAL_CD = 24
+ILLUSION_CHANCE = 0.5           # Illusionniste volé : chance de ne rien perdre
+FAKE_REIATSU_GAIN = 50          # Gain de l’illusionniste quand son faux Reiatsu est pris
+ILLUSION_SKILL_CD = 8           # Le skill Illusionniste ignore le Cooldown du JSON
+BET_COST = 10                   # Pari du Parieur : mise, gain
+BET_GAIN = 30
+
+def load_config(path: Path = CONFIG_PATH) -> dict:
+    with Path(path).open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎲 Règles
+# ────────────────────────────────────────────────────────────────────────────────
+class ReiatsuRules:
+    """
+    Tirages de l’économie Reiatsu. `config` : contenu de reiatsu_config.json
+    (éventuellement modifié pour une simulation) ; `rng` : tout objet ayant
+    random() / randint() (random.Random(seed) pour des tirages reproductibles).
+    """
+
+    def __init__(self, config: dict, rng=random):
+        self.config = config
+        self.rng = rng
+        self.super_chance = config["SUPER_REIATSU_CHANCE"]
+        self.super_gain = config["SUPER_REIATSU_GAIN"]
+        self.normal_gain = config["NORMAL_REIATSU_GAIN"]
+        self.skill_cd = {name: data.get("Cooldown", 12) for name, data in config.get("CLASSES", {}).items()}
+        self.skill_cd["Illusionniste"] = ILLUSION_SKILL_CD
+
+    # ──────────────────────────────────────────────────────────────
+    def roll_gain(self, classe: str | None, bonus5: int, active_skill: bool, is_fake: bool = False):
+        """Capture d’un Reiatsu → (gain, is_super, nouveau bonus5, fin du skill actif)."""
+        rng = self.rng
+        reset_skill = False
+        if classe == "Absorbeur" and active_skill and not is_fake:
+            is_super = True
+            reset_skill = True
+        else:
+            is_super = rng.randint(1, 100) <= self.super_chance
+
+        gain = self.super_gain if is_super else self.normal_gain
+
+        if not is_super:
+            if classe == "Absorbeur":
+                gain += 4
+            elif classe == "Parieur":
+                gain = 0 if rng.random() < 0.5 else rng.randint(5, 12)
+            elif classe == "Illusionniste":
+                pass
+            else:
+                bonus5 += 1
+                if bonus5 >= 5:
+                    gain = 6
+                    bonus5 = 0
+        else:
+            bonus5 = 0
+
+        return gain, is_super, bonus5, reset_skill
+
+    def roll_steal(self, thief_class: str | None, thief_skill: bool, target_class: str | None, target_points: int):
+        """
+        Tentative de vol → (réussi, montant, illusion, skill consommé).
+        Avec `illusion`, le voleur gagne le montant mais la cible ne perd rien.
+        """
+        rng = self.rng
+        amount = max(1, target_points // STEAL_SHARE)
+        used_skill = thief_class == "Voleur" and thief_skill
+        if used_skill:
+            success = True
+            amount *= 2
+        else:
+            success = rng.random() < STEAL_CHANCE.get(thief_class, DEFAULT_STEAL_CHANCE)
+
+        illusion = success and target_class == "Illusionniste" and rng.random() < ILLUSION_CHANCE
+        return success, amount, illusion, used_skill
+
+    def roll_bet(self) -> int:
+        """Skill Parieur : variation de points (mise perdue ou gain net)."""
+        return -BET_COST if self.rng.random() < 0.5 else BET_GAIN - BET_COST
+
+    @staticmethod
+    def steal_cooldown(classe: str | None) -> int:
+        return STEAL_CD.get(classe, DEFAULT_STEAL_CD)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+reiatsu_rules = ReiatsuRules(load_config())
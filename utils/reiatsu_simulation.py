@@ -0,0 +1,218 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 reiatsu_simulation.py — Simulateur hors ligne de l’économie Reiatsu
+# Objectif : Rejouer des millions de captures, vols et skills avec les vraies
+#            règles (reiatsu_rules) sur des joueurs en mémoire, pour régler
+#            reiatsu_config.json et mesurer le coût du calcul des gains
+# Catégorie : Utils
+# Accès : Interne (python -m utils.reiatsu_simulation --help)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import argparse
+import json
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from utils.reiatsu_rules import ReiatsuRules, load_config, FAKE_REIATSU_GAIN, BET_COST
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+CLASS_MIX = (None, "Voleur", "Absorbeur", "Illusionniste", "Parieur")
+EVENT_WEIGHTS = {"spawn": 6, "steal": 2, "skill": 2}    # Répartition des événements tirés
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 👤 Joueur simulé (remplace la table reiatsu)
+# ────────────────────────────────────────────────────────────────────────────────
+class SimPlayer:
+    __slots__ = ("classe", "points", "bonus5", "active", "next_skill", "next_steal")
+
+    def __init__(self, classe: str | None):
+        self.classe = classe
+        self.points = 0
+        self.bonus5 = 0
+        self.active = False         # active_skill
+        self.next_skill = 0.0       # Heure (simulée) de fin du cooldown de skill
+        self.next_steal = 0.0
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎲 Simulation d’un serveur
+# ────────────────────────────────────────────────────────────────────────────────
+def simulate(players: int = 200, events: int = 100_000, hours: float = 24 * 30,
+             seed: int = 0, config: dict | None = None, mix: tuple = CLASS_MIX) -> dict:
+    """
+    Un serveur de `players` joueurs pendant `hours` heures simulées, `events`
+    événements répartis selon EVENT_WEIGHTS entre joueurs tirés au hasard.
+    Renvoie {"points": {classe: [points...]}, "counts": {...}, "events", "elapsed"}.
+    """
+    rng = random.Random(seed)
+    rules = ReiatsuRules(config or load_config(), rng=rng)
+    pool = [SimPlayer(mix[i % len(mix)]) for i in range(players)]
+    fakes = []                  # Illusionnistes dont le faux Reiatsu attend d’être pris
+    counts = Counter()
+    kinds = rng.choices(list(EVENT_WEIGHTS), weights=list(EVENT_WEIGHTS.values()), k=events)
+    step = hours / events
+
+    start = time.perf_counter()
+    for i, kind in enumerate(kinds):
+        now = i * step
+        player = pool[rng.randrange(players)]
+
+        if kind == "spawn":
+            if fakes and fakes[0] is not player:
+                owner = fakes.pop(0)
+                owner.points += FAKE_REIATSU_GAIN
+                owner.active = False
+                counts["fake_taken"] += 1
+                continue
+            gain, is_super, player.bonus5, reset = rules.roll_gain(player.classe, player.bonus5, player.active)
+            player.points += gain
+            if reset:
+                player.active = False
+            counts["spawn"] += 1
+            counts["super"] += is_super
+
+        elif kind == "steal":
+            target = pool[rng.randrange(players)]
+            if target is player or now < player.next_steal or not player.points or not target.points:
+                counts["steal_skipped"] += 1
+                continue
+            player.next_steal = now + rules.steal_cooldown(player.classe)
+            success, amount, illusion, used_skill = rules.roll_steal(
+                player.classe, player.active, target.classe, target.points
+            )
+            if used_skill:
+                player.active = False
+            if not success or (not illusion and amount > target.points):
+                counts["steal_failed"] += 1     # Raté, ou débit refusé par reiatsu_transfer
+                continue
+            player.points += amount
+            if illusion:
+                counts["illusion"] += 1
+            else:
+                target.points -= amount
+            counts["steal_ok"] += 1
+
+        else:
+            if player.classe is None or player.active or now < player.next_skill:
+                counts["skill_skipped"] += 1
+                continue
+            if player.classe == "Parieur":
+                if player.points < BET_COST:
+                    counts["skill_skipped"] += 1
+                    continue
+                player.points += rules.roll_bet()
+            else:
+                player.active = True
+                if player.classe == "Illusionniste":
+                    fakes.append(player)
+            player.next_skill = now + rules.skill_cd.get(player.classe, 12)
+            counts["skill"] += 1
+
+    elapsed = time.perf_counter() - start
+    points = {}
+    for p in pool:
+        points.setdefault(p.classe or "Sans classe", []).append(p.points)
+    return {"points": points, "counts": dict(counts), "events": events, "elapsed": elapsed}
+
+def _simulate_kwargs(kwargs: dict) -> dict:
+    return simulate(**kwargs)
+
+def run(replicas: int = 4, workers: int | None = None, seed: int = 0, **params) -> dict:
+    """
+    `replicas` serveurs indépendants (graines seed, seed+1...) simulés en
+    parallèle dans des processus, résultats fusionnés.
+    """
+    jobs = [{**params, "seed": seed + r} for r in range(replicas)]
+    start = time.perf_counter()
+    if workers == 1 or replicas == 1:
+        results = [simulate(**job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_simulate_kwargs, jobs))
+    wall = time.perf_counter() - start
+
+    points, counts = {}, Counter()
+    for res in results:
+        for classe, values in res["points"].items():
+            points.setdefault(classe, []).extend(values)
+        counts.update(res["counts"])
+    events = sum(res["events"] for res in results)
+    return {
+        "points": points,
+        "counts": dict(counts),
+        "events": events,
+        "wall": wall,
+        "events_per_sec": events / wall if wall else 0.0,
+    }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⏱️ Banc d’essai du calcul des gains
+# ────────────────────────────────────────────────────────────────────────────────
+def bench_gain(calls: int = 1_000_000, seed: int = 0, config: dict | None = None) -> dict:
+    """Appels par seconde de ReiatsuRules.roll_gain, par classe."""
+    results = {}
+    for classe in CLASS_MIX:
+        rules = ReiatsuRules(config or load_config(), rng=random.Random(seed))
+        roll = rules.roll_gain
+        bonus5 = 0
+        start = time.perf_counter()
+        for _ in range(calls):
+            _, _, bonus5, _ = roll(classe, bonus5, False)
+        elapsed = time.perf_counter() - start
+        results[classe or "Sans classe"] = calls / elapsed if elapsed else 0.0
+    return results
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📊 Rapport
+# ────────────────────────────────────────────────────────────────────────────────
+def _percentile(values: list, q: float):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0
+
+def format_report(result: dict) -> str:
+    lines = [f"{'Classe':<15}{'Joueurs':>8}{'Moyenne':>10}{'p10':>8}{'Médiane':>9}{'p90':>8}{'Max':>8}"]
+    for classe, values in sorted(result["points"].items()):
+        mean = sum(values) / len(values) if values else 0
+        lines.append(
+            f"{classe:<15}{len(values):>8}{mean:>10.1f}{_percentile(values, .1):>8}"
+            f"{_percentile(values, .5):>9}{_percentile(values, .9):>8}{max(values, default=0):>8}"
+        )
+    lines.append("")
+    lines.append("Événements : " + ", ".join(f"{k} {v}" for k, v in sorted(result["counts"].items())))
+    lines.append(f"{result['events']:,} événements en {result['wall']:.2f}s → {result['events_per_sec']:,.0f} /s")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation de l’économie Reiatsu (hors ligne).")
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--events", type=int, default=250_000, help="Événements par serveur simulé")
+    parser.add_argument("--hours", type=float, default=24 * 30, help="Durée simulée par serveur")
+    parser.add_argument("--replicas", type=int, default=4, help="Serveurs indépendants")
+    parser.add_argument("--workers", type=int, default=None, help="Processus (défaut : nombre de cœurs)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", action="append", default=[], metavar="CLÉ=VALEUR",
+                        help="Surcharge de reiatsu_config.json (valeur JSON), ex. SUPER_REIATSU_CHANCE=2")
+    parser.add_argument("--bench", type=int, default=0, metavar="N",
+                        help="Mesure aussi N appels de roll_gain par classe")
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    for item in args.set:
+        key, _, value = item.partition("=")
+        config[key] = json.loads(value)
+
+    result = run(args.replicas, args.workers, args.seed, players=args.players,
+                 events=args.events, hours=args.hours, config=config)
+    print(format_report(result))
+
+    if args.bench:
+        print("\nroll_gain :")
+        for classe, rate in bench_gain(args.bench, args.seed, config).items():
+            print(f"  {classe:<15}{rate:>14,.0f} appels/s")
+
+if __name__ == "__main__":
+    main()
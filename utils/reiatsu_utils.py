@@ -8,13 +8,146 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
-from utils.supabase_client import supabase
+from utils.supabase_repo import get_reiatsu, insert_reiatsu, update_reiatsu, add_reiatsu_points, reiatsu_transfer
+from utils.leaderboard import reiatsu_leaderboard
+from collections import OrderedDict
 import datetime
+import time
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗃️ Cache des profils Reiatsu (LRU + TTL)
+# ────────────────────────────────────────────────────────────────────────────────
+PROFILE_CACHE_SIZE = 2048   # Nombre max de profils gardés en mémoire
+PROFILE_CACHE_TTL = 300     # Durée de vie d’une entrée (secondes)
+
+class ProfileCache:
+    """Cache LRU à expiration des lignes de la table reiatsu, indexé par user_id (int)."""
+
+    def __init__(self, maxsize: int = PROFILE_CACHE_SIZE, ttl: float = PROFILE_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()   # user_id -> (expire_at, profil)
+
+    def get(self, user_id: int) -> dict | None:
+        entry = self._data.get(user_id)
+        if not entry:
+            return None
+        expire_at, profile = entry
+        if time.monotonic() >= expire_at:
+            del self._data[user_id]
+            return None
+        self._data.move_to_end(user_id)
+        return profile
+
+    def set(self, user_id: int, profile: dict):
+        self._data[user_id] = (time.monotonic() + self.ttl, profile)
+        self._data.move_to_end(user_id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def patch(self, user_id: int, data: dict):
+        """Applique une mise à jour partielle si le profil est en cache."""
+        profile = self.get(user_id)
+        if profile is not None:
+            profile.update(data)
+
+    def invalidate(self, user_id: int):
+        self._data.pop(user_id, None)
+
+profile_cache = ProfileCache()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔹 Lecture / écriture des profils via le cache
+# ────────────────────────────────────────────────────────────────────────────────
+async def get_profile(user_id) -> dict | None:
+    """Renvoie (une copie du) profil Reiatsu, depuis le cache si possible."""
+    user_id = int(user_id)
+    profile = profile_cache.get(user_id)
+    if profile is None:
+        profile = await get_reiatsu(user_id)
+        if not profile:
+            return None
+        profile_cache.set(user_id, profile)
+    return dict(profile)
+
+async def update_profile(user_id, data: dict):
+    """Écrit les champs en base puis met le cache à jour (write-through)."""
+    user_id = int(user_id)
+    await update_reiatsu(user_id, data)
+    profile_cache.patch(user_id, data)
+    if "points" in data:
+        reiatsu_leaderboard.set(user_id, data["points"], data.get("username"))
+
+def _remember(profile: dict):
+    user_id = int(profile["user_id"])
+    profile_cache.set(user_id, profile)
+    reiatsu_leaderboard.set(user_id, profile.get("points"), profile.get("username"))
+
+async def add_points(user_id, delta: int, fields: dict | None = None, username: str | None = None,
+                     reason: str = "points") -> dict | None:
+    """
+    Ajoute (ou retire si delta < 0) des points en une seule écriture atomique,
+    avec d’éventuels champs annexes (bonus5, active_skill...). Renvoie le profil à jour.
+    Un retrait ne descend jamais sous 0 ; pour un débit qui doit échouer, voir spend_points.
+    """
+    user_id = int(user_id)
+    profile = await add_reiatsu_points(user_id, delta, fields, username, reason)
+    if profile:
+        _remember(profile)
+    else:
+        profile_cache.invalidate(user_id)
+    return dict(profile) if profile else None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔁 Transferts entre joueurs (journalisés dans reiatsu_ledger)
+# ────────────────────────────────────────────────────────────────────────────────
+class InsufficientReiatsu(Exception):
+    """Un débit strict dépasse le solde d’un joueur : aucun mouvement n’a été appliqué."""
+
+def move(user_id, delta: int, fields: dict | None = None, username: str | None = None,
+         strict: bool = True) -> dict:
+    """
+    Un mouvement de transfer(). `strict` : un débit supérieur au solde fait
+    échouer tout le transfert (sinon il est ramené au solde disponible).
+    """
+    entry = {"user_id": int(user_id), "delta": int(delta), "strict": strict}
+    if fields:
+        entry["fields"] = fields
+    if username:
+        entry["username"] = username
+    return entry
+
+async def transfer(moves: list[dict], reason: str) -> dict[int, dict]:
+    """
+    Applique plusieurs mouvements en une requête et une transaction (vol,
+    mise...) : les soldes sont vérifiés sous verrou, rien n’est perdu entre
+    deux actions simultanées. Renvoie {user_id: profil à jour}.
+    Lève InsufficientReiatsu si un débit strict n’est pas couvert.
+    """
+    try:
+        rows = await reiatsu_transfer(moves, reason)
+    except Exception as e:
+        if "REIATSU_INSUFFICIENT" in str(e):
+            raise InsufficientReiatsu(str(e)) from e
+        for m in moves:
+            profile_cache.invalidate(m["user_id"])
+        raise
+    for row in rows:
+        _remember(row)
+    return {int(row["user_id"]): dict(row) for row in rows}
+
+async def spend_points(user_id, cost: int, reason: str, fields: dict | None = None) -> dict | None:
+    """Débite `cost` points si le solde suffit (vérifié en base) ; profil à jour, ou None si refusé."""
+    try:
+        profiles = await transfer([move(user_id, -cost, fields)], reason)
+    except InsufficientReiatsu:
+        return None
+    return profiles.get(int(user_id))
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 Création d’un profil joueur si inexistant
 # ────────────────────────────────────────────────────────────────────────────────
-def ensure_profile(user_id: int, username: str) -> dict:
+async def ensure_profile(user_id: int, username: str) -> dict:
     """
     Vérifie si un joueur a un profil Reiatsu.
     Si non, le crée automatiquement et renvoie le profil.
@@ -22,10 +155,9 @@ def ensure_profile(user_id: int, username: str) -> dict:
     Returns:
         dict : Profil joueur
     """
-    res = supabase.table("reiatsu").select("*").eq("user_id", user_id).execute()
-
-    if res.data:
-        return res.data[0]
+    profile = await get_profile(user_id)
+    if profile:
+        return profile
 
     # Création automatique
     now_iso = datetime.datetime.utcnow().isoformat()
@@ -39,7 +171,9 @@ def ensure_profile(user_id: int, username: str) -> dict:
         "last_steal_attempt": None,
         "steal_cd": 24
     }
-    supabase.table("reiatsu").insert(profile).execute()
+    await insert_reiatsu(profile)
+    profile_cache.set(int(user_id), dict(profile))
+    reiatsu_leaderboard.set(int(user_id), 0, username)
     return profile
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,139 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 render_scheduler.py — Planificateur d’éditions pour les animations
+# Objectif : Regrouper les éditions successives d’un même message : seul le
+#            dernier état est envoyé, à une cadence bornée par message, pour
+#            que les animations (courses, tris, épreuves) ne déclenchent plus
+#            de rafales de 429
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import time
+import asyncio
+import discord
+from discord.utils import MISSING
+from utils.discord_utils import _discord_action
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+# Discord tolère environ 5 éditions / 5 s par salon : 1 image/s par message
+# laisse de la marge quand plusieurs animations tournent dans le même salon.
+DEFAULT_MIN_INTERVAL = 1.0
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎞️ État d’une cible (message ou réponse d’interaction)
+# ────────────────────────────────────────────────────────────────────────────────
+class _RenderState:
+    __slots__ = ("edit_func", "interval", "pending", "waiters", "last_sent", "task")
+
+    def __init__(self, edit_func, interval: float):
+        self.edit_func = edit_func
+        self.interval = interval
+        self.pending = None      # Dernier état demandé, pas encore envoyé
+        self.waiters = []        # Futures des images fusionnées dans `pending`
+        self.last_sent = 0.0     # loop.time() du dernier envoi
+        self.task = None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Planificateur
+# ────────────────────────────────────────────────────────────────────────────────
+class RenderScheduler:
+    """
+    Une tâche par cible active, qui envoie l’état le plus récent au plus une fois
+    par intervalle. Les images intermédiaires sont fusionnées (les derniers champs
+    gagnent) ; chaque submit() renvoie une Future résolue avec l’heure (time.time())
+    à laquelle l’image — ou celle qui l’a remplacée — est réellement affichée.
+    Les buckets par route sont déjà respectés par discord.py ; ce planificateur
+    garde simplement la cadence d’édition en dessous.
+    """
+
+    def __init__(self, min_interval: float = DEFAULT_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._states: dict = {}
+        self.frames_submitted = 0
+        self.frames_sent = 0
+
+    # ──────────────────────────────────────────────────────────────
+    def submit(self, key, edit_func, min_interval: float | None = None, **fields) -> asyncio.Future:
+        """Planifie une édition de la cible `key` ; ne bloque pas."""
+        loop = asyncio.get_running_loop()
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _RenderState(edit_func, min_interval or self.min_interval)
+        elif min_interval:
+            state.interval = min_interval
+
+        # Copie des embeds : l’appelant peut modifier le sien avant l’envoi
+        if isinstance(fields.get("embed"), discord.Embed):
+            fields["embed"] = fields["embed"].copy()
+
+        state.pending = {**(state.pending or {}), **fields}
+        future = loop.create_future()
+        state.waiters.append(future)
+        self.frames_submitted += 1
+
+        if state.task is None or state.task.done():
+            state.task = asyncio.create_task(self._run(key, state))
+        return future
+
+    async def flush(self, key):
+        """Attend que tout ce qui est en attente pour `key` soit affiché."""
+        state = self._states.get(key)
+        if state and state.waiters:
+            await asyncio.gather(*state.waiters, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "active": len(self._states),
+            "submitted": self.frames_submitted,
+            "sent": self.frames_sent,
+            "dropped": self.frames_submitted - self.frames_sent - sum(len(s.waiters) for s in self._states.values()),
+        }
+
+    # ──────────────────────────────────────────────────────────────
+    async def _run(self, key, state: _RenderState):
+        loop = asyncio.get_running_loop()
+        try:
+            while state.pending is not None:
+                wait = state.last_sent + state.interval - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                frame, waiters = state.pending, state.waiters
+                state.pending, state.waiters = None, []
+                try:
+                    await _discord_action(state.edit_func, delay=0, **frame)
+                except Exception as e:
+                    print(f"[Render] Édition ignorée → {e}")
+                state.last_sent = loop.time()
+                self.frames_sent += 1
+
+                shown_at = time.time()
+                for future in waiters:
+                    if not future.done():
+                        future.set_result(shown_at)
+        finally:
+            if self._states.get(key) is state and state.pending is None:
+                del self._states[key]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée et raccourcis
+# ────────────────────────────────────────────────────────────────────────────────
+renderer = RenderScheduler()
+
+def queue_edit(message: discord.Message, content=MISSING, **kwargs) -> asyncio.Future:
+    """
+    Équivalent non bloquant de safe_edit : seule la dernière version est envoyée.
+    Sans `content`, le texte n’est pas fusionné et reste tel quel (content=None l’efface).
+    """
+    if content is not MISSING:
+        kwargs["content"] = content
+    return renderer.submit(message.id, message.edit, **kwargs)
+
+async def safe_render(message: discord.Message, content=MISSING, **kwargs) -> float:
+    """Édite via le planificateur et attend l’affichage ; renvoie l’heure d’affichage."""
+    return await queue_edit(message, content, **kwargs)
@@ -0,0 +1,133 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 round_renderer.py — Affichage minuté des manches (mini-jeux Kawashima)
+# Objectif : Jouer les images d’une manche prévues à l’avance dans un seul
+#            pipeline par message (via le planificateur d’éditions), noter
+#            l’heure réelle d’affichage de chacune, et en particulier celle de
+#            la question, pour que le score ne compte que le temps de réponse
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import time
+import asyncio
+import discord
+from utils.render_scheduler import renderer
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎞️ Image et chronologie d’une manche
+# ────────────────────────────────────────────────────────────────────────────────
+class Frame:
+    """
+    Une image de la manche : champs de message.edit (embed, view...), durée
+    d’affichage `hold` (comptée à partir de l’affichage réel) et `prompt` si
+    c’est l’image à partir de laquelle le joueur peut répondre.
+    """
+    __slots__ = ("fields", "hold", "prompt")
+
+    def __init__(self, hold: float = 0.0, prompt: bool = False, **fields):
+        self.fields = fields
+        self.hold = hold
+        self.prompt = prompt
+
+def field_frame(embed: discord.Embed, name: str, value: str, hold: float = 0.0,
+                prompt: bool = False, **fields) -> Frame:
+    """Image « un seul champ » sur une copie de l’embed de la manche."""
+    frame_embed = embed.copy()
+    frame_embed.clear_fields()
+    frame_embed.add_field(name=name, value=value, inline=False)
+    return Frame(hold=hold, prompt=prompt, embed=frame_embed, **fields)
+
+class RoundTimeline:
+    """Heures (time.time()) d’affichage des images, de la question et de la réponse."""
+    __slots__ = ("shown", "prompt_at", "prompted", "answered_at", "answered_by", "players", "out", "lock")
+
+    def __init__(self, players=None):
+        self.shown = []
+        self.prompt_at = None
+        self.prompted = asyncio.Event()                     # Posé dès que la question est affichée
+        self.answered_at = None
+        self.answered_by = None
+        self.players = set(players) if players else None   # Multijoueur : tous peuvent répondre
+        self.out = set()                                    # Multijoueur : éliminés de la manche
+        self.lock = asyncio.Lock()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Rendu
+# ────────────────────────────────────────────────────────────────────────────────
+class RoundRenderer:
+    """
+    Une chronologie par message de manche. play() envoie les images l’une
+    après l’autre au planificateur (une seule file par message, jamais de
+    rafale) et attend chaque affichage avant de lancer son `hold`.
+    """
+
+    def __init__(self):
+        self._timelines: dict[int, RoundTimeline] = {}
+
+    def open(self, message: discord.Message, players=None) -> RoundTimeline:
+        """Nouvelle manche sur `message` (remplace une chronologie restée ouverte)."""
+        timeline = self._timelines[message.id] = RoundTimeline(players)
+        return timeline
+
+    def timeline(self, message: discord.Message) -> RoundTimeline:
+        timeline = self._timelines.get(message.id)
+        if timeline is None:
+            timeline = self._timelines[message.id] = RoundTimeline()
+        return timeline
+
+    def pop(self, message: discord.Message) -> RoundTimeline:
+        return self._timelines.pop(message.id, None) or RoundTimeline()
+
+    # ──────────────────────────────────────────────────────────────
+    async def play(self, message: discord.Message, frames: list[Frame]) -> RoundTimeline:
+        timeline = self.timeline(message)
+        async with timeline.lock:
+            for frame in frames:
+                shown_at = await renderer.submit(message.id, message.edit, **frame.fields)
+                timeline.shown.append(shown_at)
+                if frame.prompt and timeline.prompt_at is None:
+                    timeline.prompt_at = shown_at
+                    timeline.prompted.set()
+                remaining = frame.hold - (time.time() - shown_at)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+        return timeline
+
+    def mark_answer(self, message: discord.Message, user_id: int = None):
+        """Première réponse reçue pour la manche (message ou bouton)."""
+        timeline = self.timeline(message)
+        if timeline.answered_at is None:
+            timeline.answered_at = time.time()
+            timeline.answered_by = user_id
+
+    def is_multiplayer(self, message: discord.Message) -> bool:
+        timeline = self._timelines.get(message.id)
+        return bool(timeline and timeline.players)
+
+    def is_player(self, message: discord.Message, user_id: int, get_user_id) -> bool:
+        """Solo : le joueur de la manche ; multijoueur : n’importe quel participant non éliminé."""
+        timeline = self._timelines.get(message.id)
+        if timeline and timeline.players:
+            return user_id in timeline.players and user_id not in timeline.out
+        return user_id == get_user_id()
+
+    def eliminate(self, message: discord.Message, user_id: int) -> int:
+        """Multijoueur : retire un participant de la manche ; renvoie le nombre de joueurs restants."""
+        timeline = self.timeline(message)
+        timeline.out.add(user_id)
+        return len((timeline.players or set()) - timeline.out)
+
+    def elapsed(self, message: discord.Message, start: float) -> float:
+        """Temps de réponse : de l’affichage de la question (à défaut `start`) à la réponse."""
+        timeline = self._timelines.get(message.id) or RoundTimeline()
+        shown = timeline.prompt_at or start
+        answered = timeline.answered_at or time.time()
+        return max(0.0, answered - shown)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+round_renderer = RoundRenderer()
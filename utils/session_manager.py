@@ -0,0 +1,190 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 session_manager.py — Registre central des parties en cours
+# Objectif : Un seul registre pour toutes les parties (pendu, lights out, mots
+#            secrets, motus, anagramme, entraînement cérébral) : recherche en
+#            O(1) par salon / joueur, expiration par une roue temporelle unique
+#            au lieu d’une boucle ou d’un sleep par partie, plafond global
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+from utils.message_router import message_router
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+TICK = 1.0              # Résolution de la roue (secondes)
+SLOTS = 256             # Cases de la roue (au-delà, une partie refait un tour)
+MAX_SESSIONS = 500      # Parties simultanées, tous jeux confondus
+
+class SessionRefused(Exception):
+    """Partie refusée : déjà une partie ici, ou plafond atteint (message prêt à afficher)."""
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎮 Entrée du registre
+# ────────────────────────────────────────────────────────────────────────────────
+class _Session:
+    __slots__ = ("kind", "key", "data", "owner_id", "idle", "expires_at",
+                 "last_activity", "on_expire", "closed", "route")
+
+    def __init__(self, kind, key, data, owner_id, idle, ttl, on_expire, now):
+        self.kind = kind
+        self.key = key
+        self.data = data
+        self.owner_id = owner_id
+        self.idle = idle                                        # Inactivité max (None = pas de limite)
+        self.expires_at = now + ttl if ttl else None            # Durée totale max
+        self.last_activity = now
+        self.on_expire = on_expire
+        self.closed = False
+        self.route = None                                       # Abonnement au routeur de messages
+
+    @property
+    def deadline(self) -> float:
+        limits = [t for t in (
+            self.last_activity + self.idle if self.idle else None,
+            self.expires_at,
+        ) if t is not None]
+        return min(limits) if limits else float("inf")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Gestionnaire
+# ────────────────────────────────────────────────────────────────────────────────
+class SessionManager:
+    """
+    Parties indexées par (jeu, clé) — la clé est en général le salon — et par
+    (jeu, joueur). Une seule tâche fait tourner une roue de SLOTS cases : une
+    partie y est rangée à la case de son échéance ; touch() ne fait que mettre
+    à jour l’heure d’activité, la case est recalculée quand elle est atteinte.
+    """
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, tick: float = TICK, slots: int = SLOTS):
+        self.max_sessions = max_sessions
+        self.tick = tick
+        self._sessions = {}         # (jeu, clé) -> _Session
+        self._by_user = {}          # (jeu, joueur) -> clé
+        self._counts = {}           # jeu -> parties en cours
+        self._wheel = [set() for _ in range(slots)]
+        self._cursor = 0            # Prochaine case (en ticks absolus) à traiter
+        self._task = None
+        self.opened = 0
+        self.expired = 0
+        self.refused = 0
+
+    # ──────────────────────────────────────────────────────────────
+    def open(self, kind: str, key, data, *, owner_id: int | None = None,
+             idle: float | None = None, ttl: float | None = None,
+             on_expire=None, limit: int | None = None,
+             channel_id: int | None = None, on_message=None, prefixes: tuple | None = None):
+        """
+        Enregistre une partie et renvoie `data`. Lève SessionRefused si une partie
+        existe déjà pour (jeu, clé) ou si un plafond (global ou `limit`) est atteint.
+        `on_expire(data)` (coroutine) est appelée si l’échéance passe.
+        `on_message(message)` reçoit, tant que la partie vit, les messages du salon
+        `channel_id` (commençant par un des `prefixes` si précisés).
+        """
+        if (kind, key) in self._sessions:
+            self.refused += 1
+            raise SessionRefused("⚠️ Une partie est déjà en cours ici !")
+        if len(self._sessions) >= self.max_sessions or (limit and self._counts.get(kind, 0) >= limit):
+            self.refused += 1
+            raise SessionRefused("⏳ Trop de parties en cours, réessaie dans quelques minutes.")
+
+        loop = asyncio.get_running_loop()
+        session = _Session(kind, key, data, owner_id, idle, ttl, on_expire, loop.time())
+        self._sessions[(kind, key)] = session
+        if owner_id is not None:
+            self._by_user[(kind, owner_id)] = key
+        self._counts[kind] = self._counts.get(kind, 0) + 1
+        self.opened += 1
+        if on_message is not None:
+            session.route = message_router.route(channel_id, on_message, prefixes)
+
+        if self._task is None or self._task.done():
+            self._cursor = int(loop.time() / self.tick)
+            self._task = asyncio.create_task(self._run())
+        self._schedule(session)
+        return data
+
+    def get(self, kind: str, key):
+        session = self._sessions.get((kind, key))
+        return session.data if session else None
+
+    def get_by_user(self, kind: str, user_id: int):
+        key = self._by_user.get((kind, user_id))
+        return self.get(kind, key) if key is not None else None
+
+    def touch(self, kind: str, key):
+        """Repousse l’échéance d’inactivité (O(1), la roue n’est pas modifiée)."""
+        session = self._sessions.get((kind, key))
+        if session:
+            session.last_activity = asyncio.get_running_loop().time()
+
+    def close(self, kind: str, key):
+        """Retire une partie (terminée normalement) ; renvoie ses données ou None."""
+        session = self._sessions.pop((kind, key), None)
+        if session is None:
+            return None
+        session.closed = True
+        if session.route is not None:
+            message_router.unroute(session.route)
+        if session.owner_id is not None and self._by_user.get((kind, session.owner_id)) == key:
+            del self._by_user[(kind, session.owner_id)]
+        self._counts[kind] -= 1
+        return session.data
+
+    def stats(self) -> dict:
+        return {
+            "live": len(self._sessions),
+            "by_kind": {k: n for k, n in self._counts.items() if n},
+            "opened": self.opened,
+            "expired": self.expired,
+            "refused": self.refused,
+        }
+
+    # ──────────────────────────────────────────────────────────────
+    def _schedule(self, session: _Session):
+        if session.deadline == float("inf"):
+            return
+        slot = max(int(session.deadline / self.tick) + 1, self._cursor + 1)
+        self._wheel[slot % len(self._wheel)].add(session)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self._sessions:
+            await asyncio.sleep(self.tick)
+            now = loop.time()
+            while self._cursor <= int(now / self.tick):
+                index = self._cursor % len(self._wheel)
+                bucket, self._wheel[index] = self._wheel[index], set()
+                for session in bucket:
+                    if session.closed:
+                        continue
+                    if session.deadline <= now:
+                        self._expire(session)
+                    else:
+                        self._schedule(session)   # Activité récente, ou échéance à un tour suivant
+                self._cursor += 1
+        self._wheel = [set() for _ in self._wheel]
+
+    def _expire(self, session: _Session):
+        self.close(session.kind, session.key)
+        self.expired += 1
+        if session.on_expire:
+            asyncio.create_task(self._call_expire(session))
+
+    @staticmethod
+    async def _call_expire(session: _Session):
+        try:
+            await session.on_expire(session.data)
+        except Exception as e:
+            print(f"[Sessions] Erreur à l’expiration de {session.kind}:{session.key} → {e}")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+session_manager = SessionManager()
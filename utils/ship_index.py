@@ -0,0 +1,171 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ship_index.py — Index des compatibilités entre personnages (/ship)
+# Objectif : Calculer une fois tous les scores de compatibilité (ils ne
+#            dépendent que des fiches), puis répondre en O(1) pour un couple
+#            et sans recalcul pour « meilleur / pire partenaire » et classements
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from array import array
+from utils.game_data import game_data
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+STATS = ("attaque", "defense", "pression", "kido", "intelligence", "rapidite")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧮 Calcul du score de compatibilité
+# ────────────────────────────────────────────────────────────────────────────────
+class _Profile:
+    """Ce que le score utilise d’une fiche, préparé une seule fois."""
+    __slots__ = ("genre", "sexualite", "races", "traits", "stats")
+
+    def __init__(self, p):
+        self.genre = p["genre"].lower()
+        self.sexualite = p["sexualite"].lower()
+        self.races = frozenset(p.get("race", []))
+        self.traits = frozenset(p.get("personnalite", []))
+        stats = p.get("stats_base", {})
+        self.stats = tuple(stats.get(s, 0) for s in STATS)
+
+def _peut_aimer(person: _Profile, cible: _Profile) -> bool:
+    if person.sexualite == "hétéro":
+        return cible.genre != person.genre
+    elif person.sexualite == "homo":
+        return cible.genre == person.genre
+    return True
+
+def _compatibilite(p1: _Profile, p2: _Profile) -> float:
+    g1, g2 = p1.genre, p2.genre
+    s1, s2 = p1.sexualite, p2.sexualite
+    # Cas logique : si l'un ne peut pas aimer l'autre → compatibilité amoureuse faible
+    if not (_peut_aimer(p1, p2) and _peut_aimer(p2, p1)):
+        return 0.2  # faible compatibilité mais pas forcément 0 (amitié, lien spirituel)
+    if s1 == "bi" and s2 == "bi":
+        return 1.0
+    if s1 == "hétéro" and s2 == "hétéro" and g1 != g2:
+        return 0.9
+    if s1 == "homo" and s2 == "homo" and g1 == g2:
+        return 0.95
+    if (s1 == "bi" and s2 in ("homo", "hétéro")) or (s2 == "bi" and s1 in ("homo", "hétéro")):
+        return 0.85
+    return 0.5
+
+def _score(p1: _Profile, p2: _Profile) -> int:
+    score = 50 * _compatibilite(p1, p2)
+
+    # Races communes
+    score += 10 * len(p1.races & p2.races)
+
+    # Traits de personnalité similaires
+    commun_traits = len(p1.traits & p2.traits)
+    if commun_traits >= 3:
+        score += 20
+    elif commun_traits == 2:
+        score += 10
+    elif commun_traits == 1:
+        score += 5
+
+    # Statistiques proches
+    compte_proches = sum(1 for a, b in zip(p1.stats, p2.stats) if abs(a - b) < 20)
+    if compte_proches >= 4:
+        score += 15
+    elif compte_proches >= 2:
+        score += 5
+
+    return max(0, min(int(score), 100))
+
+def compatibilite_amoureuse(p1, p2) -> float:
+    """Coefficient entre 0 et 1 selon la compatibilité amoureuse logique (fiches brutes)."""
+    return _compatibilite(_Profile(p1), _Profile(p2))
+
+def calculer_score(p1, p2) -> int:
+    """Score de compatibilité (0-100) entre deux fiches brutes."""
+    return _score(_Profile(p1), _Profile(p2))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Index
+# ────────────────────────────────────────────────────────────────────────────────
+class ShipIndex:
+    """
+    Matrice dense n×n des scores (un octet par couple, symétrique) et, par
+    personnage, la liste des partenaires triés du meilleur au pire.
+    Reconstruit seulement quand game_data recharge des fiches.
+    """
+
+    def __init__(self):
+        self.names: list[str] = []
+        self._pos: dict[str, int] = {}
+        self._matrix = array("B")
+        self._rankings: list[list[tuple[int, str]]] = []
+        self._generation = None
+
+    # ──────────────────────────────────────────────────────────────
+    def _ensure_fresh(self):
+        names = game_data.character_names()     # Charge les données si besoin
+        if self._generation != game_data.generation:
+            self._build(names)
+            self._generation = game_data.generation
+
+    def _build(self, names: list[str]):
+        profiles = [_Profile(game_data.character(n)) for n in names]
+        n = len(names)
+        matrix = array("B", bytes(n * n))
+        for i in range(n):
+            for j in range(i, n):
+                s = _score(profiles[i], profiles[j])
+                matrix[i * n + j] = matrix[j * n + i] = s
+
+        rankings = []
+        for i in range(n):
+            row = [(matrix[i * n + j], names[j]) for j in range(n) if j != i]
+            row.sort(key=lambda e: (-e[0], e[1]))
+            rankings.append(row)
+
+        self.names = list(names)
+        self._pos = {name: i for i, name in enumerate(names)}
+        self._matrix = matrix
+        self._rankings = rankings
+
+    # ──────────────────────────────────────────────────────────────
+    def __contains__(self, name: str) -> bool:
+        self._ensure_fresh()
+        return name.lower() in self._pos
+
+    def score(self, name1: str, name2: str) -> int:
+        """Score d’un couple (noms de fichier de data/personnages), O(1)."""
+        self._ensure_fresh()
+        i, j = self._pos[name1.lower()], self._pos[name2.lower()]
+        return self._matrix[i * len(self.names) + j]
+
+    def ranking(self, name: str) -> list[tuple[int, str]]:
+        """Tous les partenaires de `name` : [(score, nom)] du meilleur au pire."""
+        self._ensure_fresh()
+        return self._rankings[self._pos[name.lower()]]
+
+    def best(self, name: str, k: int = 5) -> list[tuple[int, str]]:
+        return self.ranking(name)[:k]
+
+    def worst(self, name: str, k: int = 5) -> list[tuple[int, str]]:
+        return self.ranking(name)[::-1][:k]
+
+    def top_pairs(self, k: int = 10) -> list[tuple[int, str, str]]:
+        """Meilleurs couples tous personnages confondus."""
+        self._ensure_fresh()
+        n = len(self.names)
+        pairs = [
+            (self._matrix[i * n + j], self.names[i], self.names[j])
+            for i in range(n) for j in range(i + 1, n)
+        ]
+        pairs.sort(key=lambda e: (-e[0], e[1], e[2]))
+        return pairs[:k]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+ship_index = ShipIndex()
@@ -0,0 +1,269 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 sorting_benchmark.py — Banc d’essai des algorithmes de /sorting
+# Objectif : Mesurer comparaisons, écritures et étapes affichées de chaque
+#            algorithme de ALL_ALGORITHMS sur plusieurs tailles et répartitions,
+#            repérer ceux qui ne trient pas, dégénèrent ou ne s’arrêtent pas,
+#            et écrire les stats max/moyennes lues par la commande /sorting
+# Catégorie : Utils
+# Accès : Interne (python -m utils.sorting_benchmark --help)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import argparse
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from utils.sorting_utils import ALL_ALGORITHMS, drain_steps, max_frames
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+STATS_PATH = Path("data/sorting_stats.json")
+DISPLAY_SIZE = 12               # Taille de liste utilisée par /sorting
+SIZES = (8, 12, 16, 32, 64)
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique")
+RUNS = 200                      # Listes tirées par (algorithme, taille, répartition)
+MAX_SECONDS = 5.0               # Par liste : au-delà, l’algorithme est considéré bloqué
+DEGRADED_FACTOR = 4             # Étapes > 4× celles du cas aléatoire → dégénère
+SUPER_QUADRATIC = 2.5           # Pente log(étapes)/log(n) au-delà → croissance anormale
+
+def make_input(distribution: str, n: int, rng: random.Random) -> list[int]:
+    if distribution == "sorted":
+        return list(range(1, n + 1))
+    if distribution == "reversed":
+        return list(range(n, 0, -1))
+    if distribution == "few_unique":
+        return [rng.randint(1, max(2, n // 4)) for _ in range(n)]
+    data = list(range(1, n + 1))
+    rng.shuffle(data)
+    return data
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔢 Instrumentation
+# ────────────────────────────────────────────────────────────────────────────────
+class _Counted(int):
+    """Entier qui compte les comparaisons faites entre éléments."""
+    comparisons = 0
+
+    def __lt__(self, other):
+        _Counted.comparisons += 1
+        return int.__lt__(self, other)
+
+    def __le__(self, other):
+        _Counted.comparisons += 1
+        return int.__le__(self, other)
+
+    def __gt__(self, other):
+        _Counted.comparisons += 1
+        return int.__gt__(self, other)
+
+    def __ge__(self, other):
+        _Counted.comparisons += 1
+        return int.__ge__(self, other)
+
+    def __eq__(self, other):
+        _Counted.comparisons += 1
+        return int.__eq__(self, other)
+
+    def __ne__(self, other):
+        _Counted.comparisons += 1
+        return int.__ne__(self, other)
+
+    __hash__ = int.__hash__
+
+class _CountingList(list):
+    """Liste qui compte les écritures (affectations, insertions, retraits)."""
+    __slots__ = ("writes",)
+
+    def __init__(self, values):
+        super().__init__(values)
+        self.writes = 0
+
+    def __setitem__(self, index, value):
+        self.writes += len(value) if isinstance(index, slice) else 1
+        super().__setitem__(index, value)
+
+    def insert(self, index, value):
+        self.writes += 1
+        super().insert(index, value)
+
+    def pop(self, index=-1):
+        self.writes += 1
+        return super().pop(index)
+
+def measure(name: str, data: list[int]) -> dict:
+    """Un tri instrumenté → {frames, comparisons, writes, sorted, stuck}."""
+    n = len(data)
+    values = _CountingList(_Counted(v) for v in data)
+    _Counted.comparisons = 0
+    limit = max_frames(n)
+    deadline = time.perf_counter() + MAX_SECONDS
+    frames = 0
+    stuck = False
+    for _ in drain_steps(ALL_ALGORITHMS[name](values)):
+        frames += 1
+        if frames > limit or time.perf_counter() > deadline:
+            stuck = True
+            break
+    comparisons = _Counted.comparisons
+    plain = [int(v) for v in values]
+    return {
+        "frames": frames,
+        "comparisons": comparisons,
+        "writes": values.writes,
+        "sorted": not stuck and plain == sorted(data),
+        "stuck": stuck,
+    }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🏁 Campagne
+# ────────────────────────────────────────────────────────────────────────────────
+def run_case(job: tuple) -> dict:
+    """(algorithme, répartition, taille, tirages, graine) → agrégats."""
+    name, distribution, n, runs, seed = job
+    rng = random.Random(f"{seed}:{name}:{distribution}:{n}")
+    if distribution in ("sorted", "reversed"):
+        runs = 1                # Entrée unique : inutile de répéter
+    results = [measure(name, make_input(distribution, n, rng)) for _ in range(runs)]
+    frames = [r["frames"] for r in results]
+    return {
+        "algorithm": name,
+        "distribution": distribution,
+        "n": n,
+        "runs": runs,
+        "avg_frames": sum(frames) / runs,
+        "max_frames": max(frames),
+        "avg_comparisons": sum(r["comparisons"] for r in results) / runs,
+        "avg_writes": sum(r["writes"] for r in results) / runs,
+        "unsorted": sum(not r["sorted"] for r in results),
+        "stuck": sum(r["stuck"] for r in results),
+    }
+
+def run(algorithms=None, sizes=SIZES, distributions=DISTRIBUTIONS, runs: int = RUNS,
+        seed: int = 0, workers: int | None = None) -> list[dict]:
+    """Toutes les combinaisons, réparties sur un pool de processus."""
+    jobs = [
+        (name, distribution, n, runs, seed)
+        for name in (algorithms or ALL_ALGORITHMS)
+        for distribution in distributions
+        for n in sizes
+    ]
+    if workers == 1:
+        return [run_case(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_case, jobs))
+
+def findings(rows: list[dict]) -> dict[str, list[str]]:
+    """Problèmes détectés par algorithme : non trié, bloqué, dégénère, croissance."""
+    by_key = {(r["algorithm"], r["distribution"], r["n"]): r for r in rows}
+    issues = {}
+    for r in rows:
+        name, dist, n = r["algorithm"], r["distribution"], r["n"]
+        notes = issues.setdefault(name, [])
+        if r["stuck"]:
+            notes.append(f"ne s’arrête pas ({dist}, n={n}, {r['stuck']}/{r['runs']})")
+        elif r["unsorted"]:
+            notes.append(f"ne trie pas ({dist}, n={n}, {r['unsorted']}/{r['runs']})")
+        base = by_key.get((name, "random", n))
+        if dist == "random" or not base:
+            continue
+        for metric, label in (("avg_frames", "étapes"), ("avg_comparisons", "comparaisons")):
+            if base[metric] and r[metric] > DEGRADED_FACTOR * base[metric]:
+                notes.append(f"dégénère sur {dist} (n={n} : {r[metric]:.0f} {label} contre {base[metric]:.0f})")
+
+    for name in issues:
+        for dist in {r["distribution"] for r in rows}:
+            points = sorted((r["n"], r["avg_frames"]) for r in rows
+                            if r["algorithm"] == name and r["distribution"] == dist and not r["stuck"])
+            if len(points) >= 2 and points[0][1] > 0 and points[-1][0] > points[0][0]:
+                (n1, f1), (n2, f2) = points[0], points[-1]
+                slope = math.log(f2 / f1) / math.log(n2 / n1)
+                if slope > SUPER_QUADRATIC:
+                    issues[name].append(f"croissance en n^{slope:.1f} ({dist})")
+    return {name: notes for name, notes in issues.items() if notes}
+
+def display_stats(rows: list[dict]) -> dict[str, dict]:
+    """Stats reprises par /sorting : étapes max / moyennes et part des listes triées (aléatoires, DISPLAY_SIZE)."""
+    return {
+        r["algorithm"]: {
+            "max_iter": r["max_frames"],
+            "avg_iter": round(r["avg_frames"]),
+            "success_rate": round(1 - (r["unsorted"] + r["stuck"]) / r["runs"], 3),
+        }
+        for r in rows if r["distribution"] == "random" and r["n"] == DISPLAY_SIZE
+    }
+
+def load_stats(path: Path = STATS_PATH) -> dict[str, dict]:
+    """Stats écrites par `--write` ({} si le fichier n’existe pas)."""
+    try:
+        with Path(path).open("r", encoding="utf-8") as f:
+            return json.load(f).get("algorithms", {})
+    except (OSError, ValueError):
+        return {}
+
+def write_stats(rows: list[dict], runs: int, seed: int, path: Path = STATS_PATH):
+    payload = {
+        "size": DISPLAY_SIZE,
+        "runs": runs,
+        "seed": seed,
+        "algorithms": {**load_stats(path), **display_stats(rows)},   # --algo : garde les autres
+    }
+    with Path(path).open("w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📊 Rapport
+# ────────────────────────────────────────────────────────────────────────────────
+def format_report(rows: list[dict]) -> str:
+    lines = [f"{'Algorithme':<18}{'Répartition':<12}{'n':>4}{'Étapes moy':>12}{'max':>7}"
+             f"{'Comparaisons':>14}{'Écritures':>11}{'Échecs':>8}"]
+    for r in sorted(rows, key=lambda r: (r["algorithm"], DISTRIBUTIONS.index(r["distribution"])
+                                         if r["distribution"] in DISTRIBUTIONS else 99, r["n"])):
+        failures = r["unsorted"] + r["stuck"]
+        lines.append(
+            f"{r['algorithm']:<18}{r['distribution']:<12}{r['n']:>4}{r['avg_frames']:>12.1f}{r['max_frames']:>7}"
+            f"{r['avg_comparisons']:>14.1f}{r['avg_writes']:>11.1f}{failures:>8}"
+        )
+    issues = findings(rows)
+    lines.append("")
+    if issues:
+        lines.append("⚠️ Problèmes détectés :")
+        for name, notes in sorted(issues.items()):
+            for note in notes:
+                lines.append(f"  {name} : {note}")
+    else:
+        lines.append("✅ Aucun problème détecté.")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d’essai des algorithmes de /sorting.")
+    parser.add_argument("--algo", action="append", choices=list(ALL_ALGORITHMS), help="Limiter à un algorithme (répétable)")
+    parser.add_argument("--sizes", type=lambda s: tuple(int(x) for x in s.split(",")), default=SIZES,
+                        help="Tailles séparées par des virgules (défaut : 8,12,16,32,64)")
+    parser.add_argument("--runs", type=int, default=RUNS, help="Listes tirées par cas aléatoire")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Processus (défaut : nombre de cœurs)")
+    parser.add_argument("--write", action="store_true", help=f"Écrit les stats de /sorting dans {STATS_PATH}")
+    parser.add_argument("--strict", action="store_true", help="Code de sortie 1 si un problème est détecté")
+    args = parser.parse_args(argv)
+
+    sizes = tuple(sorted(set(args.sizes) | {DISPLAY_SIZE})) if args.write else args.sizes
+    start = time.perf_counter()
+    rows = run(args.algo, sizes, DISTRIBUTIONS, args.runs, args.seed, args.workers)
+    print(format_report(rows))
+    print(f"\n{len(rows)} cas en {time.perf_counter() - start:.1f}s")
+
+    if args.write:
+        write_stats(rows, args.runs, args.seed)
+        print(f"Stats écrites dans {STATS_PATH}")
+    if args.strict and findings(rows):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
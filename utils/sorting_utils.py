@@ -2,6 +2,7 @@
 # algorithms.py — Tous les algorithmes de tri pour visualisation
 # ────────────────────────────────────────────────────────────────────────────────
 import asyncio
+from utils.gif_writer import GifWriter
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Algorithmes classiques
@@ -241,3 +242,166 @@ ALL_ALGORITHMS = {
     "Pair Shift Sort": pair_shift_sort,
     "Centrifugal Sort": centrifugal_sort,
 }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Enregistrement hors ligne (trace compacte)
+# ────────────────────────────────────────────────────────────────────────────────
+def drain_steps(agen):
+    """Parcourt un générateur async qui n’attend jamais rien, sans boucle asyncio."""
+    while True:
+        try:
+            agen.__anext__().send(None)
+        except StopIteration as step:
+            yield step.value
+        except StopAsyncIteration:
+            return
+
+def max_frames(n: int) -> int:
+    """Plafond d’étapes : bien au-delà de n² (tri le plus lent attendu)."""
+    return 50 * n * n + 1000
+
+def _compact_marks(marks):
+    """Positions ✅ : un range quand elles sont contiguës (cas de presque tous les tris)."""
+    if not marks:
+        return ()
+    if list(marks) == list(range(marks[0], marks[-1] + 1)):
+        return range(marks[0], marks[-1] + 1)
+    return tuple(marks)
+
+class SortTrace:
+    """
+    Un tri enregistré : liste de départ, puis pour chaque étape les écritures
+    ((position, valeur), ...) et les positions marquées ✅. Le nombre d’étapes
+    est celui qu’affichait l’animation, ce qui permet de comparer les algorithmes.
+    """
+    __slots__ = ("algorithm", "initial", "steps", "truncated")
+
+    def __init__(self, algorithm: str, initial):
+        self.algorithm = algorithm
+        self.initial = tuple(initial)
+        self.steps = []
+        self.truncated = False  # Arrêté au plafond max_frames (algorithme bloqué)
+
+    def __len__(self):
+        return len(self.steps)
+
+    @property
+    def writes(self) -> int:
+        """Nombre total d’écritures dans la liste."""
+        return sum(len(changes) for changes, _ in self.steps)
+
+    def replay(self):
+        """Rejoue les étapes → (liste, positions ✅). La liste est réutilisée : la copier pour la garder."""
+        data = list(self.initial)
+        for changes, marks in self.steps:
+            for i, value in changes:
+                data[i] = value
+            yield data, marks
+
+    def final(self) -> list:
+        """Liste à la fin du tri."""
+        data = list(self.initial)
+        for changes, _ in self.steps:
+            for i, value in changes:
+                data[i] = value
+        return data
+
+    def keyframes(self, count: int = 4):
+        """`count` étapes réparties sur tout le tri → [(numéro, liste, positions ✅)]."""
+        total = len(self.steps)
+        if not total:
+            return []
+        wanted = {round(k * (total - 1) / max(1, count - 1)) for k in range(count)}
+        return [
+            (n + 1, list(data), marks)
+            for n, (data, marks) in enumerate(self.replay()) if n in wanted
+        ]
+
+def record_sort(algorithm, data, name: str = None, limit: int = None) -> SortTrace:
+    """
+    Exécute `algorithm` jusqu’au bout (sans attente) et enregistre sa trace,
+    au plus `limit` étapes (par défaut max_frames(len(data))).
+    """
+    trace = SortTrace(name or algorithm.__name__, data)
+    limit = limit or max_frames(len(data))
+    previous = list(data)
+    for step, marks in drain_steps(algorithm(list(data))):
+        if len(trace.steps) >= limit:
+            trace.truncated = True
+            break
+        changes = tuple((i, v) for i, (v, p) in enumerate(zip(step, previous)) if v != p)
+        for i, v in changes:
+            previous[i] = v
+        trace.steps.append((changes, _compact_marks(marks)))
+    return trace
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Rendu GIF d’une trace
+# ────────────────────────────────────────────────────────────────────────────────
+GIF_PALETTE = [
+    (0x2B, 0x2D, 0x31),     # 0 : fond (thème sombre Discord)
+    (0x58, 0x65, 0xF2),     # 1 : barre
+    (0x57, 0xF2, 0x87),     # 2 : barre triée (✅)
+    (0xF0, 0xB2, 0x32),     # 3 : barre modifiée à cette frame
+]
+BAR_WIDTH, BAR_GAP, GIF_PADDING, GIF_HEIGHT = 12, 4, 6, 120
+GIF_MAX_FRAMES = 90         # Au-delà, plusieurs étapes par frame
+GIF_DELAY = 12              # Centièmes de seconde par frame
+GIF_HOLD = 250              # Dernière frame (tri terminé)
+
+def _columns(data, marks, changed, top):
+    return [
+        (max(1, round(v / top * (GIF_HEIGHT - 2 * GIF_PADDING))), 3 if i in changed else 2 if i in marks else 1)
+        for i, v in enumerate(data)
+    ]
+
+def _frame_pixels(columns, first: int, last: int, padded: bool = False) -> bytes:
+    """Colonnes first..last (incluses) ligne par ligne ; `padded` ajoute les marges (image entière)."""
+    rows = []
+    gap = bytes(BAR_GAP)
+    margin = bytes(GIF_PADDING) if padded else b""
+    for y in range(GIF_HEIGHT):
+        level = GIF_HEIGHT - GIF_PADDING - y      # Hauteur de barre nécessaire pour colorer cette ligne
+        parts = [margin]
+        for height, color in columns[first:last + 1]:
+            parts.append(bytes((color if 0 < level <= height else 0,)) * BAR_WIDTH)
+            parts.append(gap)
+        parts[-1] = margin
+        rows.append(b"".join(parts))
+    return b"".join(rows)
+
+def render_gif(trace: SortTrace, max_frames: int = GIF_MAX_FRAMES, delay: int = GIF_DELAY) -> bytes:
+    """
+    GIF animé de la trace : une frame par étape (ou par groupe d’étapes au-delà
+    de `max_frames`), seules les barres modifiées étant réencodées.
+    """
+    n = len(trace.initial)
+    top = max(trace.initial) or 1
+    width = 2 * GIF_PADDING + n * BAR_WIDTH + (n - 1) * BAR_GAP
+    gif = GifWriter(width, GIF_HEIGHT, GIF_PALETTE)
+
+    shown = _columns(trace.initial, (), (), top)
+    gif.add_frame(0, 0, width, GIF_HEIGHT, _frame_pixels(shown, 0, n - 1, padded=True), delay=delay)
+
+    total = len(trace)
+    group = max(1, -(-total // max_frames))
+    last_values = list(trace.initial)
+    for index, (data, marks) in enumerate(trace.replay(), start=1):
+        if index % group and index != total:
+            continue
+        changed = {i for i, v in enumerate(data) if v != last_values[i]}
+        last_values = list(data)
+        finished = index == total
+        if finished and data == sorted(data):
+            marks, changed = range(n), ()       # Tout en vert une fois trié
+        columns = _columns(data, marks, changed, top)
+        diff = [i for i in range(n) if columns[i] != shown[i]] or ([0] if finished else [])
+        shown = columns
+        if not diff:
+            continue
+        first, last = diff[0], diff[-1]
+        x = GIF_PADDING + first * (BAR_WIDTH + BAR_GAP)
+        w = (last - first) * (BAR_WIDTH + BAR_GAP) + BAR_WIDTH
+        gif.add_frame(x, 0, w, GIF_HEIGHT, _frame_pixels(columns, first, last),
+                      delay=GIF_HOLD if finished else delay)
+    return gif.getvalue()
@@ -7,6 +7,8 @@
 # 📦 IMPORTS
 # ──────────────────────────────────────────────────────────────
 import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # ──────────────────────────────────────────────────────────────
@@ -17,6 +19,7 @@ load_dotenv()
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+SUPABASE_MAX_WORKERS = int(os.getenv("SUPABASE_MAX_WORKERS", "8"))
 
 # ──────────────────────────────────────────────────────────────
 # 🔌 Initialisation du client
@@ -33,3 +36,20 @@ try:
 
 except Exception as e:
     print(f"⚠️ Supabase désactivé : {e}")
+
+# ──────────────────────────────────────────────────────────────
+# 🧵 Exécution non bloquante des requêtes
+# ──────────────────────────────────────────────────────────────
+# Le client Supabase est synchrone : chaque .execute() fait un aller-retour HTTP.
+# On les exécute dans un pool de threads borné pour ne jamais bloquer la boucle
+# asyncio de discord.py (heartbeats, interactions...).
+_executor = ThreadPoolExecutor(max_workers=SUPABASE_MAX_WORKERS, thread_name_prefix="supabase")
+
+async def run_db(query):
+    """
+    Exécute une requête Supabase (objet retourné par supabase.table(...)...)
+    dans le pool de threads et renvoie la réponse.
+    Exemple : res = await run_db(supabase.table("reiatsu").select("*"))
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, query.execute)
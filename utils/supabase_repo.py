@@ -0,0 +1,156 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 supabase_repo.py — Accès asynchrone aux tables Supabase
+# Objectif : Centraliser les lectures/écritures des tables principales sans
+#            jamais bloquer la boucle asyncio (requêtes exécutées via run_db)
+# Catégorie : Utils
+# Accès : Tous
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from utils.supabase_client import supabase, run_db
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔹 Helpers internes
+# ────────────────────────────────────────────────────────────────────────────────
+async def _first(query) -> dict | None:
+    """Exécute la requête et renvoie la première ligne (ou None)."""
+    res = await run_db(query)
+    return res.data[0] if res.data else None
+
+async def _all(query) -> list[dict]:
+    """Exécute la requête et renvoie toutes les lignes (liste vide si rien)."""
+    res = await run_db(query)
+    return res.data or []
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 💠 Table reiatsu — Profils joueurs
+# ────────────────────────────────────────────────────────────────────────────────
+async def get_reiatsu(user_id, columns: str = "*") -> dict | None:
+    return await _first(supabase.table("reiatsu").select(columns).eq("user_id", user_id))
+
+async def get_reiatsu_by_classe(classe: str, columns: str = "*") -> list[dict]:
+    return await _all(supabase.table("reiatsu").select(columns).eq("classe", classe))
+
+async def get_reiatsu_top(limit: int = 10, columns: str = "user_id, points") -> list[dict]:
+    return await _all(supabase.table("reiatsu").select(columns).order("points", desc=True).limit(limit))
+
+async def get_reiatsu_scores(page_size: int = 1000) -> list[dict]:
+    """Points de tous les joueurs, lus par pages (l’API limite le nombre de lignes par requête)."""
+    rows, start = [], 0
+    while True:
+        page = await _all(
+            supabase.table("reiatsu").select("user_id, username, points")
+            .order("user_id").range(start, start + page_size - 1)
+        )
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        start += page_size
+
+async def insert_reiatsu(row: dict):
+    return await run_db(supabase.table("reiatsu").insert(row))
+
+async def update_reiatsu(user_id, data: dict):
+    return await run_db(supabase.table("reiatsu").update(data).eq("user_id", user_id))
+
+async def add_reiatsu_points(user_id, delta: int, fields: dict | None = None, username: str | None = None,
+                             reason: str = "points") -> dict | None:
+    """
+    Incrément atomique des points via la fonction SQL reiatsu_add_points
+    (crée le profil si besoin, applique les champs annexes, journalise le
+    mouvement dans reiatsu_ledger, renvoie la ligne à jour).
+    """
+    res = await run_db(supabase.rpc("reiatsu_add_points", {
+        "p_user_id": int(user_id),
+        "p_username": username,
+        "p_delta": int(delta),
+        "p_fields": fields or {},
+        "p_reason": reason
+    }))
+    return res.data[0] if res.data else None
+
+async def reiatsu_transfer(moves: list[dict], reason: str) -> list[dict]:
+    """
+    Mouvements de points de plusieurs joueurs appliqués ensemble (fonction SQL
+    reiatsu_transfer) : tout passe ou rien. Renvoie les lignes à jour.
+    """
+    res = await run_db(supabase.rpc("reiatsu_transfer", {"p_moves": moves, "p_reason": reason}))
+    return res.data or []
+
+async def compact_reiatsu_ledger(keep_days: int = 30) -> int:
+    """Regroupe les mouvements plus vieux que `keep_days` jours (une ligne par joueur)."""
+    res = await run_db(supabase.rpc("reiatsu_ledger_compact", {"p_keep_days": int(keep_days)}))
+    return int(res.data or 0)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Table reiatsu_config — Configuration du spawn par serveur
+# ────────────────────────────────────────────────────────────────────────────────
+async def get_all_reiatsu_configs() -> list[dict]:
+    return await _all(supabase.table("reiatsu_config").select("*"))
+
+async def get_reiatsu_config(guild_id) -> dict | None:
+    return await _first(supabase.table("reiatsu_config").select("*").eq("guild_id", guild_id))
+
+async def insert_reiatsu_config(row: dict):
+    return await run_db(supabase.table("reiatsu_config").insert(row))
+
+async def update_reiatsu_config(guild_id, data: dict):
+    return await run_db(supabase.table("reiatsu_config").update(data).eq("guild_id", guild_id))
+
+async def delete_reiatsu_config(guild_id):
+    return await run_db(supabase.table("reiatsu_config").delete().eq("guild_id", guild_id))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Table kawashima_scores — Scores d’entraînement cérébral
+# ────────────────────────────────────────────────────────────────────────────────
+async def get_kawashima_top(limit: int = 100) -> list[dict]:
+    return await _all(
+        supabase.table("kawashima_scores").select("user_id, username, score, timestamp")
+        .order("score", desc=True).limit(limit)
+    )
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌱 Table gardens — Jardins
+# ────────────────────────────────────────────────────────────────────────────────
+async def get_garden(user_id, columns: str = "*") -> dict | None:
+    return await _first(supabase.table("gardens").select(columns).eq("user_id", user_id))
+
+async def insert_garden(row: dict):
+    return await run_db(supabase.table("gardens").insert(row))
+
+async def update_garden(user_id, data: dict):
+    return await run_db(supabase.table("gardens").update(data).eq("user_id", user_id))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🚗 Table voitures_users — Collections de voitures
+# ────────────────────────────────────────────────────────────────────────────────
+async def get_voitures_user(user_id) -> dict | None:
+    return await _first(supabase.table("voitures_users").select("*").eq("user_id", str(user_id)))
+
+async def insert_voitures_user(row: dict):
+    return await run_db(supabase.table("voitures_users").insert(row))
+
+async def update_voitures_user(user_id, data: dict):
+    return await run_db(supabase.table("voitures_users").update(data).eq("user_id", str(user_id)))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Table bot_settings — Paramètres clé/valeur du bot
+# ────────────────────────────────────────────────────────────────────────────────
+async def get_setting(key: str) -> str | None:
+    row = await _first(supabase.table("bot_settings").select("value").eq("key", key))
+    return row["value"] if row else None
+
+async def set_setting(key: str, value: str):
+    return await run_db(supabase.table("bot_settings").upsert({"key": key, "value": value}))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🖼️ Table asset_urls — URLs Discord des images locales (clé : hash du contenu)
+# ────────────────────────────────────────────────────────────────────────────────
+async def get_asset_urls() -> list[dict]:
+    res = await run_db(supabase.table("asset_urls").select("*"))
+    return res.data or []
+
+async def upsert_asset_url(row: dict):
+    return await run_db(supabase.table("asset_urls").upsert(row))
@@ -9,18 +9,14 @@
 import discord
 import random
 import asyncio
-import json
-import os
+from utils.game_data import game_data
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📂 Chargement des données JSON
 # ────────────────────────────────────────────────────────────────────────────────
-DATA_JSON_PATH = os.path.join("data", "bleach_emojis.json")
-
 def load_characters():
-    """Charge les personnages depuis le fichier JSON."""
-    with open(DATA_JSON_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    """Personnages depuis le registre des données de jeu (lecture seule)."""
+    return game_data.get("bleach_emojis", ())
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔹 Fonctions des mini-jeux
@@ -0,0 +1,116 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 word_pool.py — Réserve de mots français aléatoires pour les jeux
+# Objectif : Garder un stock de mots par longueur, rechargé en tâche de fond
+#            depuis trouve-mot.fr, pour que le lancement d’une partie
+#            n’attende jamais le réseau (liste locale en secours)
+# Catégorie : Utils
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import random
+import asyncio
+from collections import deque
+from utils.http_session import get_session
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Paramètres
+# ────────────────────────────────────────────────────────────────────────────────
+API_URL = "https://trouve-mot.fr/api/random"
+API_TIMEOUT = 3        # Au-delà, on abandonne ce lot (la réserve locale prend le relais)
+BATCH_SIZE = 20        # Mots demandés par appel API
+POOL_TARGET = 15       # Taille visée de chaque réserve
+POOL_LOW = 5           # Seuil de rechargement
+WARMUP_LENGTHS = (None, 5, 6, 7, 8)   # Réserves préchargées au démarrage (None = toute longueur)
+
+# Liste locale de secours (API lente ou indisponible)
+FALLBACK_WORDS = (
+    "arbre", "avion", "balle", "bateau", "blanc", "bougie", "bureau", "cadeau",
+    "calme", "camion", "chaise", "chapeau", "chemin", "cheval", "cinema", "citron",
+    "classe", "cuisine", "dragon", "ecole", "etoile", "fenetre", "fleur", "foret",
+    "fraise", "fromage", "gateau", "girafe", "guitare", "herbe", "hiver", "jardin",
+    "journal", "lampe", "lapin", "livre", "maison", "marche", "montagne", "musique",
+    "nuage", "orange", "oiseau", "papier", "parapluie", "piano", "planete", "plage",
+    "pomme", "poisson", "prince", "radio", "riviere", "robot", "sable", "soleil",
+    "sucre", "table", "tigre", "tomate", "train", "valise", "village", "voiture",
+    "voyage", "zebre",
+)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Réserve de mots
+# ────────────────────────────────────────────────────────────────────────────────
+class WordPool:
+    """
+    Réserve de mots par longueur :
+    - get_word() est synchrone et ne touche jamais au réseau
+    - sous POOL_LOW mots, un rechargement est lancé en tâche de fond
+    - réserve vide → mot tiré de FALLBACK_WORDS
+    """
+
+    def __init__(self):
+        self._pools: dict[int | None, deque] = {}
+        self._refilling: set[int | None] = set()
+        self._tasks = set()             # Références des remplissages en cours (sinon ramassés par le GC)
+
+    # ──────────────────────────────────────────────────────────────
+    def get_word(self, length: int | None = None) -> str:
+        """Renvoie un mot (en minuscules) de la longueur demandée, immédiatement."""
+        pool = self._pools.setdefault(length, deque())
+        word = pool.popleft() if pool else self._fallback(length)
+        if len(pool) < POOL_LOW:
+            self._schedule_refill(length)
+        return word
+
+    def warmup(self, lengths=WARMUP_LENGTHS):
+        """Précharge les réserves les plus utilisées (à appeler une fois la boucle lancée)."""
+        for length in lengths:
+            self._schedule_refill(length)
+
+    @staticmethod
+    def _fallback(length: int | None) -> str:
+        candidates = [w for w in FALLBACK_WORDS if length is None or len(w) == length]
+        return random.choice(candidates or FALLBACK_WORDS)
+
+    # ──────────────────────────────────────────────────────────────
+    def _schedule_refill(self, length: int | None):
+        if length in self._refilling:
+            return
+        self._refilling.add(length)
+        task = asyncio.create_task(self._refill(length))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self, length: int | None):
+        pool = self._pools.setdefault(length, deque())
+        try:
+            while len(pool) < POOL_TARGET:
+                words = await self._fetch(length, BATCH_SIZE)
+                added = 0
+                for word in words:
+                    if length is None or len(word) == length:
+                        pool.append(word)
+                        added += 1
+                if not added:
+                    break
+        except Exception as e:
+            print(f"[WORD POOL] Rechargement impossible (longueur {length}) → {e}")
+        finally:
+            self._refilling.discard(length)
+
+    @staticmethod
+    async def _fetch(length: int | None, count: int) -> list[str]:
+        url = f"{API_URL}/{count}"
+        if length:
+            url += f"?size={length}"
+        async with get_session().get(url, timeout=API_TIMEOUT) as resp:
+            if resp.status != 200:
+                return []
+            data = await resp.json()
+        return [item["name"].lower() for item in data if isinstance(item, dict) and item.get("name")]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+word_pool = WordPool()